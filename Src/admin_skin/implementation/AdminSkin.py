@@ -28,8 +28,9 @@ class AdminSkin(Skin):
     def __init__(self):
         assert AdminSkin.__instance_acquisition_in_progress, "Use AdminSkin.instance instead"
         Skin.__init__(self)
-        self.__main_frame = AdminSkinMainFrame()
-        self.__main_frame.deactivate()
+        #   The main frame is created on first use, so that
+        #   registering the skin at startup stays cheap
+        self.__main_frame = None
 
     @staticproperty
     def instance() -> AdminSkin:
@@ -58,19 +59,29 @@ def display_name(self) -> str:
 
     @property
     def is_active(self) -> bool:
-        return self.__main_frame.winfo_exists()
+        return (self.__main_frame is not None) and self.__main_frame.winfo_exists()
 
     @property
     def dialog_parent(self) -> tk.BaseWidget:
-        return self.__main_frame
+        return self.__get_main_frame()
 
     ##########
     #   ISkin - Operations
     def activate(self) -> None:
-        self.__main_frame.activate()
-        self.__main_frame.wait_visibility()
-        self.__main_frame.focus_force()
-        self.__main_frame.request_refresh()
+        main_frame = self.__get_main_frame()
+        main_frame.activate()
+        main_frame.wait_visibility()
+        main_frame.focus_force()
+        main_frame.request_refresh()
 
     def deactivate(self) -> None:
-        self.__main_frame.deactivate()
+        if self.__main_frame is not None:
+            self.__main_frame.deactivate()
+
+    ##########
+    #   Implementation helpers
+    def __get_main_frame(self) -> AdminSkinMainFrame:
+        if self.__main_frame is None:
+            self.__main_frame = AdminSkinMainFrame()
+            self.__main_frame.deactivate()
+        return self.__main_frame
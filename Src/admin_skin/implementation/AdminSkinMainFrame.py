@@ -103,9 +103,8 @@ def __init__(self, title=AdminSkinResources.string("MainFrame.Title")):
         CurrentWorkspace.add_property_change_listener(self.__on_workspace_changed)
         Locale.add_property_change_listener(self.__on_locale_changed)
         CurrentCredentials.add_property_change_listener(self.__on_credentials_changed)
-
-        if CurrentWorkspace.get():
-            CurrentWorkspace.get().add_notification_listener(self.__on_current_workspace_modified)
+        #   Workspace notifications are handled by the views that depend
+        #   on them; nothing in the frame itself depends on them
 
         #   Done
         self.request_refresh()
@@ -247,10 +246,9 @@ def close_current_view(self) -> None:
         selected_view_tab_name = self.__views_tabbed_pane.select()
         if selected_view_tab_name != "":
             selected_view_index = self.__views_tabbed_pane.index(selected_view_tab_name)
-            item = self.__views[selected_view_index]
-            del item
-            self.__views.pop(selected_view_index)
+            view = self.__views.pop(selected_view_index)
             self.__views_tabbed_pane.forget(selected_view_index)
+            view.destroy()
 
     def close_all_views(self) -> None:
         """ Closes all views currently open in this frame. """
@@ -308,10 +306,9 @@ def __save_active_views(self) -> None:
 
     def __close_all_active_views(self) -> None:
         while len(self.__views) > 0:
-            item = self.__views[0]
-            del item
-            self.__views.pop()
+            view = self.__views.pop(0)
             self.__views_tabbed_pane.forget(0)
+            view.destroy()
 
     def __regenerate_dynamic_menus(self) -> None:
         self.__view_menu.items.clear()
@@ -377,7 +374,6 @@ def __on_workspace_changed(self, evt) -> None:
         else:
             #   Reopen all views
             self.__load_active_views()
-            CurrentWorkspace.get().add_notification_listener(self.__on_current_workspace_modified)
         self.request_refresh()
 
     def __on_credentials_changed(self, evt) -> None:
@@ -391,7 +387,6 @@ def __on_credentials_changed(self, evt) -> None:
         #else:
         #    #   Reopen all views
         #    self.__load_active_views()
-        #    CurrentWorkspace.get().add_notification_listener(self.__on_current_workspace_modified)
         self.request_refresh()
 
     def __on_locale_changed(self, evt) -> None:
@@ -401,7 +396,3 @@ def __on_locale_changed(self, evt) -> None:
         #   localized, because they are actually display names of view types
         #   e.g. self.__views_tabbed_pane.tab(tabWidget, text = 'myNewText')
         self.request_refresh()
-
-    def __on_current_workspace_modified(self, evt: WorkspaceNotification) -> None:
-        assert isinstance(evt, WorkspaceNotification)
-        self.request_refresh()
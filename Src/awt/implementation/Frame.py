@@ -1,4 +1,7 @@
 """ A top-level decorated frame. """
+#   Python standard library
+from typing import Optional
+
 #   Dependencies on other PyTT components
 from util.interface.api import *
 
@@ -11,7 +14,7 @@
 class Frame(Window):
     """ The generic top-level UI frame. """
 
-    def __init__(self, title: str = GuiRoot.tk.title()):
+    def __init__(self, title: Optional[str] = None):
         """ Constructs a top-level frame. """
         Window.__init__(self, parent=GuiRoot.tk, title=title)
 
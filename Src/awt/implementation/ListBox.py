@@ -47,8 +47,9 @@ def text(self, new_text: str) -> None:
             if self.__list_box is not None:
                 #   Must update the text of the underlying TreeNode
                 index = self.__list_box._ListBox__items.index(self)
-                tree_node = self.__list_box._ListBox__items._ListBoxItems__tree_nodes[index]
-                tree_node.text = new_text
+                tree_nodes = self.__list_box._ListBox__items._ListBoxItems__tree_nodes
+                if index < len(tree_nodes):  #   ...if there is one yet
+                    tree_nodes[index].text = new_text
 
     @property
     def tag(self) -> Any:
@@ -74,7 +75,8 @@ def __init__(self, list_box: ttk.Widget):
 
         self.__list_box = list_box
         self.__items = []
-        self.__tree_nodes = [] #   Parallel to self.__items
+        self.__tree_nodes = [] #   Parallel to (a prefix of, if paged) self.__items
+        self.__page_limit = list_box._ListBox__page_size  #   None == not paged
 
     ##########
     #   object
@@ -106,9 +108,13 @@ def add(self, item, tag: Any = None) -> ListBoxItem:
             assert new_item.list_box is None
             self.__items.append(new_item)
             new_item._ListBoxItem__list_box = self.__list_box
-            #   Create the underlying TreeView item
-            tree_view_item = self.__list_box._ListBox__tree_view.root_nodes.add(item, tag=new_item)
-            self.__tree_nodes.append(tree_view_item)
+            #   Create the underlying TreeView item (or postpone that
+            #   until the item's page is shown)
+            if (self.__page_limit is None) or (len(self.__tree_nodes) < self.__page_limit):
+                tree_view_item = self.__list_box._ListBox__tree_view.root_nodes.add(item, tag=new_item)
+                self.__tree_nodes.append(tree_view_item)
+            else:
+                self.__update_more_node()
             #   Done assing a new ListBoxItem
             return new_item
         elif isinstance(item, ListBoxItem):
@@ -132,24 +138,56 @@ def remove_at(self, index: int) -> None:
         item = self.__items[index]
         self.__items.pop(index)
         #   Destroy underlying tree view node
+        if index >= len(self.__tree_nodes):
+            self.__update_more_node()  #   Not shown yet
+            return
         tree_node = self.__tree_nodes.pop(index)
         tree_view = tree_node.tree_view
         tree_view.root_nodes.remove_at(index)
         #   Make sure all tree nodes display proper texts
-        for i in range(len(self.__items)):
+        for i in range(len(self.__tree_nodes)):
             tree_view.root_nodes[i].text = self.__items[i].text
-        
+        self.__update_more_node()
+
+    ##########
+    #   Implementation helpers
+    def __materialize(self, count: int) -> None:
+        #   Makes sure at least "count" items have their TreeView items
+        root_nodes = self.__list_box._ListBox__tree_view.root_nodes
+        self.__page_limit = max(self.__page_limit, count)
+        for item in self.__items[len(self.__tree_nodes):self.__page_limit]:
+            self.__tree_nodes.append(root_nodes.add(item.text, tag=item))
+        self.__update_more_node()
+
+    def __load_more(self) -> None:
+        self.__materialize(self.__page_limit + self.__list_box._ListBox__page_size)
+
+    def __update_more_node(self) -> None:
+        root_nodes = self.__list_box._ListBox__tree_view.root_nodes
+        root_nodes._TreeNodeCollection__update_more_node(
+            len(self.__items) - len(self.__tree_nodes), self.__load_more)
+
 class ListBox(Panel,
               ItemEventProcessorMixin):
     """ A ttk.Treeview that behaves as a list box. """
 
     ##########
     #   Construction
-    def __init__(self, master=None, **kwargs):
-        """Construct an awt ListBox widget with the parent master. """
+    def __init__(self, master=None, page_size: Optional[int] = None, **kwargs):
+        """
+            Construct an awt ListBox widget with the parent master.
+
+            @param page_size:
+                None to show all items at once, else the number of
+                items to show at a time, followed by an entry that
+                shows another page of items when selected.
+        """
+        assert (page_size is None) or (isinstance(page_size, int) and page_size > 0)
+
         Panel.__init__(self, master, **kwargs)
         ItemEventProcessorMixin.__init__(self)
 
+        self.__page_size = page_size
         self.__creating_items = True
         self.__items = ListBoxItems(self)
         self.__creating_items = False
@@ -195,6 +233,8 @@ def selected_index(self, new_index: Optional[int]) -> None:
                     self.__tree_view.selection_remove(item)
             else:
                 assert 0 <= new_index < len(self.__items)
+                if new_index >= len(self.__items._ListBoxItems__tree_nodes):
+                    self.__items._ListBoxItems__materialize(new_index + 1)
                 tree_node_id = self.__items._ListBoxItems__tree_nodes[new_index]._TreeNode__tk_node_id
                 self.__tree_view.selection_set(tree_node_id)
             new_index = self.selected_index
@@ -44,6 +44,17 @@ def request_refresh(self) -> None:
             pass
         Refreshable.__refresh_root_ids[refresh_root] = after_idle_id
 
+    def request_local_refresh(self) -> None:
+        """ Instructs this UI object that a "refresh" of just this UI
+            object and the UI widgets tree below it is required as
+            soon as practicable, returning immediately. Unlike
+            request_refresh() this does not refresh the rest of the
+            closest parent Toplevel. """
+        after_idle_id = GuiRoot.tk.after_idle(Refreshable.__do_refresh, self)
+        if self in Refreshable.__refresh_root_ids:
+            GuiRoot.tk.after_cancel(Refreshable.__refresh_root_ids[self])
+        Refreshable.__refresh_root_ids[self] = after_idle_id
+
     def perform_refresh(self) -> None:
         """ Instructs this UI object that a "refresh" is required
             right away, returning after it is done. The refresh will
@@ -2,7 +2,7 @@
 
 #   Python standard library
 from __future__ import annotations  #   MUST be 1st in a module!
-from typing import Any, Optional, List
+from typing import Any, Callable, Iterable, Optional, List
 import tkinter as tk
 import tkinter.ttk as ttk
 
@@ -14,6 +14,7 @@
 from .ItemEventProcessorMixin import ItemEventProcessorMixin
 from .Panel import Panel
 from .Scrollbar import Scrollbar
+from ..resources.AwtResources import AwtResources
 
 ##########
 #   Public entities
@@ -39,6 +40,7 @@ def __init__(self, text: str = "", image: Optional[tk.PhotoImage] = None, tag: A
         self.__parent_node = None    #   TreeNode for bound non-root nodes
         self.__child_nodes = TreeNodeCollection(self)
         self.__tree_view = None #   None for free tree nodes
+        self.__expanded = False
 
     ##########
     #   Properties
@@ -58,13 +60,27 @@ def text(self, new_text: str) -> None:
     def image(self) -> Optional[tk.PhotoImage]:
         return self.__image
 
+    @image.setter
+    def image(self, new_image: Optional[tk.PhotoImage]) -> None:
+        assert (new_image is None) or isinstance(new_image, tk.PhotoImage)
+        self.__image = new_image
+        if self.__tree_view is not None:
+            #   This is a bound TreeNode - must update the underlying ttk tree node
+            self.__tree_view.item(self.__tk_node_id, image="" if new_image is None else new_image)
+
     @property
     def tag(self) -> Any:
         return self.__tag
 
     @tag.setter
     def tag(self, new_tag: Any) -> None:
-        self.__tag = new_tag
+        if self.__tree_view is not None:
+            #   This is a bound TreeNode - must re-index it by its new tag
+            self.__tree_view._TreeView__unindex_node(self)
+            self.__tag = new_tag
+            self.__tree_view._TreeView__index_node(self)
+        else:
+            self.__tag = new_tag
 
     @property
     def parent_node(self) -> str:
@@ -78,6 +94,22 @@ def child_nodes(self) -> TreeNodeCollection:
     def tree_view(self) -> TreeView:
         return self.__tree_view
 
+    @property
+    def expanded(self) -> bool:
+        """ True if the child nodes of this node are shown, else False. """
+        return self.__expanded
+
+    @expanded.setter
+    def expanded(self, new_expanded: bool) -> None:
+        assert isinstance(new_expanded, bool)
+        if new_expanded != self.__expanded:
+            self.__expanded = new_expanded
+            if self.__tree_view is not None:
+                #   This is a bound TreeNode - must update the underlying ttk tree node
+                self.__tree_view.item(self.__tk_node_id, open=new_expanded)
+            if new_expanded:
+                self.__child_nodes._TreeNodeCollection__load_deferred()
+
 class TreeNodeCollection:
     """ An ordered collection of tree nodes. """
 
@@ -89,6 +121,14 @@ def __init__(self, owner: Any) -> None:
         self.__owner = owner
         self.__members = []
 
+        #   Lazy loading support
+        self.__deferred_load = None     #   loads the child nodes on expansion
+        self.__placeholder_tk_id = None #   Tk node shown until then
+        self.__page_limit = None        #   max number of nodes to materialize
+        self.__more_tk_id = None        #   Tk node that stands for the nodes beyond
+        self.__more_count = None        #   number of nodes it stands for
+        self.__load_more = None         #   materializes another page of nodes
+
     def __len__(self) -> int:
         return len(self.__members)
 
@@ -112,6 +152,8 @@ def add(self, item: Any, image: Optional[tk.PhotoImage] = None, tag: Any = None)
             self.__members.append(node)
             if isinstance(self.__owner, TreeNode):
                 node._TreeNode__parent_node = self.__owner
+            #   The "more" node, if any, must stay last
+            index = tk.END if self.__more_tk_id is None else len(self.__members) - 1
             #   If this tree node collection is part of a TreeView,
             #   bind the newly created node to the TreeView
             if isinstance(self.__owner, TreeNode) and (self.__owner.tree_view is not None):
@@ -120,17 +162,19 @@ def add(self, item: Any, image: Optional[tk.PhotoImage] = None, tag: Any = None)
                 node._TreeNode__tree_view = self.__owner.tree_view
                 #   Add Tk tree node to the underlying control
                 if image is None:
-                    node._TreeNode__tk_node_id = self.__owner.tree_view.insert(self.__owner._TreeNode__tk_node_id, tk.END, text=item)
+                    node._TreeNode__tk_node_id = self.__owner.tree_view.insert(self.__owner._TreeNode__tk_node_id, index, text=item)
                 else:
-                    node._TreeNode__tk_node_id = self.__owner.tree_view.insert(self.__owner._TreeNode__tk_node_id, tk.END, text=item, image=image)
+                    node._TreeNode__tk_node_id = self.__owner.tree_view.insert(self.__owner._TreeNode__tk_node_id, index, text=item, image=image)
+                self.__owner.tree_view._TreeView__index_node(node)
             elif isinstance(self.__owner, TreeView):
                 #   This is a collection of root nodes of a TreeView
                 node._TreeNode__tree_view = self.__owner
                 #   Add Tk tree node to the underlying control
                 if image is None:
-                    node._TreeNode__tk_node_id = self.__owner.insert("", tk.END, text=item)
+                    node._TreeNode__tk_node_id = self.__owner.insert("", index, text=item)
                 else:
-                    node._TreeNode__tk_node_id = self.__owner.insert("", tk.END, text=item, image=image)
+                    node._TreeNode__tk_node_id = self.__owner.insert("", index, text=item, image=image)
+                self.__owner._TreeView__index_node(node)
             #   Done assing a new TreeNode
             return node
         elif isinstance(item, TreeNode):
@@ -141,6 +185,10 @@ def add(self, item: Any, image: Optional[tk.PhotoImage] = None, tag: Any = None)
             raise NotImplementedError()
 
     def clear(self) -> None:
+        self.__deferred_load = None
+        self.__hide_placeholder()
+        self.__page_limit = None
+        self.__update_more_node(0, None)
         while len(self.__members) > 0:
             member_node = self.__members[0]
             self.__members.pop(0)
@@ -149,6 +197,7 @@ def clear(self) -> None:
             #   Remove the underlying Tk node...
             tree_view = member_node._TreeNode__tree_view
             if tree_view is not None:
+                tree_view._TreeView__unindex_node(member_node)
                 tree_view.delete(member_node._TreeNode__tk_node_id) #   member_node was bound...
                 member_node._TreeNode__tree_view = None             #   ...and is now free
                 member_node._TreeNode__tk_node_id = None
@@ -167,6 +216,7 @@ def remove_at(self, index: int) -> None:
         #   Remove the underlying Tk node...
         tree_view = member_node._TreeNode__tree_view
         if tree_view is not None:
+            tree_view._TreeView__unindex_node(member_node)
             tree_view.delete(member_node._TreeNode__tk_node_id) #   member_node was bound...
             member_node._TreeNode__tree_view = None             #   ...and is now free
             member_node._TreeNode__tk_node_id = None
@@ -178,6 +228,267 @@ def remove_at(self, index: int) -> None:
     def index(self, element):
         return self.__members.index(element)
 
+    def sync(self,
+             items: Iterable[Any],
+             text: Callable[[Any], str],
+             key: Optional[Callable[[Any], Any]] = None,
+             image: Optional[Callable[[Any], Optional[tk.PhotoImage]]] = None,
+             children: Optional[Callable[[Any], Optional[Iterable[Any]]]] = None,
+             lazy: bool = False,
+             page_size: Optional[int] = None) -> None:
+        """
+            Reconciles this collection with the specified items, so
+            that it ends up with exactly one node per item, in order,
+            tagged with that item.
+            Existing nodes are matched to items by key; only the
+            nodes whose items have disappeared are deleted, only the
+            nodes whose items are new are inserted, only the nodes
+            that are out of order are moved and only the text/image
+            that has changed is updated.
+
+            @param items:
+                The items to show, in the order to show them in.
+            @param text:
+                Returns the text of the node for an item.
+            @param key:
+                Returns the key that identifies an item across syncs;
+                None == the item itself. Keys must be hashable and
+                unique among "items".
+            @param image:
+                Returns the image of the node for an item; None ==
+                the nodes have no images.
+            @param children:
+                Returns the items to show as children of the node for
+                an item (which are then synced recursively, with the
+                same text/key/image/children functions), or None to
+                leave the node's children as they are; None == leave
+                all children as they are.
+            @param lazy:
+                True to call "children" for a node only when the node
+                is (or becomes) expanded; until then a collapsed node
+                shows a placeholder child, so that it can be expanded.
+                False to sync the whole hierarchy right away.
+            @param page_size:
+                None to create nodes for all items; else the number of
+                nodes to create at a time, followed by a node standing
+                for the remaining items that creates another page of
+                nodes when selected. Applies to child nodes as well.
+        """
+        assert (page_size is None) or (isinstance(page_size, int) and page_size > 0)
+
+        #   A sync supersedes any deferred one
+        self.__deferred_load = None
+        self.__hide_placeholder()
+        items = list(items)
+        all_items = items
+        if page_size is None:
+            self.__page_limit = None
+        else:
+            self.__page_limit = max(self.__page_limit or 0, page_size)
+            items = items[:self.__page_limit]
+        keys = items if key is None else [key(item) for item in items]
+        assert len(set(keys)) == len(keys), "TreeNodeCollection.sync() keys must be unique"
+
+        #   Delete the nodes whose items have disappeared
+        kept_keys = set(keys)
+        old_nodes = {}  #   key -> node
+        obsolete_nodes = []
+        for node in self.__members:
+            old_key = node.tag if key is None else key(node.tag)
+            if (old_key in kept_keys) and (old_key not in old_nodes):
+                old_nodes[old_key] = node
+            else:
+                obsolete_nodes.append(node)
+        if len(obsolete_nodes) > 0:
+            for node in obsolete_nodes:
+                self.__free_member(node)
+            obsolete_ids = set(id(node) for node in obsolete_nodes)
+            self.__members = [node for node in self.__members if id(node) not in obsolete_ids]
+
+        #   Leave the longest run of nodes that are already in order
+        #   in place and detach all others, so that the stable nodes
+        #   remain in target order...
+        targets = [old_nodes.get(k, None) for k in keys]
+        positions = { id(node): i for (i, node) in enumerate(self.__members) }
+        stable_positions = TreeNodeCollection.__longest_increasing_run(
+                [positions[id(node)] for node in targets if node is not None])
+        (tree_view, tk_parent_id) = self.__binding()
+        if len(stable_positions) < len(self.__members):
+            if tree_view is not None:
+                for (i, node) in enumerate(self.__members):
+                    if i not in stable_positions:
+                        tree_view.detach(node._TreeNode__tk_node_id)
+            self.__members = [node for (i, node) in enumerate(self.__members) if i in stable_positions]
+
+        #   ...then insert (or re-attach) the other nodes, in order
+        for (index, (item, node)) in enumerate(zip(items, targets)):
+            node_text = text(item)
+            node_image = None if image is None else image(item)
+            if node is None:
+                node = self.__insert_member(index, node_text, node_image, item)
+            else:
+                if (index >= len(self.__members)) or (self.__members[index] is not node):
+                    self.__members.insert(index, node)
+                    if tree_view is not None:
+                        tree_view.move(node._TreeNode__tk_node_id, tk_parent_id, index)
+                if node.text != node_text:
+                    node.text = node_text
+                if (image is not None) and (node.image is not node_image):
+                    node.image = node_image
+                if node.tag is not item:
+                    node.tag = item
+            if children is not None:
+                if lazy and not node.expanded:
+                    node.child_nodes.__defer(lambda item=item: children(item),
+                                             text, key, image, children, lazy, page_size)
+                else:
+                    child_items = children(item)
+                    if child_items is not None:
+                        node.child_nodes.sync(child_items, text, key, image, children, lazy, page_size)
+
+        #   Stand in for the items beyond the current page, if any
+        def load_more() -> None:
+            self.__page_limit += page_size
+            self.sync(all_items, text, key, image, children, lazy, page_size)
+        self.__update_more_node(len(all_items) - len(items), load_more)
+
+    ##########
+    #   Implementation helpers
+    def __defer(self,
+                load_items: Callable[[], Optional[Iterable[Any]]],
+                *sync_args) -> None:
+        #   Postpones the sync of this collection until its owner
+        #   node is expanded; existing (stale) nodes are kept until then
+        def load() -> None:
+            items = load_items()
+            if items is not None:
+                self.sync(items, *sync_args)
+        self.__deferred_load = load
+        if len(self.__members) == 0:
+            self.__show_placeholder()
+
+    def __load_deferred(self) -> None:
+        load = self.__deferred_load
+        if load is not None:
+            self.__deferred_load = None
+            self.__hide_placeholder()
+            load()
+
+    def __show_placeholder(self) -> None:
+        (tree_view, tk_parent_id) = self.__binding()
+        if (tree_view is not None) and (self.__placeholder_tk_id is None):
+            self.__placeholder_tk_id = tree_view.insert(
+                tk_parent_id, tk.END, text=AwtResources.string("TreeView.PlaceholderNode.Text"))
+
+    def __hide_placeholder(self) -> None:
+        if self.__placeholder_tk_id is not None:
+            (tree_view, tk_parent_id) = self.__binding()
+            if tree_view is not None:
+                tree_view.delete(self.__placeholder_tk_id)
+            self.__placeholder_tk_id = None
+
+    def __update_more_node(self, count: int, load_more: Optional[Callable[[], None]]) -> None:
+        #   Shows (or hides, if count == 0) the node standing for
+        #   "count" more nodes, which calls "load_more" when selected.
+        #   Members are always inserted before it, so it stays last.
+        (tree_view, tk_parent_id) = self.__binding()
+        if (count == 0) or (tree_view is None):
+            if (self.__more_tk_id is not None) and (tree_view is not None):
+                tree_view.delete(self.__more_tk_id)
+                del tree_view._TreeView__more_nodes[self.__more_tk_id]
+            self.__more_tk_id = None
+            self.__more_count = None
+            self.__load_more = None
+            return
+        self.__load_more = load_more
+        if self.__more_tk_id is None:
+            self.__more_tk_id = tree_view.insert(
+                tk_parent_id, tk.END, text=AwtResources.string("TreeView.MoreNodes.Text", count))
+            tree_view._TreeView__more_nodes[self.__more_tk_id] = self
+        elif self.__more_count != count:
+            tree_view.item(self.__more_tk_id, text=AwtResources.string("TreeView.MoreNodes.Text", count))
+        self.__more_count = count
+
+    def __binding(self) -> tuple:
+        #   (TreeView, Tk id of the parent node) if this collection
+        #   is bound to a TreeView, else (None, None)
+        if isinstance(self.__owner, TreeView):
+            return (self.__owner, "")
+        if self.__owner.tree_view is not None:
+            return (self.__owner.tree_view, self.__owner._TreeNode__tk_node_id)
+        return (None, None)
+
+    def __insert_member(self, index: int, text: str, image: Optional[tk.PhotoImage], tag: Any) -> TreeNode:
+        node = TreeNode(text, image, tag)
+        self.__members.insert(index, node)
+        if isinstance(self.__owner, TreeNode):
+            node._TreeNode__parent_node = self.__owner
+        (tree_view, tk_parent_id) = self.__binding()
+        if tree_view is not None:
+            node._TreeNode__tree_view = tree_view
+            if image is None:
+                node._TreeNode__tk_node_id = tree_view.insert(tk_parent_id, index, text=text)
+            else:
+                node._TreeNode__tk_node_id = tree_view.insert(tk_parent_id, index, text=text, image=image)
+            tree_view._TreeView__index_node(node)
+        return node
+
+    def __free_member(self, node: TreeNode) -> None:
+        #   Deleting a Tk node deletes its whole subtree, so a
+        #   single Tk call is enough; the caller removes "node"
+        #   from self.__members
+        tree_view = node._TreeNode__tree_view
+        if tree_view is not None:
+            tree_view.delete(node._TreeNode__tk_node_id)
+        TreeNodeCollection.__free_subtree(node)
+        node._TreeNode__parent_node = None
+
+    @staticmethod
+    def __free_subtree(node: TreeNode) -> None:
+        #   The Tk nodes are already gone
+        child_nodes = node.child_nodes
+        for child_node in child_nodes.__members:
+            TreeNodeCollection.__free_subtree(child_node)
+        tree_view = node._TreeNode__tree_view
+        if tree_view is not None:
+            tree_view._TreeView__unindex_node(node)
+        if child_nodes.__more_tk_id is not None:
+            del tree_view._TreeView__more_nodes[child_nodes.__more_tk_id]
+        child_nodes.__placeholder_tk_id = None
+        child_nodes.__more_tk_id = None
+        child_nodes.__more_count = None
+        child_nodes.__load_more = None
+        node._TreeNode__tree_view = None
+        node._TreeNode__tk_node_id = None
+        node._TreeNode__expanded = False
+
+    @staticmethod
+    def __longest_increasing_run(values: list[int]) -> set[int]:
+        #   The values forming a longest strictly increasing
+        #   subsequence of "values" (patience sorting, O(n log n))
+        tail_indices = []   #   [k] -> index of the smallest tail of a run of length k+1
+        predecessors = [-1] * len(values)
+        for (i, value) in enumerate(values):
+            (low, high) = (0, len(tail_indices))
+            while low < high:
+                middle = (low + high) // 2
+                if values[tail_indices[middle]] < value:
+                    low = middle + 1
+                else:
+                    high = middle
+            if low > 0:
+                predecessors[i] = tail_indices[low - 1]
+            if low == len(tail_indices):
+                tail_indices.append(i)
+            else:
+                tail_indices[low] = i
+        result = set()
+        i = tail_indices[-1] if len(tail_indices) > 0 else -1
+        while i >= 0:
+            result.add(values[i])
+            i = predecessors[i]
+        return result
+
 class TreeView(ttk.Treeview,
                BaseWidgetMixin,
                ItemEventProcessorMixin):
@@ -188,6 +499,11 @@ class TreeView(ttk.Treeview,
     def __init__(self, parent: tk.BaseWidget, **kwargs):
         """Construct an awt TreeView widget with the parent master. """
         self.__root_nodes = TreeNodeCollection(self)
+        self.__more_nodes = dict()  #   Tk node ID -> TreeNodeCollection it stands for
+        #   Indexes of all bound nodes, kept up to date as nodes
+        #   are bound, freed or re-tagged
+        self.__nodes_by_tk_id = dict()  #   Tk node ID -> TreeNode
+        self.__nodes_by_tag = dict()    #   tag -> list of TreeNodes, most recently tagged last
 
         #TODO use on a per-item bases
         #import tkinter.font as tkFont
@@ -236,6 +552,8 @@ def __init__(self, parent: tk.BaseWidget, **kwargs):
 
         #   Set up event handlers
         self.bind("<<TreeviewSelect>>", self.__on_tk_treeview_selected)
+        self.bind("<<TreeviewOpen>>", self.__on_tk_treeview_open)
+        self.bind("<<TreeviewClose>>", self.__on_tk_treeview_close)
 
     ##########
     #   Properties
@@ -247,7 +565,7 @@ def root_nodes(self) -> TreeNodeCollection:
     def current_node(self) -> Optional[TreeNode]:
         """ The currently highlighted tree node, None if there isn't one. """
         focus = self.selection()
-        return self.__find_tree_node_by_tk_id(self.__root_nodes, focus[0]) if len(focus) > 0 else None
+        return self.__nodes_by_tk_id.get(focus[0], None) if len(focus) > 0 else None
 
     @current_node.setter
     def current_node(self, node: Optional[TreeNode]) -> None:
@@ -262,21 +580,79 @@ def current_node(self, node: Optional[TreeNode]) -> None:
         self.selection_set(node._TreeNode__tk_node_id)
         self.see(node._TreeNode__tk_node_id)
 
+    ##########
+    #   Operations
+    def find_by_tag(self, tag: Any) -> Optional[TreeNode]:
+        """
+            Finds the node of this TreeView with the specified tag.
+
+            @param tag:
+                The tag to look for; None and unhashable tags are
+                never found.
+            @return:
+                The node with the specified tag (the most recently
+                tagged one if there are several), None if there is none.
+        """
+        if tag is None:
+            return None
+        try:
+            nodes = self.__nodes_by_tag.get(tag, None)
+        except TypeError:
+            return None #   Unhashable tag
+        return nodes[-1] if nodes else None
+
     ##########
     #   Implementation heipers
-    def __find_tree_node_by_tk_id(self, nodes: TreeNodeCollection, tk_node_id: str) -> Optional[TreeNode]:
-        for node in nodes:
-            if node._TreeNode__tk_node_id == tk_node_id:
-                return node
-            found = self.__find_tree_node_by_tk_id(node.child_nodes, tk_node_id)
-            if found is not None:
-                return found
-        return None
+    def __index_node(self, node: TreeNode) -> None:
+        self.__nodes_by_tk_id[node._TreeNode__tk_node_id] = node
+        tag = node.tag
+        if tag is not None:
+            try:
+                self.__nodes_by_tag.setdefault(tag, []).append(node)
+            except TypeError:
+                pass    #   Unhashable tag - cannot be found by tag
+
+    def __unindex_node(self, node: TreeNode) -> None:
+        self.__nodes_by_tk_id.pop(node._TreeNode__tk_node_id, None)
+        tag = node.tag
+        if tag is not None:
+            try:
+                nodes = self.__nodes_by_tag.get(tag, None)
+            except TypeError:
+                return  #   Unhashable tag - was never indexed
+            if nodes is not None:
+                for i in range(len(nodes) - 1, -1, -1):
+                    if nodes[i] is node:
+                        del nodes[i]
+                        break
+                if not nodes:
+                    del self.__nodes_by_tag[tag]
 
     ##########
     #   Tk event handlers
+    def __on_tk_treeview_open(self, evt: tk.Event):
+        assert isinstance(evt, tk.Event)
+        node = self.__nodes_by_tk_id.get(self.focus(), None)
+        if (node is not None) and not node.expanded:
+            node._TreeNode__expanded = True #   Tk opens the node itself
+            node.child_nodes._TreeNodeCollection__load_deferred()
+
+    def __on_tk_treeview_close(self, evt: tk.Event):
+        assert isinstance(evt, tk.Event)
+        node = self.__nodes_by_tk_id.get(self.focus(), None)
+        if node is not None:
+            node._TreeNode__expanded = False
+
     def __on_tk_treeview_selected(self, evt: tk.Event):
         assert isinstance(evt, tk.Event)
+        selection = self.selection()
+        if (len(selection) > 0) and (selection[0] in self.__more_nodes):
+            #   Materialize another page of nodes and select the first of them
+            nodes = self.__more_nodes[selection[0]]
+            index = len(nodes)
+            nodes._TreeNodeCollection__load_more()
+            self.current_node = nodes[index] if index < len(nodes) else None
+            return
         if self.current_node is not None:
             self.process_item_event(ItemEvent(self, ItemEventType.ITEM_SELECTED))
         else:
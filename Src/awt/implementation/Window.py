@@ -30,10 +30,12 @@ class Window(tkinter.Toplevel, BaseWidgetMixin):
     ##########
     #   Construction
     def __init__(self, parent: Optional[tkinter.BaseWidget] = None,
-                 title: str = GuiRoot.tk.title()):
+                 title: Optional[str] = None):
         """ Constructs a top-level window. """
         if parent is None:
             parent = GuiRoot.tk
+        if title is None:
+            title = GuiRoot.tk.title()
         tkinter.Toplevel.__init__(self, parent)
         BaseWidgetMixin.__init__(self)
 
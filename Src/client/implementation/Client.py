@@ -13,6 +13,10 @@
     root_directory = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
     print("Starting PyTT from", root_directory)
     sys.path.insert(0, root_directory)  #   TODO THIS HAPPENS TWICE - HERE AND FROM PLUGINLOADER
+    #   Profiling must start before the first PyTT import to see it
+    if "--profile-startup" in sys.argv:
+        from pnp.implementation.ImportProfiler import ImportProfiler
+        ImportProfiler.start()
 
 from gui.interface.api import *
 from awt.interface.api import *
@@ -27,6 +31,7 @@
 from client.implementation.CommandLine import CommandLine
 from client.implementation.GeneralStartupPreferences import GeneralStartupPreferences
 from client.implementation.GeneralAppearancePreferences import GeneralAppearancePreferences
+from client.implementation.StartupPhaseTimer import StartupPhaseTimer
 
 @final
 class SplashScreen: #   TODO move to a separate file
@@ -150,7 +155,7 @@ def load_plugins():
         splash_start_time = datetime.now(UTC)
         SplashScreen.show()
 
-    PluginManager.load_plugins(root_directory)
+    PluginManager.load_plugins(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
     if CommandLine.show_splash_screen:
         while True:
@@ -160,6 +165,11 @@ def load_plugins():
                 SplashScreen.hide()
                 break
     
+def select_ui_locale():
+    ui_locale = GeneralAppearancePreferences.instance.ui_locale.value
+    if ui_locale in LocalizableSubsystem.all_supported_locales():
+        Locale.default = ui_locale
+
 def perform_initial_login():
     login = ""
     if GeneralStartupPreferences.instance.use_last_login.value:
@@ -219,27 +229,43 @@ def open_last_used_workspace():
     print('System locale is', Locale.default)
     print("Main thread is " + str(threading.current_thread().ident))
 
-    CommandLine.parse()
+    startup_timer = StartupPhaseTimer()
+    with startup_timer.measure("Parse command line"):
+        CommandLine.parse()
 
     #   Load plugins (showing splash screen if necessary)
-    load_plugins()
-    
+    with startup_timer.measure("Load plugins"):
+        load_plugins()
+
     #   Now that all plugins are loaded, the Preferences
-    #   tree is complete, so we can load all Preferences        
-    Preferences.load()
-    ui_locale = GeneralAppearancePreferences.instance.ui_locale.value
-    if ui_locale in LocalizableSubsystem.all_supported_locales():
-        Locale.default = ui_locale
+    #   tree is complete, so we can load all Preferences
+    with startup_timer.measure("Load preferences"):
+        Preferences.load()
+    with startup_timer.measure("Select UI locale"):
+        select_ui_locale()
+
+    #   Startup imports are done - the rest happens on first use
+    if CommandLine.profile_startup:
+        ImportProfiler.stop()
+        ImportProfiler.report()
 
     #   Perform initial login; use last successful login if necessary
-    perform_initial_login()
+    with startup_timer.measure("Initial login"):
+        perform_initial_login()
 
     #   Do we need to re-load the last used workspace?
-    if GeneralStartupPreferences.instance.restore_workspace.value:
-        open_last_used_workspace()
+    with startup_timer.measure("Open last used workspace"):
+        if GeneralStartupPreferences.instance.restore_workspace.value:
+            open_last_used_workspace()
 
     #   Select the initial skin TODO properly - use active skin from previous session!
-    ActiveSkin.set(SkinRegistry.default_skin)
+    with startup_timer.measure("Activate skin"):
+        ActiveSkin.set(SkinRegistry.default_skin)
+    with startup_timer.measure("First refresh"):
+        GuiRoot.tk.update()
+
+    if CommandLine.profile_startup:
+        startup_timer.report()
 
     #   Go!
     GuiRoot.tk.mainloop()
@@ -0,0 +1,139 @@
+""" PyTT Client cold-start benchmark.
+
+    Replays the PyTT client startup sequence non-interactively in
+    a fresh Python process per run and reports the wall time and
+    the net number of allocated memory blocks of each startup phase:
+
+        python ColdStartBenchmark.py [--runs N] [--gui]
+
+    The interactive login is replaced by fixed credentials, and the
+    "last used workspace" is a scratch SQLite workspace created for
+    the benchmark. Without --gui no tkinter root is ever created, so
+    the benchmark runs headless; the phases that need a display
+    (skin activation and the first refresh) are then skipped.
+"""
+
+#   Python standard library
+from typing import Optional
+import sys
+import os.path
+import json
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+
+#   Dependencies on other PyTT components.
+#   IMPORTANT: We need to adjust the sys.path to find them!
+if __name__ == "__main__":
+    root_directory = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    sys.path.insert(0, root_directory)
+
+##########
+#   Implementation helpers
+_PHASES_MARKER = "@@startup-phases "
+_LOGIN = "admin"
+_PASSWORD = "admin"
+
+def _create_workspace(directory: str) -> str:
+    from sqlite_db.interface.api import SqliteDatabaseAddress
+    from workspace.interface.api import WorkspaceAddress
+
+    workspace_path = os.path.join(directory, "benchmark.pytt")
+    workspace_address = WorkspaceAddress(SqliteDatabaseAddress(workspace_path))
+    workspace = workspace_address.workspace_type.create_workspace(
+        workspace_address, "Administrator", _LOGIN, _PASSWORD)
+    workspace.close()
+    return workspace_path
+
+def _run_startup(workspace_path: str, gui: bool) -> None:
+    #   Runs in the child process; mirrors the PyTT entry point
+    #   in Client.py, phase by phase
+    from client.implementation.StartupPhaseTimer import StartupPhaseTimer
+
+    startup_timer = StartupPhaseTimer()
+    with startup_timer.measure("Import client"):
+        import client.implementation.Client as Client
+        from client.implementation.CommandLine import CommandLine
+        from gui.interface.api import ActiveSkin, SkinRegistry, CurrentCredentials, CurrentWorkspace
+        from awt.interface.api import GuiRoot
+        from sqlite_db.interface.api import SqliteDatabaseAddress
+        from workspace.interface.api import Credentials, WorkspaceAddress
+        from util.interface.api import Preferences
+
+    sys.argv = [sys.argv[0], "--nosplash"]
+    with startup_timer.measure("Parse command line"):
+        CommandLine.parse()
+    with startup_timer.measure("Load plugins"):
+        Client.load_plugins()
+    with startup_timer.measure("Load preferences"):
+        Preferences.load()
+    with startup_timer.measure("Select UI locale"):
+        Client.select_ui_locale()
+    with startup_timer.measure("Initial login"):
+        CurrentCredentials.set(Credentials(_LOGIN, _PASSWORD))
+    with startup_timer.measure("Open last used workspace"):
+        workspace_address = WorkspaceAddress(SqliteDatabaseAddress(workspace_path))
+        workspace = workspace_address.workspace_type.open_workspace(workspace_address)
+        workspace.login(credentials=CurrentCredentials.get())
+        CurrentWorkspace.set(workspace)
+    if gui:
+        with startup_timer.measure("Activate skin"):
+            ActiveSkin.set(SkinRegistry.default_skin)
+        with startup_timer.measure("First refresh"):
+            GuiRoot.tk.update()
+        ActiveSkin.set(None)
+        GuiRoot.tk.destroy()
+    CurrentWorkspace.set(None)
+    workspace.close()
+
+    print(_PHASES_MARKER + json.dumps([(p.name, p.wall_time, p.allocated_blocks)
+                                       for p in startup_timer.phases]))
+
+def _run_child(workspace_path: str, gui: bool) -> list:
+    args = [sys.executable, os.path.abspath(__file__), "--child", workspace_path]
+    if gui:
+        args.append("--gui")
+    start_time = time.perf_counter()
+    completed = subprocess.run(args, capture_output=True, text=True)
+    process_time = time.perf_counter() - start_time
+    for line in completed.stdout.splitlines():
+        if line.startswith(_PHASES_MARKER):
+            phases = json.loads(line[len(_PHASES_MARKER):])
+            return phases + [("Process total", process_time, 0)]
+    raise RuntimeError("Benchmark run failed:\n" + completed.stdout + completed.stderr)
+
+def _report(runs: list) -> None:
+    phase_names = [p[0] for p in runs[0]]
+    print("Cold start: %d run(s)" % len(runs))
+    print("%10s %10s %10s %14s  %s" % ("median ms", "min ms", "max ms", "median blocks", "phase"))
+    for (i, phase_name) in enumerate(phase_names):
+        wall_times = [run[i][1] * 1000 for run in runs]
+        allocated_blocks = [run[i][2] for run in runs]
+        print("%10.1f %10.1f %10.1f %14d  %s" %
+              (statistics.median(wall_times), min(wall_times), max(wall_times),
+               statistics.median(allocated_blocks), phase_name))
+
+def _option_value(name: str, default: Optional[str]) -> Optional[str]:
+    if name in sys.argv:
+        i = sys.argv.index(name)
+        if i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+    return default
+
+##########
+#   Benchmark entry point
+if __name__ == "__main__":
+    gui = "--gui" in sys.argv
+    if "--child" in sys.argv:
+        _run_startup(_option_value("--child", None), gui)
+        sys.exit(0)
+
+    runs = int(_option_value("--runs", "5"))
+    scratch_directory = tempfile.mkdtemp(prefix="pytt-benchmark-")
+    try:
+        workspace_path = _create_workspace(scratch_directory)
+        _report([_run_child(workspace_path, gui) for _ in range(runs)])
+    finally:
+        shutil.rmtree(scratch_directory, ignore_errors=True)
@@ -14,6 +14,7 @@ class CommandLine:
     ##########
     #   Resources requiring lazy load
     __show_splash_screen = True
+    __profile_startup = False
 
     ##########
     #   Construction - disable (this is an utility class)
@@ -28,6 +29,12 @@ def show_splash_screen() -> bool:
             startup, False if not. """
         return CommandLine.__show_splash_screen
 
+    @staticproperty
+    def profile_startup() -> bool:
+        """ True if the time spent importing each module during
+            startup should be reported, False if not. """
+        return CommandLine.__profile_startup
+
     ##########
     #   Operations
     @staticmethod
@@ -41,6 +48,9 @@ def parse()-> None:
             elif sys.argv[i] == "--nosplash":
                 CommandLine.__show_splash_screen = False
                 i += 1
+            elif sys.argv[i] == "--profile-startup":
+                CommandLine.__profile_startup = True
+                i += 1
             else:
                 print("Invalid command line option ignored:", sys.argv[i])
                 i += 1
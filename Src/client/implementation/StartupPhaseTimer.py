@@ -0,0 +1,141 @@
+""" Measures the phases of the PyTT client startup. """
+
+#   Python standard library
+from __future__ import annotations  #   MUST be 1st in a module!
+from typing import final, Optional, TextIO
+import sys
+import time
+
+#   Dependencies on other PyTT components
+from util.interface.api import *
+
+##########
+#   Public entities
+@final
+class StartupPhase:
+    """ The measurements of a single completed startup phase. """
+
+    ##########
+    #   Construction
+    def __init__(self, name: str, wall_time: float, allocated_blocks: int):
+        """
+            Constructs the startup phase record.
+
+            @param name:
+                The user-readable name of the phase.
+            @param wall_time:
+                The wall time the phase took, in seconds.
+            @param allocated_blocks:
+                The net number of memory blocks the phase has left
+                allocated (negative if it has freed more than it
+                allocated).
+        """
+        assert isinstance(name, str)
+        assert isinstance(wall_time, float)
+        assert isinstance(allocated_blocks, int)
+
+        self.__name = name
+        self.__wall_time = wall_time
+        self.__allocated_blocks = allocated_blocks
+
+    ##########
+    #   object
+    def __repr__(self) -> str:
+        return ("StartupPhase(" + repr(self.__name) +
+                ", wall_time=" + repr(self.__wall_time) +
+                ", allocated_blocks=" + repr(self.__allocated_blocks) + ")")
+
+    ##########
+    #   Properties
+    @property
+    def name(self) -> str:
+        """ The user-readable name of this phase. """
+        return self.__name
+
+    @property
+    def wall_time(self) -> float:
+        """ The wall time this phase took, in seconds. """
+        return self.__wall_time
+
+    @property
+    def allocated_blocks(self) -> int:
+        """ The net number of memory blocks this phase has left
+            allocated (negative if it has freed more than it
+            allocated). """
+        return self.__allocated_blocks
+
+@final
+class StartupPhaseTimer:
+    """
+        Records the wall time and the net number of allocated
+        memory blocks of each phase of the client startup.
+        Phases are measured one at a time, in order:
+            with timer.measure("Load plugins"):
+                load_plugins()
+    """
+
+    ##########
+    #   Construction
+    def __init__(self):
+        """ Constructs a startup phase timer with no phases recorded. """
+        self.__phases = []
+        self.__current_phase_name = None
+        self.__current_phase_start_time = None
+        self.__current_phase_start_blocks = None
+
+    ##########
+    #   Properties
+    @property
+    def phases(self) -> list[StartupPhase]:
+        """ The phases measured so far, in order. """
+        return list(self.__phases)
+
+    @property
+    def total_wall_time(self) -> float:
+        """ The total wall time of all phases measured so far, in seconds. """
+        return sum(p.wall_time for p in self.__phases)
+
+    ##########
+    #   Operations
+    def measure(self, name: str) -> StartupPhaseTimer:
+        """
+            Starts measuring a startup phase; the phase ends when
+            the "with" statement this is used in exits.
+
+            @param name:
+                The user-readable name of the phase.
+            @return:
+                The context manager that ends the phase on exit.
+        """
+        assert isinstance(name, str)
+        assert self.__current_phase_name is None, "Startup phases cannot be nested"
+
+        self.__current_phase_name = name
+        return self
+
+    def report(self, file: Optional[TextIO] = None) -> None:
+        """
+            Prints the phases measured so far, in order.
+
+            @param file:
+                The file to print to; None == sys.stdout.
+        """
+        file = sys.stdout if file is None else file
+        print("Startup phases: %.1f ms total" % (self.total_wall_time * 1000), file=file)
+        print("%10s %12s  %s" % ("ms", "alloc. blocks", "phase"), file=file)
+        for phase in self.__phases:
+            print("%10.1f %12d  %s" % (phase.wall_time * 1000, phase.allocated_blocks, phase.name), file=file)
+
+    ##########
+    #   Context manager
+    def __enter__(self) -> StartupPhaseTimer:
+        assert self.__current_phase_name is not None, "Use StartupPhaseTimer.measure()"
+        self.__current_phase_start_blocks = sys.getallocatedblocks()
+        self.__current_phase_start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        wall_time = time.perf_counter() - self.__current_phase_start_time
+        allocated_blocks = sys.getallocatedblocks() - self.__current_phase_start_blocks
+        self.__phases.append(StartupPhase(self.__current_phase_name, wall_time, allocated_blocks))
+        self.__current_phase_name = None
@@ -17,6 +17,8 @@
 class Account(DatabaseObject):
     """ A user Account in a database. """
 
+    __slots__ = ()
+
     ##########
     #   Constants
     TYPE_NAME = "Account"
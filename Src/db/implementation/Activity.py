@@ -18,6 +18,8 @@
 class Activity(DatabaseObject):
     """ An Activity in a database. """
 
+    __slots__ = ()
+
     ##########
     #   Constants
     NAME_PROPERTY_NAME = "name"
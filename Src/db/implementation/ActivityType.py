@@ -17,6 +17,8 @@
 class ActivityType(DatabaseObject):
     """ An Activity type in a database. """
 
+    __slots__ = ()
+
     ##########
     #   Constants
     TYPE_NAME = "ActivityType"
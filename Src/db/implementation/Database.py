@@ -2,10 +2,11 @@
 
 #   Python standard library
 from __future__ import annotations  #   MUST be 1st in a module!
-from typing import List, Union
+from typing import Any, List, Union, Iterable
 from abc import ABC, abstractmethod, abstractproperty
 from threading import Lock, Semaphore
 from queue import Empty, Queue
+import time
 
 #   Dependencies on other PyTT components
 from util.interface.api import *
@@ -13,7 +14,7 @@
 #   Internal dependencies on modules within the same component
 from .DatabaseAddress import DatabaseAddress
 from .DatabaseType import DatabaseType
-from .Exceptions import DatabaseAccessDeniedError
+from .Exceptions import DatabaseAccessDeniedError, DatabaseError
 from .Notifications import *
 from .Validator import *
 
@@ -30,9 +31,9 @@ def __init__(self):
 
         #   TODO make list elements WEAK references to actual listeners
         self.__notification_listeners = []
+        self.__notification_batch_listeners = []
         self.__notification_listeners_guard = Lock()
 
-        self.__notification_thread_stop_requested = False
         self.__notification_thread = Thread(target=self.__run_notification_thread, args=[])
         self.__notification_thread.daemon = True
         self.__notification_thread.start()
@@ -73,6 +74,14 @@ def validator(self) -> Validator:
         """ The Validator used by this database. """
         raise NotImplementedError()
 
+    @property
+    def supports_background_reads(self) -> bool:
+        """ True if this database can be read from threads other
+            than the one that has opened it, concurrently with
+            that thread, else False. The default implementation
+            returns False. """
+        return False
+
     ##########
     #   Operations (general)
     @abstractmethod
@@ -84,7 +93,9 @@ def close(self) -> None:
                 If an error occurs; the Database object is
                 still "closed" before the exception is thrown.
         """
-        self.__notification_thread_stop_requested = True # stops notification thread eventually
+        #   Wakes up the notification thread, which stops after
+        #   processing all notifications enqueued so far
+        self.__queued_notifications.put(Database.__STOP_NOTIFICATION_THREAD)
 
     ##########
     #   Operations (associations)
@@ -179,6 +190,47 @@ def root_public_tasks(self) -> Set[PublicTask]:
         """
         raise NotImplementedError()
 
+    ##########
+    #   Operations (queries)
+    def count_enabled_administrators(self, excluding: Optional[Union[User, Account]] = None) -> int:
+        """
+            Counts the enabled Accounts with ADMINISTRATOR capabilities
+            that belong to enabled Users - i.e. the accounts through
+            which the database can still be administered.
+            The default implementation walks all users and their
+            accounts; databases that can answer this with a single
+            query should override it.
+
+            @param excluding:
+                None to count all such accounts; a User to count only
+                accounts of other users; an Account to count only
+                other accounts (e.g. to check whether disabling that
+                User or Account would leave the database with no
+                enabled administrator).
+            @return:
+                The number of such accounts.
+            @raise DatabaseError:
+                If an error occurs.
+        """
+        from .User import User
+        from .Account import Account
+        from .Capabilities import Capabilities
+
+        assert (excluding is None) or isinstance(excluding, (User, Account))
+
+        try:
+            result = 0
+            for user in self.users:
+                if (user == excluding) or not user.enabled:
+                    continue
+                for account in user.accounts:
+                    if ((account != excluding) and account.enabled and
+                        account.capabilities.contains_all(Capabilities.ADMINISTRATOR)):
+                        result += 1
+            return result
+        except Exception as ex:
+            raise DatabaseError.wrap(ex)
+
     ##########
     #   Operations (life cycle)
     @abstractmethod
@@ -308,6 +360,67 @@ def create_public_task(self,
         """
         raise NotImplementedError()
 
+    def create_many(self,
+                    type_name: str,
+                    property_sets: Iterable[dict[str, Any]]) -> list[DatabaseObject]:
+        """
+            Creates many new objects of the same type at once.
+            The default implementation simply calls the relevant
+            create_XXX() once per new object and is NOT atomic: if
+            one of these calls fails, the objects created before it
+            remain. Databases that can do better (e.g. by inserting
+            all new objects within a single transaction, so that
+            either all of them are created or none are) should
+            override it.
+
+            @param type_name:
+                The TYPE_NAME of the objects to create; one of
+                User, ActivityType, PublicActivity or PublicTask.
+            @param property_sets:
+                One dict per object to create, mapping the
+                keyword arguments of the relevant create_XXX()
+                method (e.g. "real_name" for create_user()) to
+                their values; omitted keywords take their defaults.
+            @return:
+                The newly created objects, in the order of the
+                "property_sets".
+            @raise DatabaseError:
+                If an error occurs.
+        """
+        from .User import User
+        from .ActivityType import ActivityType
+        from .PublicActivity import PublicActivity
+        from .PublicTask import PublicTask
+
+        create = { User.TYPE_NAME: self.create_user,
+                   ActivityType.TYPE_NAME: self.create_activity_type,
+                   PublicActivity.TYPE_NAME: self.create_public_activity,
+                   PublicTask.TYPE_NAME: self.create_public_task }.get(type_name, None)
+        assert create is not None, "Cannot create many objects of type " + str(type_name)
+
+        try:
+            return [create(**property_set) for property_set in property_sets]
+        except Exception as ex:
+            raise DatabaseError.wrap(ex)
+
+    ##########
+    #   Operations (caching)
+    def prefetch(self, objects: Iterable[DatabaseObject]) -> None:
+        """
+            Fetches properties of all specified objects in as few
+            database round trips as practicable, so that subsequent
+            property accesses on them can be served from cache.
+            This is a hint only; the default implementation does
+            nothing. Objects that do not belong to this Database
+            are ignored.
+
+            @param objects:
+                The objects whose properties to prefetch.
+            @raise DatabaseError:
+                If an error occurs.
+        """
+        pass
+
     ##########
     #   Operations (notifications)
     def add_notification_listener(self, l: Union[DatabaseNotificationListener, DatabaseNotificationHandler]) -> None:
@@ -347,12 +460,45 @@ def notification_listeners(self) -> list[Union[DatabaseNotificationListener, Dat
         with self.__notification_listeners_guard:
             return self.__notification_listeners.copy()
 
+    def add_notification_batch_listener(self, l: DatabaseNotificationBatchListener) -> None:
+        """ Registers the specified listener to be notified once
+            per batch of database notifications processed together
+            (instead of once per notification).
+            A given listener can be registered at most once;
+            subsequent attempts to register the same listener
+            again will have no effect.
+
+            IMPORTANT: This method is thread-safe."""
+        assert isinstance(l, Callable) and len(signature(l).parameters) == 1
+        with self.__notification_listeners_guard:
+            if l not in self.__notification_batch_listeners:
+                self.__notification_batch_listeners.append(l)
+
+    def remove_notification_batch_listener(self, l: DatabaseNotificationBatchListener) -> None:
+        """ Un-registers the specified listener to no longer be
+            notified when a batch of database notifications is
+            processed.
+            A given listener can be un-registered at most once;
+            subsequent attempts to un-register the same listener
+            again will have no effect.
+
+            IMPORTANT: This method is thread-safe."""
+        assert isinstance(l, Callable) and len(signature(l).parameters) == 1
+        with self.__notification_listeners_guard:
+            if l in self.__notification_batch_listeners:
+                self.__notification_batch_listeners.remove(l)
+
+    @property
+    def notification_batch_listeners(self) -> list[DatabaseNotificationBatchListener]:
+        """ The list of all notification batch listeners registered so far.
+
+            IMPORTANT: This property is thread-safe. """
+        with self.__notification_listeners_guard:
+            return self.__notification_batch_listeners.copy()
+
     def process_notification(self, n: DatabaseNotification) -> bool:
         """
             Called to process a DatabaseNotification.
-            IMPORTANT: The hidden notification thread running behind
-            a Database will call this method when notifications are
-            enqueued and must then be processed.
 
             IMPORTANT: This method is thread-safe.
 
@@ -362,20 +508,47 @@ def process_notification(self, n: DatabaseNotification) -> bool:
                 The notification to process.
         """
         assert isinstance(n, DatabaseNotification)
-        for l in self.notification_listeners:
-            try:
-                if isinstance(l, DatabaseNotificationHandler):
-                    if isinstance(n, DatabaseObjectCreatedNotification):
-                        l.on_database_object_created(n)
-                    elif isinstance(n, DatabaseObjectDestroyedNotification):
-                        l.on_database_object_destroyed(n)
-                    elif isinstance(n, DatabaseObjectModifiedNotification):
-                        l.on_database_object_modified(n)
+        self.process_notification_batch(DatabaseNotificationBatch(self, [n]))
+
+    def process_notification_batch(self, batch: DatabaseNotificationBatch) -> None:
+        """
+            Called to process a DatabaseNotificationBatch - each
+            notification in it is delivered to all notification
+            listeners, then the batch as a whole is delivered to
+            all notification batch listeners.
+            IMPORTANT: The hidden notification thread running behind
+            a Database will call this method when notifications are
+            enqueued and must then be processed.
+
+            IMPORTANT: This method is thread-safe.
+
+            @param batch:
+                The batch of notifications to process.
+        """
+        assert isinstance(batch, DatabaseNotificationBatch)
+        with self.__notification_listeners_guard:
+            listeners = self.__notification_listeners.copy()
+            batch_listeners = self.__notification_batch_listeners.copy()
+        for n in batch:
+            for l in listeners:
+                try:
+                    if isinstance(l, DatabaseNotificationHandler):
+                        if isinstance(n, DatabaseObjectCreatedNotification):
+                            l.on_database_object_created(n)
+                        elif isinstance(n, DatabaseObjectDestroyedNotification):
+                            l.on_database_object_destroyed(n)
+                        elif isinstance(n, DatabaseObjectModifiedNotification):
+                            l.on_database_object_modified(n)
+                        else:
+                            raise NotImplementedError()
+                        l.on_property_change(n)
                     else:
-                        raise NotImplementedError()
-                    l.on_property_change(n)
-                else:
-                    l(n)
+                        l(n)
+                except Exception as ex:
+                    pass    #   TODO log the exception
+        for l in batch_listeners:
+            try:
+                l(batch)
             except Exception as ex:
                 pass    #   TODO log the exception
 
@@ -390,15 +563,72 @@ def enqueue_notification(self, n: DatabaseNotification) -> None:
                 The notification to enqueue.
         """
         assert isinstance(n, DatabaseNotification)
+        assert not isinstance(n, DatabaseNotificationBatch)
         self.__queued_notifications.put(n)
 
+    def enqueue_notification_batch(self, notifications: Iterable[DatabaseNotification]) -> None:
+        """
+            Enqueues several DatabaseNotifications (e.g. ones caused
+            by a single bulk operation) to be processed as soon as
+            practicable by the hidden notification thread, all in
+            the same DatabaseNotificationBatch regardless of its size.
+
+            IMPORTANT: This method is thread-safe.
+
+            @param notifications:
+                The notifications to enqueue.
+        """
+        notifications = list(notifications)
+        assert all(isinstance(n, DatabaseNotification) and
+                   not isinstance(n, DatabaseNotificationBatch)
+                   for n in notifications)
+        if len(notifications) > 0:
+            self.__queued_notifications.put(DatabaseNotificationBatch(self, notifications))
+
     ##########
     #   Threads
+    __STOP_NOTIFICATION_THREAD = object()   #   enqueued by close()
+
+    __NOTIFICATION_BATCH_WINDOW_SEC = 0.05
+    __NOTIFICATION_BATCH_MAX_SIZE = 1000
+
     def __run_notification_thread(self) -> None:
-        while not self.__notification_thread_stop_requested:
-            try:
-                n = self.__queued_notifications.get(block=True, timeout=1)  # wait in 1s chunks
-                assert isinstance(n, DatabaseNotification)
-                self.process_notification(n)
-            except Empty:   #   queue is still empty after a wait chunk
-                pass
+        stop_requested = False
+        while not stop_requested:
+            #   Sleep until there's something to do...
+            n = self.__queued_notifications.get(block=True)
+            if n is Database.__STOP_NOTIFICATION_THREAD:
+                break
+            #   ...then gather whatever else arrives shortly after
+            #   (e.g. during a cascading destroy) into the same batch
+            batch = [n]
+            batch_deadline = time.monotonic() + Database.__NOTIFICATION_BATCH_WINDOW_SEC
+            while len(batch) < Database.__NOTIFICATION_BATCH_MAX_SIZE:
+                try:
+                    n = self.__queued_notifications.get(
+                        block=True, timeout=max(0, batch_deadline - time.monotonic()))
+                except Empty:   #   batch window has elapsed
+                    break
+                if n is Database.__STOP_NOTIFICATION_THREAD:
+                    stop_requested = True
+                    break
+                batch.append(n)
+            #   Batches enqueued as a whole are never split
+            batch = [m for n in batch
+                       for m in (n.notifications if isinstance(n, DatabaseNotificationBatch) else [n])]
+            self.process_notification_batch(
+                DatabaseNotificationBatch(self, self.__coalesce_notifications(batch)))
+
+    ##########
+    #   Implementation helpers
+    def __coalesce_notifications(self, notifications: list[DatabaseNotification]) -> list[DatabaseNotification]:
+        result = []
+        modified_keys = set()   #   (object, property_name)
+        for n in notifications:
+            if isinstance(n, DatabaseObjectModifiedNotification):
+                key = (n.object, n.property_name)
+                if key in modified_keys:
+                    continue    #   Same change has already been reported in this batch
+                modified_keys.add(key)
+            result.append(n)
+        return result
@@ -18,6 +18,10 @@
 class DatabaseObject(ABCWithConstants):
     """ A common base class for all objects residing in a database. """
 
+    #   No instance attributes, so that concrete subclasses can be
+    #   slot-based
+    __slots__ = ()
+
     ##########
     #   object
     def __str__(self) -> str:
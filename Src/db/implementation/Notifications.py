@@ -2,7 +2,7 @@
 
 #   Python standard library
 from __future__ import annotations  #   MUST be 1st in a module!
-from typing import Any, TypeAlias, Callable
+from typing import Any, TypeAlias, Callable, Iterator
 from threading import Thread
 
 ##########
@@ -95,12 +95,51 @@ def property_name(self) -> str:
         """ The name of the object's property that has been modified. """
         return self.__property_name
 
+class DatabaseNotificationBatch(DatabaseNotification):
+    """ A batch of DatabaseNotifications that have been processed
+        together, in the order they were enqueued. Duplicate
+        DatabaseObjectModifiedNotifications (same object, same
+        property) are coalesced, so a batch contains at most one
+        of these per object and property. """
+
+    ##########
+    #   Construction
+    def __init__(self, database: "Database", notifications: list[DatabaseNotification]):
+        DatabaseNotification.__init__(self, database)
+
+        assert isinstance(notifications, list)
+        assert all(isinstance(n, DatabaseNotification) and
+                   not isinstance(n, DatabaseNotificationBatch) for n in notifications)
+
+        self.__notifications = tuple(notifications)
+
+    ##########
+    #   object
+    def __len__(self) -> int:
+        return len(self.__notifications)
+
+    def __iter__(self) -> Iterator[DatabaseNotification]:
+        return iter(self.__notifications)
+
+    ##########
+    #   Properties
+    @property
+    def notifications(self) -> tuple[DatabaseNotification]:
+        """ The notifications in this batch, in order. """
+        return self.__notifications
+
 DatabaseNotificationListener: TypeAlias = Callable[[DatabaseNotification], None]
 """ A signature of a listener to database notifications - a function
     or a bound method.
     IMPORTANT: will normally be called on a hidden "notification"
     thread running behind theDatabase. """
 
+DatabaseNotificationBatchListener: TypeAlias = Callable[[DatabaseNotificationBatch], None]
+""" A signature of a listener to batches of database notifications -
+    a function or a bound method.
+    IMPORTANT: will normally be called on a hidden "notification"
+    thread running behind theDatabase. """
+
 class DatabaseNotificationHandler:
 
     ##########
@@ -17,6 +17,8 @@
 class PrivateActivity(Activity):
     """ A private activity in a database. """
 
+    __slots__ = ()
+
     ##########
     #   Constants
     TYPE_NAME = "PrivateActivity"
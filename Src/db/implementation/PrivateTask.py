@@ -19,6 +19,8 @@
 class PrivateTask(PrivateActivity, Task):
     """ A private task in a database. """
 
+    __slots__ = ()
+
     ##########
     #   Constants
     TYPE_NAME = "PrivateTask"
@@ -16,6 +16,8 @@
 class PublicActivity(Activity):
     """ A public activity in a database. """
 
+    __slots__ = ()
+
     ##########
     #   Constants
     TYPE_NAME = "PublicActivity"
@@ -19,6 +19,8 @@
 class PublicTask(PublicActivity, Task):
     """ A public task in a database. """
 
+    __slots__ = ()
+
     ##########
     #   Constants
     TYPE_NAME = "PublicTask"
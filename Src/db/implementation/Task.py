@@ -17,6 +17,8 @@
 class Task(Activity):
     """ A Task in a database. """
 
+    __slots__ = ()
+
     ##########
     #   Constants
     NAME_PROPERTY_NAME = Activity.NAME_PROPERTY_NAME
@@ -19,6 +19,8 @@
 class User(DatabaseObject):
     """ A User in a database. """
 
+    __slots__ = ()
+
     ##########
     #   Constants
     TYPE_NAME = "User"
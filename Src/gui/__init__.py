@@ -50,3 +50,16 @@ def supported_locales(self) -> set[Locale]:
 ##########
 #   Instantiate
 GuiSubsystem.instance
+
+##########
+#   Plugin manifest - the modules to import on startup (view types
+#   register themselves when imported); the rest of this component
+#   is imported on first use
+PLUGIN_ENTRY_POINTS = [
+    "gui.implementation.views.UsersViewType",
+    "gui.implementation.views.ActivityTypesViewType",
+    "gui.implementation.views.PublicActivitiesViewType",
+    "gui.implementation.views.PrivateActivitiesViewType",
+    "gui.implementation.views.PublicTasksViewType",
+    "gui.implementation.views.PrivateTasksViewType",
+]
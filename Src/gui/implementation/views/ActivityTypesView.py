@@ -91,12 +91,26 @@ def refresh(self) -> None:
         self.__modify_activity_type_button.enabled = can_manage_activity_types and (selected_activity_type is not None)
         self.__destroy_activity_type_button.enabled = can_manage_activity_types and (selected_activity_type is not None)
 
+    ##########
+    #   tk.BaseWidget
+    def destroy(self) -> None:
+        CurrentWorkspace.remove_property_change_listener(self.__on_workspace_changed)
+        Locale.remove_property_change_listener(self.__on_locale_changed)
+        View.destroy(self)
+
     ##########
     #   Properties
     @property
     def type(self) -> ViewType:
         return ActivityTypesViewType.instance
 
+    @property
+    def dependencies(self) -> Optional[dict[type, Optional[set[str]]]]:
+        return {
+                BusinessActivityType: { BusinessActivityType.NAME_PROPERTY_NAME },
+                BusinessAccount: { BusinessAccount.CAPABILITIES_PROPERTY_NAME },
+            }
+
     @property
     def selected_object(self) -> Optional[BusinessObject]:
         node = self.__activity_types_tree_view.current_node
@@ -108,10 +122,9 @@ def selected_object(self, obj: Optional[BusinessObject]) -> None:
         self.perform_refresh()
         if obj is None:
             return
-        for activity_type_node in self.__activity_types_tree_view.root_nodes:
-            if activity_type_node.tag == obj:
-                self.__activity_types_tree_view.current_node = activity_type_node
-                return
+        node = self.__activity_types_tree_view.find_by_tag(obj)
+        if node is not None:
+            self.__activity_types_tree_view.current_node = node
 
     @property
     def selected_activity_type(self) -> Optional[BusinessActivityType]:
@@ -65,8 +65,6 @@ def __init__(self, parent: tk.BaseWidget) -> None:
         CurrentWorkspace.add_property_change_listener(self.__on_workspace_changed)
         Locale.add_property_change_listener(self.__on_locale_changed)
         #   TODO current credentials change
-        if CurrentWorkspace.get():
-            CurrentWorkspace.get().add_notification_listener(self.__on_current_workspace_modified)
 
     ##########
     #   Refreshable
@@ -104,12 +102,29 @@ def refresh(self) -> None:
         self.__modify_private_activity_button.enabled = (can_manage_private_activities or mpa) and (selected_private_activity is not None)
         self.__destroy_private_activity_button.enabled = (can_manage_private_activities or dpa) and (selected_private_activity is not None)
 
+    ##########
+    #   tk.BaseWidget
+    def destroy(self) -> None:
+        CurrentWorkspace.remove_property_change_listener(self.__on_workspace_changed)
+        Locale.remove_property_change_listener(self.__on_locale_changed)
+        View.destroy(self)
+
     ##########
     #   Properties
     @property
     def type(self) -> ViewType:
         return PrivateActivitiesViewType.instance
 
+    @property
+    def dependencies(self) -> Optional[dict[type, Optional[set[str]]]]:
+        return {
+                BusinessUser: { BusinessUser.ENABLED_PROPERTY_NAME,
+                                BusinessUser.REAL_NAME_PROPERTY_NAME,
+                                BusinessUser.PRIVATE_ACTIVITIES_ASSOCIATION_NAME },
+                BusinessPrivateActivity: { BusinessPrivateActivity.NAME_PROPERTY_NAME },
+                BusinessAccount: { BusinessAccount.CAPABILITIES_PROPERTY_NAME },
+            }
+
     @property
     def selected_object(self) -> Optional[BusinessObject]:
         node = self.__private_activities_tree_view.current_node
@@ -121,14 +136,9 @@ def selected_object(self, obj: Optional[BusinessObject]) -> None:
         self.perform_refresh()
         if obj is None:
             return
-        for user_node in self.__private_activities_tree_view.root_nodes:
-            if user_node.tag == obj:
-                self.__private_activities_tree_view.current_node = user_node
-                return
-            for private_activity_node in user_node.child_nodes:
-                if private_activity_node.tag == obj:
-                    self.__private_activities_tree_view.current_node = private_activity_node
-                    return
+        node = self.__private_activities_tree_view.find_by_tag(obj)
+        if node is not None:
+            self.__private_activities_tree_view.current_node = node
 
     @property
     def selected_user(self) -> Optional[BusinessUser]:
@@ -231,8 +241,6 @@ def __refresh_private_activity_nodes(self, user_node: TreeNode, user: BusinessUs
     #   Event listeners
     def __on_workspace_changed(self, evt) -> None:
         assert isinstance(evt, PropertyChangeEvent)
-        if CurrentWorkspace.get() is not None:
-            CurrentWorkspace.get().add_notification_listener(self.__on_current_workspace_modified)
         self.request_refresh()
 
     def __on_locale_changed(self, evt) -> None:
@@ -240,10 +248,6 @@ def __on_locale_changed(self, evt) -> None:
         self.__apply_default_locale()
         self.request_refresh()
 
-    def __on_current_workspace_modified(self, evt: WorkspaceNotification) -> None:
-        assert isinstance(evt, WorkspaceNotification)
-        self.request_refresh()
-
     def __private_activities_tree_view_listener(self, evt: ItemEvent) -> None:
         assert isinstance(evt, ItemEvent)
         self.request_refresh()
@@ -120,12 +120,32 @@ def refresh(self) -> None:
         self.__modify_private_task_button.enabled = can_manage_private_tasks and (selected_private_task is not None)
         self.__destroy_private_task_button.enabled = can_manage_private_tasks and (selected_private_task is not None)
 
+    ##########
+    #   tk.BaseWidget
+    def destroy(self) -> None:
+        CurrentWorkspace.remove_property_change_listener(self.__on_workspace_changed)
+        Locale.remove_property_change_listener(self.__on_locale_changed)
+        View.destroy(self)
+
     ##########
     #   Properties
     @property
     def type(self) -> ViewType:
         return PrivateTasksViewType.instance
 
+    @property
+    def dependencies(self) -> Optional[dict[type, Optional[set[str]]]]:
+        return {
+                BusinessUser: { BusinessUser.ENABLED_PROPERTY_NAME,
+                                BusinessUser.REAL_NAME_PROPERTY_NAME,
+                                BusinessUser.PRIVATE_ACTIVITIES_ASSOCIATION_NAME },
+                BusinessPrivateTask: { BusinessPrivateTask.NAME_PROPERTY_NAME,
+                                       BusinessPrivateTask.COMPLETED_PROPERTY_NAME,
+                                       BusinessPrivateTask.PARENT_ASSOCIATION_NAME,
+                                       BusinessPrivateTask.CHILDREN_ASSOCIATION_NAME },
+                BusinessAccount: { BusinessAccount.CAPABILITIES_PROPERTY_NAME },
+            }
+
     @property
     def selected_object(self) -> Optional[BusinessObject]:
         node = self.__private_tasks_tree_view.current_node
@@ -137,7 +157,9 @@ def selected_object(self, obj: Optional[BusinessObject]) -> None:
         self.perform_refresh()
         if obj is None:
             return
-        self.__set_selected_object(self.__private_tasks_tree_view.root_nodes, obj)
+        node = self.__private_tasks_tree_view.find_by_tag(obj)
+        if node is not None:
+            self.__private_tasks_tree_view.current_node = node
 
     @property
     def selected_private_task(self) -> Optional[BusinessPrivateTask]:
@@ -244,15 +266,6 @@ def __refresh_private_task_nodes(self,
                 #   In case child tasks acquisition fails TODO log ?
                 pass
 
-    def __set_selected_object(self, tree_nodes: TreeNodeCollection, obj: Optional[BusinessObject]) -> bool:
-        for tree_node in tree_nodes:
-            if tree_node.tag == obj:
-                tree_node.tree_view.current_node = tree_node
-                return True
-            if self.__set_selected_object(tree_node.child_nodes, obj):
-                return True
-        return False
-
     ##########
     #   Event handlers
     def __on_workspace_changed(self, evt) -> None:
@@ -91,12 +91,26 @@ def refresh(self) -> None:
         self.__modify_public_activity_button.enabled = can_manage_public_activities and (selected_public_activity is not None)
         self.__destroy_public_activity_button.enabled = can_manage_public_activities and (selected_public_activity is not None)
 
+    ##########
+    #   tk.BaseWidget
+    def destroy(self) -> None:
+        CurrentWorkspace.remove_property_change_listener(self.__on_workspace_changed)
+        Locale.remove_property_change_listener(self.__on_locale_changed)
+        View.destroy(self)
+
     ##########
     #   Properties
     @property
     def type(self) -> ViewType:
         return PublicActivitiesViewType.instance
 
+    @property
+    def dependencies(self) -> Optional[dict[type, Optional[set[str]]]]:
+        return {
+                BusinessPublicActivity: { BusinessPublicActivity.NAME_PROPERTY_NAME },
+                BusinessAccount: { BusinessAccount.CAPABILITIES_PROPERTY_NAME },
+            }
+
     @property
     def selected_object(self) -> Optional[BusinessObject]:
         node = self.__public_activities_tree_view.current_node
@@ -108,10 +122,9 @@ def selected_object(self, obj: Optional[BusinessObject]) -> None:
         self.perform_refresh()
         if obj is None:
             return
-        for public_activity_node in self.__public_activities_tree_view.root_nodes:
-            if public_activity_node.tag == obj:
-                self.__public_activities_tree_view.current_node = public_activity_node
-                return
+        node = self.__public_activities_tree_view.find_by_tag(obj)
+        if node is not None:
+            self.__public_activities_tree_view.current_node = node
 
     @property
     def selected_public_activity(self) -> Optional[BusinessPublicActivity]:
@@ -65,6 +65,7 @@ def __init__(self, parent: tk.BaseWidget) -> None:
 
         #   Set up event handlers
         self.__public_tasks_tree_view.add_item_listener(self.__public_tasks_tree_view_listener)
+        self.__selected_object_after_refresh = None
 
         self.__create_public_task_button.add_action_listener(self.__on_create_public_task_button_clicked)
         self.__modify_public_task_button.add_action_listener(self.__on_modify_public_task_button_clicked)
@@ -79,44 +80,15 @@ def __init__(self, parent: tk.BaseWidget) -> None:
     ##########
     #   Refreshable
     def refresh(self) -> None:
-        credentials = CurrentCredentials.get()
-        workspace = CurrentWorkspace.get()
-        if (credentials is None) or (workspace is None):
-            self.__public_tasks_tree_view.root_nodes.clear()
-            self.__create_public_task_button.enabled = False
-            self.__modify_public_task_button.enabled = False
-            self.__destroy_public_task_button.enabled = False
-            return
-
-        workspace = CurrentWorkspace.get()
-        credentials = CurrentCredentials.get()
-        if (workspace is None) or (credentials is None):
-            self.__public_tasks_tree_view.root_nodes.clear()
-        else:
-            selected_object = self.selected_object
-            try:
-                self.__refresh_public_task_nodes(workspace,
-                                                 credentials,
-                                                 self.__public_tasks_tree_view.root_nodes,
-                                                 workspace.get_root_public_tasks(credentials))
-            except Exception:
-                #   In case root tasks acquisition fails TODO log ?
-                pass
-        if self.selected_object != selected_object:
-            #   Try to keep the selection
-            self.selected_object = selected_object
-
-        self.__hide_completed_tasks_check_box.checked = PublicTasksViewSettings.hide_completed_tasks
-
-        selected_public_task = self.selected_public_task
-        try:
-            can_manage_public_tasks = workspace.can_manage_public_tasks(credentials)
-        except Exception:
-            can_manage_public_tasks = False
+        #   The data is gathered on a worker thread
+        self._refresh_in_background(self.__expanded_public_tasks(self.__public_tasks_tree_view.root_nodes))
 
-        self.__create_public_task_button.enabled = can_manage_public_tasks
-        self.__modify_public_task_button.enabled = can_manage_public_tasks and (selected_public_task is not None)
-        self.__destroy_public_task_button.enabled = can_manage_public_tasks and (selected_public_task is not None)
+    ##########
+    #   tk.BaseWidget
+    def destroy(self) -> None:
+        CurrentWorkspace.remove_property_change_listener(self.__on_workspace_changed)
+        Locale.remove_property_change_listener(self.__on_locale_changed)
+        View.destroy(self)
 
     ##########
     #   Properties
@@ -124,6 +96,16 @@ def refresh(self) -> None:
     def type(self) -> ViewType:
         return PublicTasksViewType.instance
 
+    @property
+    def dependencies(self) -> Optional[dict[type, Optional[set[str]]]]:
+        return {
+                BusinessPublicTask: { BusinessPublicTask.NAME_PROPERTY_NAME,
+                                      BusinessPublicTask.COMPLETED_PROPERTY_NAME,
+                                      BusinessPublicTask.PARENT_ASSOCIATION_NAME,
+                                      BusinessPublicTask.CHILDREN_ASSOCIATION_NAME },
+                BusinessAccount: { BusinessAccount.CAPABILITIES_PROPERTY_NAME },
+            }
+
     @property
     def selected_object(self) -> Optional[BusinessObject]:
         node = self.__public_tasks_tree_view.current_node
@@ -135,7 +117,12 @@ def selected_object(self, obj: Optional[BusinessObject]) -> None:
         self.perform_refresh()
         if obj is None:
             return
-        self.__set_selected_object(self.__public_tasks_tree_view.root_nodes, obj)
+        node = self.__public_tasks_tree_view.find_by_tag(obj)
+        if node is not None:
+            self.__public_tasks_tree_view.current_node = node
+        else:
+            #   Not loaded yet - select it once the refresh is applied
+            self.__selected_object_after_refresh = obj
 
     @property
     def selected_public_task(self) -> Optional[BusinessPublicTask]:
@@ -155,58 +142,162 @@ def __apply_default_locale(self) -> None:
         self.__destroy_public_task_button.text = GuiResources.string("PublicTasksViewEditor.DestroyPublicTaskButton.Text")
         self.__hide_completed_tasks_check_box.text = GuiResources.string("PublicTasksView.HideCompletedTasksCheckBox.Text")
 
-    def __refresh_public_task_nodes(self,
-                                    workspace: Workspace,
-                                    credentials: Credentials,
-                                    tree_nodes: TreeNodeCollection,
-                                    public_tasks: Set[BusinessPublicTask]) -> None:
-        #   Prepare the list of accessible BusinessPublicTasks sorted by name
+    def _load_snapshot(self, workspace: Workspace, credentials: Credentials,
+                       expanded_public_tasks: set[BusinessPublicTask]) -> _PublicTasksViewSnapshot:
+        #   Load the children of expanded tasks only; the rest are
+        #   loaded on the UI thread if and when their nodes are expanded
+        root_public_tasks = self.__sorted_public_tasks(workspace.get_root_public_tasks(credentials), credentials)
+        child_public_tasks = dict()
+        node_texts = dict()
+        pending_public_tasks = list(root_public_tasks)
+        while len(pending_public_tasks) > 0:
+            public_task = pending_public_tasks.pop()
+            node_texts[public_task] = self.__node_text(public_task, credentials)
+            if public_task in expanded_public_tasks:
+                children = self.__sorted_child_public_tasks(public_task, credentials)
+                if children is not None:
+                    child_public_tasks[public_task] = tuple(children)
+                    pending_public_tasks.extend(children)
+        try:
+            can_manage_public_tasks = workspace.can_manage_public_tasks(credentials)
+        except Exception:
+            can_manage_public_tasks = False
+        return _PublicTasksViewSnapshot(root_public_tasks, child_public_tasks, node_texts,
+                                        can_manage_public_tasks)
+
+    def _apply_snapshot(self, snapshot: Optional[_PublicTasksViewSnapshot]) -> None:
+        credentials = CurrentCredentials.get()
+        if (snapshot is None) or (credentials is None):
+            self.__public_tasks_tree_view.root_nodes.clear()
+            self.__create_public_task_button.enabled = False
+            self.__modify_public_task_button.enabled = False
+            self.__destroy_public_task_button.enabled = False
+            return
+
+        selected_object = self.selected_object
+        if self.__selected_object_after_refresh is not None:
+            selected_object = self.__selected_object_after_refresh
+            self.__selected_object_after_refresh = None
+
+        self.__sync_public_task_nodes(self.__public_tasks_tree_view.root_nodes,
+                                      snapshot.root_public_tasks, credentials, snapshot)
+
+        #   Try to keep the selection
+        if self.selected_object != selected_object:
+            node = self.__public_tasks_tree_view.find_by_tag(selected_object)
+            if node is not None:
+                self.__public_tasks_tree_view.current_node = node
+
+        self.__hide_completed_tasks_check_box.checked = PublicTasksViewSettings.hide_completed_tasks
+
+        selected_public_task = self.selected_public_task
+        can_manage_public_tasks = snapshot.can_manage_public_tasks
+
+        self.__create_public_task_button.enabled = can_manage_public_tasks
+        self.__modify_public_task_button.enabled = can_manage_public_tasks and (selected_public_task is not None)
+        self.__destroy_public_task_button.enabled = can_manage_public_tasks and (selected_public_task is not None)
+
+    def _refresh_modified_objects(self, modifications: dict[BusinessObject, set[str]]) -> None:
+        credentials = CurrentCredentials.get()
+        structural_property_names = { BusinessAccount.CAPABILITIES_PROPERTY_NAME,
+                                      BusinessPublicTask.PARENT_ASSOCIATION_NAME,
+                                      BusinessPublicTask.CHILDREN_ASSOCIATION_NAME }
+        if PublicTasksViewSettings.hide_completed_tasks:
+            structural_property_names.add(BusinessPublicTask.COMPLETED_PROPERTY_NAME)
+        if ((credentials is None) or
+            any(not structural_property_names.isdisjoint(names) for names in modifications.values())):
+            #   Nodes may need to appear or disappear - refresh everything
+            View._refresh_modified_objects(self, modifications)
+            return
+        selected_object = self.selected_object
+        for (public_task, property_names) in modifications.items():
+            node = self.__public_tasks_tree_view.find_by_tag(public_task)
+            if node is None:
+                continue
+            node_text = self.__node_text(public_task, credentials)
+            if node.text != node_text:
+                node.text = node_text
+            if BusinessPublicTask.NAME_PROPERTY_NAME in property_names:
+                #   The node may now be out of order among its siblings,
+                #   some of which may not have been loaded yet
+                if node.parent_node is None:
+                    siblings = self.__public_tasks_tree_view.root_nodes
+                    sibling_tasks = self.__sorted_public_tasks(
+                        CurrentWorkspace.get().get_root_public_tasks(credentials), credentials)
+                else:
+                    siblings = node.parent_node.child_nodes
+                    sibling_tasks = self.__sorted_child_public_tasks(node.parent_node.tag, credentials)
+                if sibling_tasks is not None:
+                    self.__sync_public_task_nodes(siblings, sibling_tasks, credentials)
+        #   Try to keep the selection
+        if self.selected_object != selected_object:
+            self.selected_object = selected_object
+
+    __PAGE_SIZE = 200
+    """ The number of sibling task nodes created at a time. """
+
+    def __sync_public_task_nodes(self,
+                                 tree_nodes: TreeNodeCollection,
+                                 public_tasks: Iterable[BusinessPublicTask],
+                                 credentials: Credentials,
+                                 snapshot: Optional[_PublicTasksViewSnapshot] = None) -> None:
+        #   Child tasks are only queried when their parent node is
+        #   expanded, unless the snapshot already has them
+        def text(public_task: BusinessPublicTask) -> str:
+            node_text = None if snapshot is None else snapshot.node_text(public_task)
+            return self.__node_text(public_task, credentials) if node_text is None else node_text
+        def children(public_task: BusinessPublicTask) -> Optional[Iterable[BusinessPublicTask]]:
+            child_public_tasks = None if snapshot is None else snapshot.child_public_tasks(public_task)
+            if child_public_tasks is None:
+                return self.__sorted_child_public_tasks(public_task, credentials)
+            return child_public_tasks
+        tree_nodes.sync(
+            public_tasks,
+            text=text,
+            image=lambda t: t.small_image,
+            children=children,
+            lazy=True,
+            page_size=PublicTasksView.__PAGE_SIZE)
+
+    def __expanded_public_tasks(self, tree_nodes: TreeNodeCollection) -> set[BusinessPublicTask]:
+        #   Only expanded nodes have loaded child nodes worth visiting
+        result = set()
+        for tree_node in tree_nodes:
+            if tree_node.expanded:
+                result.add(tree_node.tag)
+                result.update(self.__expanded_public_tasks(tree_node.child_nodes))
+        return result
+
+    def __sorted_public_tasks(self,
+                              public_tasks: Set[BusinessPublicTask],
+                              credentials: Credentials) -> list[BusinessPublicTask]:
+        #   Prepare the list of accessible BusinessPublicTasks sorted
+        #   by name. Also called on a worker thread - no UI here!
         public_tasks = list(public_tasks)
         if PublicTasksViewSettings.hide_completed_tasks:
             public_tasks = list(filter(lambda t: (not t.is_completed(credentials)), public_tasks))
             
         try:
             public_tasks.sort(key=lambda u: u.display_name)
-        except Exception as ex:
-            ErrorDialog.show(self, ex)
+        except Exception:
             pass    #   TODO log the exception
-        #   Make sure the tree_nodes contains a proper number of nodes...
-        while len(tree_nodes) > len(public_tasks):
-            #   Too many nodes in the public tasks list
-            tree_nodes.remove_at(len(tree_nodes) - 1)
-        while len(tree_nodes) < len(public_tasks):
-            #   Too few nodes in the public tasks list
-            public_task = public_tasks[len(tree_nodes)]
-            tree_nodes.add(public_task.display_name,
-                           image=public_task.small_image,
-                           tag=public_task)
-        #   ...each representing a proper BusinessPublicTask
-        for i in range(len(public_tasks)):
-            try:
-                task_completed_prefix = '[completed] ' if public_tasks[i].is_completed(credentials) else ""
-            except Exception as ex:
-                task_completed_prefix = ""
-            public_task_node = tree_nodes[i]
-            public_task_node.text = task_completed_prefix + public_tasks[i].display_name
-            public_task_node.tag = public_tasks[i]
-            #   ...and having proper children
-            try:
-                self.__refresh_public_task_nodes(workspace,
-                                                 credentials,
-                                                 public_task_node.child_nodes,
-                                                 public_tasks[i].get_children(credentials))
-            except Exception:
-                #   In case child tasks acquisition fails TODO log ?
-                pass
-
-    def __set_selected_object(self, tree_nodes: TreeNodeCollection, obj: Optional[BusinessObject]) -> bool:
-        for tree_node in tree_nodes:
-            if tree_node.tag == obj:
-                tree_node.tree_view.current_node = tree_node
-                return True
-            if self.__set_selected_object(tree_node.child_nodes, obj):
-                return True
-        return False
+        return public_tasks
+
+    def __sorted_child_public_tasks(self,
+                                    public_task: BusinessPublicTask,
+                                    credentials: Credentials) -> Optional[list[BusinessPublicTask]]:
+        try:
+            return self.__sorted_public_tasks(public_task.get_children(credentials), credentials)
+        except Exception:
+            #   In case child tasks acquisition fails TODO log ?
+            return None #   leave the child nodes as they are
+
+    def __node_text(self, public_task: BusinessPublicTask, credentials: Credentials) -> str:
+        try:
+            task_completed_prefix = '[completed] ' if public_task.is_completed(credentials) else ""
+        except Exception as ex:
+            task_completed_prefix = ""
+        return task_completed_prefix + public_task.display_name
 
     ##########
     #   Event handlers
@@ -263,3 +354,36 @@ def __on_destroy_public_task_button_clicked(self, evt: ActionEvent) -> None:
             self.request_refresh()
         except Exception as ex: #   error in DestroyPublicTaskDialog constructor
             ErrorDialog.show(None, ex)
+
+##########
+#   Implementation helpers
+class _PublicTasksViewSnapshot:
+    """ The data shown by a PublicTasksView, gathered on a worker thread. """
+
+    def __init__(self,
+                 root_public_tasks: list[BusinessPublicTask],
+                 child_public_tasks: dict[BusinessPublicTask, tuple[BusinessPublicTask, ...]],
+                 node_texts: dict[BusinessPublicTask, str],
+                 can_manage_public_tasks: bool) -> None:
+        self.__root_public_tasks = tuple(root_public_tasks)
+        self.__child_public_tasks = child_public_tasks
+        self.__node_texts = node_texts
+        self.__can_manage_public_tasks = can_manage_public_tasks
+
+    @property
+    def root_public_tasks(self) -> tuple[BusinessPublicTask, ...]:
+        """ The accessible root tasks, sorted by name. """
+        return self.__root_public_tasks
+
+    @property
+    def can_manage_public_tasks(self) -> bool:
+        return self.__can_manage_public_tasks
+
+    def child_public_tasks(self, public_task: BusinessPublicTask) -> Optional[tuple[BusinessPublicTask, ...]]:
+        """ The accessible children of the task, sorted by name;
+            None if they are not in this snapshot. """
+        return self.__child_public_tasks.get(public_task, None)
+
+    def node_text(self, public_task: BusinessPublicTask) -> Optional[str]:
+        """ The node text of the task; None if it is not in this snapshot. """
+        return self.__node_texts.get(public_task, None)
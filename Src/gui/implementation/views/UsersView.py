@@ -78,6 +78,7 @@ def __init__(self, parent: tk.BaseWidget) -> None:
 
         #   Set up event handlers
         self.__users_tree_view.add_item_listener(self.__users_tree_view_listener)
+        self.__selected_object_after_refresh = None
 
         self.__create_user_button.add_action_listener(self.__on_create_user_button_clicked)
         self.__modify_user_button.add_action_listener(self.__on_modify_user_button_clicked)
@@ -89,44 +90,19 @@ def __init__(self, parent: tk.BaseWidget) -> None:
         CurrentWorkspace.add_property_change_listener(self.__on_workspace_changed)
         Locale.add_property_change_listener(self.__on_locale_changed)
         #   TODO current credentials change
-        if CurrentWorkspace.get():
-            CurrentWorkspace.get().add_notification_listener(self.__on_current_workspace_modified)
 
     ##########
     #   Refreshable
     def refresh(self) -> None:
-        credentials = CurrentCredentials.get()
-        workspace = CurrentWorkspace.get()
-        if (credentials is None) or (workspace is None):
-            self.__users_tree_view.root_nodes.clear()
-            self.__create_user_button.enabled = False
-            self.__modify_user_button.enabled = False
-            self.__destroy_user_button.enabled = False
-            self.__create_account_button.enabled = False
-            self.__modify_account_button.enabled = False
-            self.__destroy_account_button.enabled = False
-            return
-
-        self.__refresh_user_nodes()
-
-        selected_user = self.selected_user
-        selected_account = self.selected_account
-        try:
-            can_manage_users = workspace.can_manage_users(credentials)
-            #   A user should be able to modify SOME details (like
-            #   real_name) of itself and SOME details (like password) of
-            #   its own accounts
-            mu = False if selected_user is None else selected_user.can_modify(credentials)
-            ma = False if selected_account is None else selected_account.can_modify(credentials)
-        except Exception:
-            can_manage_users = False
+        #   The data is gathered on a worker thread
+        self._refresh_in_background(self.selected_object)
 
-        self.__create_user_button.enabled = can_manage_users
-        self.__modify_user_button.enabled = (can_manage_users or mu) and (selected_user is not None)
-        self.__destroy_user_button.enabled = can_manage_users and (selected_user is not None)
-        self.__create_account_button.enabled = can_manage_users and (selected_user is not None)
-        self.__modify_account_button.enabled = (can_manage_users or ma) and (selected_account is not None)
-        self.__destroy_account_button.enabled = can_manage_users and (selected_account is not None)
+    ##########
+    #   tk.BaseWidget
+    def destroy(self) -> None:
+        CurrentWorkspace.remove_property_change_listener(self.__on_workspace_changed)
+        Locale.remove_property_change_listener(self.__on_locale_changed)
+        View.destroy(self)
 
     ##########
     #   Properties
@@ -134,6 +110,17 @@ def refresh(self) -> None:
     def type(self) -> ViewType:
         return UsersViewType.instance
 
+    @property
+    def dependencies(self) -> Optional[dict[type, Optional[set[str]]]]:
+        return {
+                BusinessUser: { BusinessUser.ENABLED_PROPERTY_NAME,
+                                BusinessUser.REAL_NAME_PROPERTY_NAME,
+                                BusinessUser.ACCOUNTS_ASSOCIATION_NAME },
+                BusinessAccount: { BusinessAccount.ENABLED_PROPERTY_NAME,
+                                   BusinessAccount.LOGIN_PROPERTY_NAME,
+                                   BusinessAccount.CAPABILITIES_PROPERTY_NAME },
+            }
+
     @property
     def selected_object(self) -> Optional[BusinessObject]:
         node = self.__users_tree_view.current_node
@@ -145,14 +132,12 @@ def selected_object(self, obj: Optional[BusinessObject]) -> None:
         self.perform_refresh()
         if obj is None:
             return
-        for user_node in self.__users_tree_view.root_nodes:
-            if user_node.tag == obj:
-                self.__users_tree_view.current_node = user_node
-                return
-            for account_node in user_node.child_nodes:
-                if account_node.tag == obj:
-                    self.__users_tree_view.current_node = account_node
-                    return
+        node = self.__users_tree_view.find_by_tag(obj)
+        if node is not None:
+            self.__users_tree_view.current_node = node
+        else:
+            #   Not loaded yet - select it once the refresh is applied
+            self.__selected_object_after_refresh = obj
 
     @property
     def selected_user(self) -> Optional[BusinessUser]:
@@ -185,86 +170,134 @@ def __apply_default_locale(self) -> None:
         self.__modify_account_button.text = GuiResources.string("UsersViewEditor.ModifyAccountButton.Text")
         self.__destroy_account_button.text = GuiResources.string("UsersViewEditor.DestroyAccountButton.Text")
 
-    def __refresh_user_nodes(self) -> None:
-        workspace = CurrentWorkspace.get()
-        credentials = CurrentCredentials.get()
-        if (workspace is None) or (credentials is None):
-            self.__users_tree_view.root_nodes.clear()
-            return
-        selected_object = self.selected_object
-
+    def _load_snapshot(self, workspace: Workspace, credentials: Credentials,
+                       selected_object: Optional[BusinessObject]) -> "_UsersViewSnapshot":
         #   Prepare the list of accessible BusinessUsers sorted by real_name
         users = list(workspace.get_users(credentials))
         try:
             users.sort(key=lambda u: u.get_real_name(credentials))
-        except Exception as ex:
-            ErrorDialog.show(self, ex)
+        except Exception:
             pass    #   TODO log the exception
-        #   Make sure the self.__users_tree_view contains a proper number
-        #   of root nodes...
-        while len(self.__users_tree_view.root_nodes) > len(users):
-            #   Too many root nodes in the users tree
-            self.__users_tree_view.root_nodes.remove_at(len(self.__users_tree_view.root_nodes) - 1)
-        while len(self.__users_tree_view.root_nodes) < len(users):
-            #   Too few root nodes in the users tree
-            user = users[len(self.__users_tree_view.root_nodes)]
-            self.__users_tree_view.root_nodes.add(user.display_name,
-                                                  image=user.small_image,
-                                                  tag=user)
-        #   ...each representing a proper BusinessUser
-        for i in range(len(users)):
-            try:
-                user_disabled_prefix = "" if users[i].is_enabled(credentials) else '[disabled] '
-            except Exception:
-                user_disabled_prefix = ""
-            user_node = self.__users_tree_view.root_nodes[i]
-            user_node.text = user_disabled_prefix + users[i].display_name
-            user_node.tag = users[i]
-            #   ...and having proper account nodes underneath
-            self.__refresh_account_nodes(user_node, users[i])
+        accounts = dict()
+        node_texts = dict()
+        for user in users:
+            accounts[user] = tuple(self.__sorted_accounts(user, credentials))
+            node_texts[user] = self.__node_text(user, credentials)
+            for account in accounts[user]:
+                node_texts[account] = self.__node_text(account, credentials)
+        try:
+            can_manage_users = workspace.can_manage_users(credentials)
+            #   A user should be able to modify SOME details (like
+            #   real_name) of itself and SOME details (like password) of
+            #   its own accounts
+            can_modify_selected_object = (selected_object is not None) and selected_object.can_modify(credentials)
+        except Exception:
+            can_manage_users = False
+            can_modify_selected_object = False
+        return _UsersViewSnapshot(users, accounts, node_texts, can_manage_users,
+                                  selected_object, can_modify_selected_object)
+
+    def _apply_snapshot(self, snapshot: Optional["_UsersViewSnapshot"]) -> None:
+        if snapshot is None:
+            self.__users_tree_view.root_nodes.clear()
+            self.__create_user_button.enabled = False
+            self.__modify_user_button.enabled = False
+            self.__destroy_user_button.enabled = False
+            self.__create_account_button.enabled = False
+            self.__modify_account_button.enabled = False
+            self.__destroy_account_button.enabled = False
+            return
+
+        selected_object = self.selected_object
+        if self.__selected_object_after_refresh is not None:
+            selected_object = self.__selected_object_after_refresh
+            self.__selected_object_after_refresh = None
+
+        #   Make sure the self.__users_tree_view contains one node per
+        #   BusinessUser, with its BusinessAccounts underneath
+        self.__users_tree_view.root_nodes.sync(
+            snapshot.users,
+            text=snapshot.node_text,
+            image=lambda obj: obj.small_image,
+            children=lambda obj: snapshot.accounts(obj) if isinstance(obj, BusinessUser) else [])
 
         #   Try to keep the selection
         if self.selected_object != selected_object:
-            self.selected_object = selected_object
+            node = self.__users_tree_view.find_by_tag(selected_object)
+            if node is not None:
+                self.__users_tree_view.current_node = node
+
+        selected_user = self.selected_user
+        selected_account = self.selected_account
+        can_manage_users = snapshot.can_manage_users
+        mu = snapshot.can_modify(selected_user)
+        ma = snapshot.can_modify(selected_account)
+
+        self.__create_user_button.enabled = can_manage_users
+        self.__modify_user_button.enabled = (can_manage_users or mu) and (selected_user is not None)
+        self.__destroy_user_button.enabled = can_manage_users and (selected_user is not None)
+        self.__create_account_button.enabled = can_manage_users and (selected_user is not None)
+        self.__modify_account_button.enabled = (can_manage_users or ma) and (selected_account is not None)
+        self.__destroy_account_button.enabled = can_manage_users and (selected_account is not None)
 
-    def __refresh_account_nodes(self, user_node: TreeNode, user: BusinessUser) -> None:
+    def _refresh_modified_objects(self, modifications: dict[BusinessObject, set[str]]) -> None:
         credentials = CurrentCredentials.get()
-        assert (user_node is not None) and (user is not None) and (credentials is not None)
+        if ((credentials is None) or
+            any(BusinessAccount.CAPABILITIES_PROPERTY_NAME in names for names in modifications.values())):
+            #   Access rights may have changed - refresh everything
+            View._refresh_modified_objects(self, modifications)
+            return
+        selected_object = self.selected_object
+        for (obj, property_names) in modifications.items():
+            node = self.__users_tree_view.find_by_tag(obj)
+            if node is None:
+                continue
+            node_text = self.__node_text(obj, credentials)
+            if node.text != node_text:
+                node.text = node_text
+            if BusinessUser.ACCOUNTS_ASSOCIATION_NAME in property_names:
+                node.child_nodes.sync(
+                    self.__sorted_accounts(obj, credentials),
+                    text=lambda a: self.__node_text(a, credentials),
+                    image=lambda a: a.small_image)
+            if (BusinessUser.REAL_NAME_PROPERTY_NAME in property_names or
+                BusinessAccount.LOGIN_PROPERTY_NAME in property_names):
+                #   The node may now be out of order among its siblings
+                siblings = (self.__users_tree_view.root_nodes if node.parent_node is None
+                            else node.parent_node.child_nodes)
+                try:
+                    items = sorted((sibling.tag for sibling in siblings),
+                                   key=lambda o: (o.get_real_name(credentials) if isinstance(o, BusinessUser)
+                                                  else o.get_login(credentials)))
+                except Exception:
+                    continue    #   TODO log the exception
+                siblings.sync(items, text=lambda o: self.__node_text(o, credentials))
+        #   Try to keep the selection
+        if self.selected_object != selected_object:
+            self.selected_object = selected_object
 
-        #   Prepare the list of accessible BusinessAccounts sorted by login
+    def __sorted_accounts(self, user: BusinessUser, credentials: Credentials) -> list[BusinessAccount]:
+        #   Prepare the list of accessible BusinessAccounts sorted by
+        #   login. Also called on a worker thread - no UI here!
         accounts = list(user.get_accounts(credentials))
         try:
             accounts.sort(key=lambda a: a.get_login(credentials))
-        except Exception as ex:
-            ErrorDialog.show(self, ex)
+        except Exception:
             pass    #   TODO log the exception
-        #   Make sure the self.__users_tree_view contains a proper number
-        #   of root nodes...
-        while len(user_node.child_nodes) > len(accounts):
-            #   Too many leaf nodes under the user node
-            user_node.child_nodes.remove_at(len(user_node.child_nodes) - 1)
-        while len(user_node.child_nodes) < len(accounts):
-            #   Too gew leaf nodes under the user node
-            account = accounts[len(user_node.child_nodes)]
-            user_node.child_nodes.add(account.display_name,
-                                      image=account.small_image,
-                                      tag=account)
-        #   ...each representing a proper BusinessAccount
-        for i in range(len(accounts)):
-            try:
-                account_disabled_prefix = "" if accounts[i].is_enabled(credentials) else '[disabled] '
-            except Exception as ex:
-                account_disabled_prefix = ""
-            account_node = user_node.child_nodes[i]
-            account_node.text = account_disabled_prefix + accounts[i].display_name
-            account_node.tag = accounts[i]
+        return accounts
+
+    def __node_text(self, obj: BusinessObject, credentials: Credentials) -> str:
+        #   obj is a BusinessUser or a BusinessAccount
+        try:
+            disabled_prefix = "" if obj.is_enabled(credentials) else '[disabled] '
+        except Exception:
+            disabled_prefix = ""
+        return disabled_prefix + obj.display_name
 
     ##########
     #   Event listeners
     def __on_workspace_changed(self, evt) -> None:
         assert isinstance(evt, PropertyChangeEvent)
-        if CurrentWorkspace.get() is not None:
-            CurrentWorkspace.get().add_notification_listener(self.__on_current_workspace_modified)
         self.request_refresh()
 
     def __on_locale_changed(self, evt) -> None:
@@ -272,10 +305,6 @@ def __on_locale_changed(self, evt) -> None:
         self.__apply_default_locale()
         self.request_refresh()
 
-    def __on_current_workspace_modified(self, evt: WorkspaceNotification) -> None:
-        assert isinstance(evt, WorkspaceNotification)
-        self.request_refresh()
-
     def __users_tree_view_listener(self, evt: ItemEvent) -> None:
         assert isinstance(evt, ItemEvent)
         self.request_refresh()
@@ -350,3 +379,43 @@ def __on_destroy_account_button_clicked(self, evt: ActionEvent) -> None:
             self.request_refresh()
         except Exception as ex: #   error in DestroyAccountDialog constructor
             ErrorDialog.show(None, ex)
+
+##########
+#   Implementation helpers
+class _UsersViewSnapshot:
+    """ The data shown by a UsersView, gathered on a worker thread. """
+
+    def __init__(self,
+                 users: list[BusinessUser],
+                 accounts: dict[BusinessUser, tuple[BusinessAccount, ...]],
+                 node_texts: dict[BusinessObject, str],
+                 can_manage_users: bool,
+                 selected_object: Optional[BusinessObject],
+                 can_modify_selected_object: bool) -> None:
+        self.__users = tuple(users)
+        self.__accounts = accounts
+        self.__node_texts = node_texts
+        self.__can_manage_users = can_manage_users
+        self.__selected_object = selected_object
+        self.__can_modify_selected_object = can_modify_selected_object
+
+    @property
+    def users(self) -> tuple[BusinessUser, ...]:
+        """ The accessible users, sorted by real name. """
+        return self.__users
+
+    @property
+    def can_manage_users(self) -> bool:
+        return self.__can_manage_users
+
+    def accounts(self, user: BusinessUser) -> tuple[BusinessAccount, ...]:
+        """ The accessible accounts of the user, sorted by login. """
+        return self.__accounts.get(user, ())
+
+    def node_text(self, obj: BusinessObject) -> str:
+        return self.__node_texts.get(obj, obj.display_name)
+
+    def can_modify(self, obj: Optional[BusinessObject]) -> bool:
+        """ True if "obj" was selected when the snapshot was taken
+            and can be modified, else False. """
+        return (obj is not None) and (obj == self.__selected_object) and self.__can_modify_selected_object
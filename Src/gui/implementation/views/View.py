@@ -1,24 +1,253 @@
 #   Python standard library
+from typing import Optional, Any
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
+import threading
 
 #   Dependencies on other PyTT components
 from awt.interface.api import *
+from workspace.interface.api import *
 
 #   Internal dependencies on modules within the same component
 from .ViewType import ViewType
+from ..misc.CurrentWorkspace import CurrentWorkspace
+from ..misc.CurrentCredentials import CurrentCredentials
 
 ##########
 #   Public entities
 class View(Panel):
-    
+
     ##########
     #   Construction - from derived classes only
     def __init__(self, parent: tk.BaseWidget) -> None:
         Panel.__init__(self, parent)
 
+        #   Workspace notification routing
+        self.__observed_workspace = None
+        self.__pending_modifications = dict()   #   BusinessObject -> set of property names
+        self.__pending_modifications_guard = threading.Lock()
+        self.__pending_modifications_scheduled = False
+
+        #   Background refresh; the generation is only ever
+        #   changed on the UI thread
+        self.__snapshot_generation = 0
+
+        CurrentWorkspace.add_property_change_listener(self.__on_current_workspace_changed)
+        self.__observe_workspace(CurrentWorkspace.get())
+
+    ##########
+    #   tk.BaseWidget
+    def destroy(self) -> None:
+        #   Stop listening, so that a destroyed view is neither kept
+        #   alive nor refreshed by the current workspace
+        CurrentWorkspace.remove_property_change_listener(self.__on_current_workspace_changed)
+        self.__observe_workspace(None)
+        Panel.destroy(self)
+
     ##########
     #   Properties
     @property
     def type(self) -> ViewType:
         """ The type of this view; MUST be overridden in a derived class. """
-        raise NotImplementedError()
\ No newline at end of file
+        raise NotImplementedError()
+
+    @property
+    def dependencies(self) -> Optional[dict[type, Optional[set[str]]]]:
+        """ The business object types this view shows, each mapped to
+            the names of the properties (and associations) of such
+            objects this view shows (None == all of them); None if
+            this view depends on everything in the current workspace.
+            Workspace notifications about other objects or properties
+            do not refresh this view. Should be overridden in a
+            derived class; the default is None. """
+        return None
+
+    ##########
+    #   Background refresh - for derived classes
+    def _refresh_in_background(self, *args) -> None:
+        """
+            Starts a refresh whose data-gathering phase runs on a
+            worker thread: _load_snapshot() is called there with the
+            current workspace, the current credentials and "args",
+            and the snapshot it returns is then passed to
+            _apply_snapshot() on the UI thread. A snapshot is
+            discarded if another refresh has started in the meantime.
+            If there is no current workspace or credentials, calls
+            _apply_snapshot(None) right away; if the workspace does
+            not support background reads, loads and applies the
+            snapshot right away on the UI thread.
+            Typically called from refresh() of a derived class.
+
+            @param args:
+                Any UI state the snapshot depends on (such as the
+                selected object), as _load_snapshot() cannot query
+                the UI.
+        """
+        self.__snapshot_generation += 1
+        workspace = CurrentWorkspace.get()
+        credentials = CurrentCredentials.get()
+        if (workspace is None) or (credentials is None):
+            self._apply_snapshot(None)
+            return
+        if not workspace.supports_background_reads:
+            #   Must gather the data on this (UI) thread after all
+            self._apply_snapshot(self._load_snapshot(workspace, credentials, *args))
+            return
+        View.__snapshot_loader().submit(self.__load_snapshot,
+                                        self.__snapshot_generation, workspace, credentials, args)
+
+    def _load_snapshot(self, workspace: Workspace, credentials: Credentials, *args) -> Any:
+        """
+            Called on a worker thread to gather the data this view
+            shows; MUST be overridden in a derived class that calls
+            _refresh_in_background(). Must only query the workspace,
+            never the UI, and return an object that is not modified
+            afterwards.
+
+            @param workspace:
+                The workspace to query.
+            @param credentials:
+                The credentials to query the workspace with.
+            @param args:
+                The arguments passed to _refresh_in_background().
+            @return:
+                The snapshot to pass to _apply_snapshot().
+        """
+        raise NotImplementedError()
+
+    def _apply_snapshot(self, snapshot: Any) -> None:
+        """
+            Called on the UI thread to update this view from a
+            snapshot returned by _load_snapshot(); MUST be overridden
+            in a derived class that calls _refresh_in_background().
+
+            @param snapshot:
+                The snapshot, None if there is no current workspace
+                or credentials.
+        """
+        raise NotImplementedError()
+
+    ##########
+    #   Implementation helpers
+    __STORM_SIZE = 32
+    """ The number of objects created/destroyed (or modified) in a
+        single notification batch, beyond which a full refresh is
+        cheaper than a partial one. """
+
+    def _refresh_modified_objects(self, modifications: dict[BusinessObject, set[str]]) -> None:
+        """
+            Called on the UI thread when objects this view depends on
+            have been modified, but none created or destroyed. Can
+            be overridden in a derived class to update just the
+            affected parts of the view; the default implementation
+            refreshes the whole view.
+
+            @param modifications:
+                The modified objects, each mapped to the names of its
+                modified properties this view depends on.
+        """
+        self.request_local_refresh()
+
+    __SNAPSHOT_LOADER_THREADS = 2
+    __snapshot_loader_pool = None   #   created on first use
+
+    @staticmethod
+    def __snapshot_loader() -> ThreadPoolExecutor:
+        #   Only ever called on the UI thread
+        if View.__snapshot_loader_pool is None:
+            View.__snapshot_loader_pool = ThreadPoolExecutor(
+                max_workers=View.__SNAPSHOT_LOADER_THREADS,
+                thread_name_prefix="PyTT view loader")
+        return View.__snapshot_loader_pool
+
+    def __load_snapshot(self, generation: int, workspace: Workspace,
+                        credentials: Credentials, args: tuple) -> None:
+        #   Called on a worker thread
+        if generation != self.__snapshot_generation:
+            return  #   Stale before it started
+        try:
+            snapshot = self._load_snapshot(workspace, credentials, *args)
+        except Exception:
+            #   Retry on the UI thread, where a failure is reported
+            #   the same way as that of a synchronous refresh
+            GuiRoot.tk.after_idle(self.__reload_snapshot, generation, workspace, credentials, args)
+            return
+        GuiRoot.tk.after_idle(self.__apply_loaded_snapshot, generation, snapshot)
+
+    def __reload_snapshot(self, generation: int, workspace: Workspace,
+                          credentials: Credentials, args: tuple) -> None:
+        if generation != self.__snapshot_generation:
+            return  #   A newer refresh has started
+        if not self.winfo_exists():
+            return
+        self._apply_snapshot(self._load_snapshot(workspace, credentials, *args))
+
+    def __apply_loaded_snapshot(self, generation: int, snapshot: Any) -> None:
+        if generation != self.__snapshot_generation:
+            return  #   A newer refresh has started
+        if not self.winfo_exists():
+            return
+        self._apply_snapshot(snapshot)
+
+    def __observe_workspace(self, workspace: Optional[Workspace]) -> None:
+        if self.__observed_workspace is not None:
+            self.__observed_workspace.remove_notification_batch_listener(self.__on_workspace_notification_batch)
+        self.__observed_workspace = workspace
+        if workspace is not None:
+            workspace.add_notification_batch_listener(self.__on_workspace_notification_batch)
+
+    def __depends_on(self, dependencies: dict, obj: BusinessObject, property_name: Optional[str]) -> bool:
+        for (object_type, property_names) in dependencies.items():
+            if isinstance(obj, object_type):
+                if (property_name is None) or (property_names is None) or (property_name in property_names):
+                    return True
+        return False
+
+    def __apply_pending_modifications(self) -> None:
+        with self.__pending_modifications_guard:
+            modifications = self.__pending_modifications
+            self.__pending_modifications = dict()
+            self.__pending_modifications_scheduled = False
+        if len(modifications) == 0:
+            return
+        try:
+            if not self.winfo_exists():
+                return
+            self._refresh_modified_objects(modifications)
+        except Exception:
+            self.request_local_refresh()    #   TODO log ?
+
+    ##########
+    #   Event listeners
+    def __on_current_workspace_changed(self, evt: PropertyChangeEvent) -> None:
+        assert isinstance(evt, PropertyChangeEvent)
+        self.__observe_workspace(CurrentWorkspace.get())
+
+    def __on_workspace_notification_batch(self, evt: WorkspaceNotificationBatch) -> None:
+        assert isinstance(evt, WorkspaceNotificationBatch)
+        #   Called on the workspace notification thread
+        dependencies = self.dependencies
+        if dependencies is None:
+            self.request_refresh()
+            return
+        created_or_destroyed = 0
+        modifications = dict()
+        for n in evt:
+            if isinstance(n, BusinessObjectModifiedNotification):
+                if self.__depends_on(dependencies, n.object, n.property_name):
+                    modifications.setdefault(n.object, set()).add(n.property_name)
+            elif self.__depends_on(dependencies, n.object, None):
+                created_or_destroyed += 1
+        if created_or_destroyed > View.__STORM_SIZE:
+            self.request_refresh()
+        elif (created_or_destroyed > 0) or (len(modifications) > View.__STORM_SIZE):
+            self.request_local_refresh()
+        elif len(modifications) > 0:
+            #   Coalesce modifications until the UI thread gets to them
+            with self.__pending_modifications_guard:
+                for (obj, property_names) in modifications.items():
+                    self.__pending_modifications.setdefault(obj, set()).update(property_names)
+                if self.__pending_modifications_scheduled:
+                    return
+                self.__pending_modifications_scheduled = True
+            GuiRoot.tk.after_idle(self.__apply_pending_modifications)
@@ -0,0 +1,142 @@
+""" Measures the time spent importing each module. """
+
+#   Python standard library
+#   IMPORTANT: This module must not depend on other PyTT components,
+#   so that it can be activated before any of them is imported.
+from typing import final, Optional, TextIO
+import importlib.abc
+import sys
+import time
+
+##########
+#   Public entities
+@final
+class ImportProfiler:
+    """
+        Measures the time spent importing each module while active.
+        For each module both the "self" time (executing the module's
+        own code) and the "cumulative" time (including the modules
+        it imports in turn) are recorded.
+    """
+
+    ##########
+    #   Implementation helpers
+    __finder : Optional["_ProfilingFinder"] = None
+    __records : list[tuple[str, float, float]] = []    #   (module name, self time, cumulative time)
+    __start_time : Optional[float] = None
+    __total_time = 0.0
+
+    ##########
+    #   Construction - disable (this is an utility class)
+    def __init__(self):
+        assert False, str(self.__class__) + " is a utility class"
+
+    ##########
+    #   Operations (state)
+    @staticmethod
+    def is_active() -> bool:
+        """ Returns True if module imports are being profiled, else False. """
+        return ImportProfiler.__finder is not None
+
+    @staticmethod
+    def records() -> list[tuple[str, float, float]]:
+        """
+            Returns the profiling results collected so far.
+
+            @return:
+                The list of (module name, self time, cumulative time)
+                tuples, one per imported module, in import order;
+                times are in seconds.
+        """
+        return list(ImportProfiler.__records)
+
+    ##########
+    #   Operations (profiling)
+    @staticmethod
+    def start() -> None:
+        """ Starts profiling module imports; has no effect if already started. """
+        if ImportProfiler.__finder is None:
+            ImportProfiler.__finder = _ProfilingFinder(ImportProfiler.__records)
+            ImportProfiler.__start_time = time.perf_counter()
+            sys.meta_path.insert(0, ImportProfiler.__finder)
+
+    @staticmethod
+    def stop() -> None:
+        """ Stops profiling module imports; has no effect if not started. """
+        if ImportProfiler.__finder is not None:
+            sys.meta_path.remove(ImportProfiler.__finder)
+            ImportProfiler.__finder = None
+            ImportProfiler.__total_time += time.perf_counter() - ImportProfiler.__start_time
+
+    @staticmethod
+    def report(file: TextIO = None, limit: int = 30) -> None:
+        """
+            Prints the profiling results collected so far, slowest
+            modules (by self time) first.
+
+            @param file:
+                The file to print to; None == sys.stdout.
+            @param limit:
+                The maximum number of modules to list.
+        """
+        file = sys.stdout if file is None else file
+        records = sorted(ImportProfiler.__records, key=lambda r: r[1], reverse=True)
+        total_self_time = sum(r[1] for r in records)
+        elapsed_time = ImportProfiler.__total_time
+        if ImportProfiler.__finder is not None:
+            elapsed_time += time.perf_counter() - ImportProfiler.__start_time
+        print("Startup import profile: %d modules, %.1f ms importing, %.1f ms profiled" %
+              (len(records), total_self_time * 1000, elapsed_time * 1000), file=file)
+        print("%10s %10s  %s" % ("self ms", "cumul. ms", "module"), file=file)
+        for (module_name, self_time, cumulative_time) in records[:limit]:
+            print("%10.2f %10.2f  %s" % (self_time * 1000, cumulative_time * 1000, module_name), file=file)
+
+##########
+#   Implementation helpers
+class _ProfilingFinder(importlib.abc.MetaPathFinder):
+    """ Finds modules via the other finders on sys.meta_path,
+        substituting a timing loader for the one they find. """
+
+    def __init__(self, records: list):
+        self.__records = records
+        self.__child_times = []     #   stack: time spent in nested imports
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _ProfilingLoader(self, spec.loader)
+                return spec
+        return None
+
+    def exec_module(self, loader, module) -> None:
+        self.__child_times.append(0.0)
+        start_time = time.perf_counter()
+        try:
+            loader.exec_module(module)
+        finally:
+            cumulative_time = time.perf_counter() - start_time
+            child_time = self.__child_times.pop()
+            if len(self.__child_times) > 0:
+                self.__child_times[-1] += cumulative_time
+            self.__records.append((module.__name__, cumulative_time - child_time, cumulative_time))
+
+class _ProfilingLoader(importlib.abc.Loader):
+    """ Delegates to the real loader, timing module execution. """
+
+    def __init__(self, finder: _ProfilingFinder, loader):
+        self.__finder = finder
+        self.__loader = loader
+
+    def create_module(self, spec):
+        return self.__loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        self.__finder.exec_module(self.__loader, module)
+
+    def __getattr__(self, name):
+        #   e.g. get_source(), get_filename() or is_package()
+        return getattr(self.__loader, name)
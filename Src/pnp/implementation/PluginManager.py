@@ -41,8 +41,24 @@ def initialised_plugins(cls) -> list[Plugin]:
     #   Operations
     @staticmethod
     def load_plugins(root_directory: str):
+        """
+            Discovers and initialises the plugins of all PyTT
+            components found in the specified root directory.
+            Only the component packages themselves (whose
+            "__init__.py" declares the component's plugins and
+            subsystems) and the modules listed in their plugin
+            manifests are imported; all other modules are imported
+            on first use.
+            A component's plugin manifest is the optional
+            PLUGIN_ENTRY_POINTS list of module names declared in
+            its "__init__.py", e.g. for modules that register
+            something when imported.
+
+            @param root_directory:
+                The directory containing the PyTT components.
+        """
         #   Discover plugins...
-        PluginManager.__load_packages(root_directory, '')
+        PluginManager.__load_packages(root_directory)
         for p in Plugin.__discovered_plugins:
             PluginManager.__discovered_plugins.add(p)
         for p in PluginManager.__discovered_plugins:
@@ -63,33 +79,29 @@ def load_plugins(root_directory: str):
     #   Implementation
     @staticmethod
     def __is_package_directory(directory: str) -> bool:
-        entry_names = os.listdir(directory)
-        for entry_name in entry_names:
-            entry_path = os.path.join(directory, entry_name)
-            if os.path.isfile(entry_path) and entry_name == "__init__.py":
-                return True
-        return False
+        return os.path.isfile(os.path.join(directory, "__init__.py"))
 
     @staticmethod
-    def __load_packages(directory: str, package_name: str):
-        #print("Scanning", directory, "for packages")
-        PluginManager.__load_modules(directory, package_name)
+    def __load_packages(root_directory: str):
+        for entry_name in sorted(os.listdir(root_directory)):
+            if entry_name.startswith(("_", ".")):
+                continue
+            entry_path = os.path.join(root_directory, entry_name)
+            if (not os.path.isdir(entry_path) or
+                not PluginManager.__is_package_directory(entry_path)):
+                continue
+            package = PluginManager.__load_module(entry_name)
+            for module_name in getattr(package, "PLUGIN_ENTRY_POINTS", ()):
+                PluginManager.__load_module(module_name)
 
     @staticmethod
-    def __load_modules(directory: str, package_name: str):
-        #print("Scanning", directory, "for modules")
-        entry_names = os.listdir(directory)
-        for entry_name in entry_names:
-            entry_path = os.path.join(directory, entry_name)
-            #   TODO do not autoload the module if entry_name starts with '_'
-            if (os.path.isfile(entry_path) and entry_name.endswith(".py") and
-                entry_name != "__init__.py"):
-                separator = "" if len(package_name) == 0 else "."
-                module_name = package_name + separator + entry_name[:len(entry_name) - 3]
-                #TODO kill off print("Found module", module_name)
-                m = importlib.import_module(module_name)
-                pass
-            elif os.path.isdir(entry_path):
-                separator = "" if len(package_name) == 0 else "."
-                module_name = package_name + separator + entry_name
-                PluginManager.__load_modules(entry_path, module_name)
+    def __load_module(module_name: str):
+        #   A broken module must not keep the rest from loading,
+        #   but must not go unnoticed either
+        try:
+            return importlib.import_module(module_name)
+        except Exception as ex:
+            #   TODO log the exception ?
+            print("Failed to load", module_name)
+            traceback.print_exc()
+            return None
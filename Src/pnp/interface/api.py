@@ -2,5 +2,6 @@
 
 ##########
 #   Public entities
+from pnp.implementation.ImportProfiler import *
 from pnp.implementation.Plugin import *
 from pnp.implementation.PluginManager import *
@@ -9,12 +9,26 @@
 from .SqlDatabase import SqlDatabase
 from .SqlDatabaseObject import SqlDatabaseObject
 from .SqlDataType import SqlDataType
+from .SqlRecord import SqlRecord
 
 ##########
 #   Public entities
 class SqlAccount(SqlDatabaseObject, Account):
     """ An account residing in an SQL database. """
 
+    __slots__ = (   #   Property cache
+            "_enabled",
+            "_login",
+            "_password_hash",
+            "_capabilities",
+            "_email_addresses",
+            "_fk_user",
+        )
+
+    ##########
+    #   Constants
+    _TABLE_NAME = "accounts"
+
     ##########
     #   Construction - internal only
     def __init__(self, db: SqlDatabase, oid: OID):
@@ -314,56 +328,43 @@ def user(self) -> User:
 
     ##########
     #   Property cache support
-    def _reload_property_cache(self) -> None:
-        try:
-            stat = self.database.create_statement(
-                """SELECT * FROM accounts WHERE pk = ?""")
-            stat.set_int_parameter(0, self.oid)
-            rs = stat.execute()
-            assert len(rs) <= 1
-            if len(rs) == 0:
-                #   OOPS! The record is not in the database!
-                self._mark_dead()
-                raise DatabaseObjectDeadError(Account.TYPE_NAME)
-            r = rs[0]
-            self._enabled = r["enabled", SqlDataType.BOOLEAN]
-            self._login = r["login", SqlDataType.STRING]
-            self._password_hash = r["password_hash", SqlDataType.STRING]
-            self._capabilities = Capabilities.NONE
-            #self._email_addresses = None
-            #   Start of capability fields
-            if r["is_administrator", SqlDataType.BOOLEAN]:
-                self._capabilities |= Capabilities.ADMINISTRATOR
-            if r["can_manage_users", SqlDataType.BOOLEAN]:
-                self._capabilities |= Capabilities.MANAGE_USERS
-            if r["can_manage_stock_items", SqlDataType.BOOLEAN]:
-                self._capabilities |= Capabilities.MANAGE_STOCK_ITEMS
-            if r["can_manage_beneficiaries", SqlDataType.BOOLEAN]:
-                self._capabilities |= Capabilities.MANAGE_BENEFICIARIES
-            if r["can_manage_workloads", SqlDataType.BOOLEAN]:
-                self._capabilities |= Capabilities.MANAGE_WORKLOADS
-            if r["can_manage_public_activities", SqlDataType.BOOLEAN]:
-                self._capabilities |= Capabilities.MANAGE_PUBLIC_ACTIVITIES
-            if r["can_manage_public_tasks", SqlDataType.BOOLEAN]:
-                self._capabilities |= Capabilities.MANAGE_PUBLIC_TASKS
-            if r["can_manage_private_activities", SqlDataType.BOOLEAN]:
-                self._capabilities |= Capabilities.MANAGE_PRIVATE_ACTIVITIES
-            if r["can_manage_private_tasks", SqlDataType.BOOLEAN]:
-                self._capabilities |= Capabilities.MANAGE_PRIVATE_TASKS
-            if r["can_log_work", SqlDataType.BOOLEAN]:
-                self._capabilities |= Capabilities.LOG_WORK
-            if r["can_log_events", SqlDataType.BOOLEAN]:
-                self._capabilities |= Capabilities.LOG_EVENTS
-            if r["can_generate_reports", SqlDataType.BOOLEAN]:
-                self._capabilities |= Capabilities.GENERATE_REPORTS
-            if r["can_backup_and_restore", SqlDataType.BOOLEAN]:
-                self._capabilities |= Capabilities.BACKUP_AND_RESTORE
-            #   End of capability fields
-            email_addresses = r["email_addresses", SqlDataType.STRING]
-            if email_addresses is None:
-                self._email_addresses = []
-            else:
-                self._email_addresses = email_addresses.split("\n")
-            self._fk_user = r["fk_user", SqlDataType.INTEGER]
-        except Exception as ex:
-            raise DatabaseError.wrap(ex)
+    def _store_property_cache(self, r: SqlRecord) -> None:
+        self._enabled = r["enabled", SqlDataType.BOOLEAN]
+        self._login = r["login", SqlDataType.STRING]
+        self._password_hash = r["password_hash", SqlDataType.STRING]
+        self._capabilities = Capabilities.NONE
+        #self._email_addresses = None
+        #   Start of capability fields
+        if r["is_administrator", SqlDataType.BOOLEAN]:
+            self._capabilities |= Capabilities.ADMINISTRATOR
+        if r["can_manage_users", SqlDataType.BOOLEAN]:
+            self._capabilities |= Capabilities.MANAGE_USERS
+        if r["can_manage_stock_items", SqlDataType.BOOLEAN]:
+            self._capabilities |= Capabilities.MANAGE_STOCK_ITEMS
+        if r["can_manage_beneficiaries", SqlDataType.BOOLEAN]:
+            self._capabilities |= Capabilities.MANAGE_BENEFICIARIES
+        if r["can_manage_workloads", SqlDataType.BOOLEAN]:
+            self._capabilities |= Capabilities.MANAGE_WORKLOADS
+        if r["can_manage_public_activities", SqlDataType.BOOLEAN]:
+            self._capabilities |= Capabilities.MANAGE_PUBLIC_ACTIVITIES
+        if r["can_manage_public_tasks", SqlDataType.BOOLEAN]:
+            self._capabilities |= Capabilities.MANAGE_PUBLIC_TASKS
+        if r["can_manage_private_activities", SqlDataType.BOOLEAN]:
+            self._capabilities |= Capabilities.MANAGE_PRIVATE_ACTIVITIES
+        if r["can_manage_private_tasks", SqlDataType.BOOLEAN]:
+            self._capabilities |= Capabilities.MANAGE_PRIVATE_TASKS
+        if r["can_log_work", SqlDataType.BOOLEAN]:
+            self._capabilities |= Capabilities.LOG_WORK
+        if r["can_log_events", SqlDataType.BOOLEAN]:
+            self._capabilities |= Capabilities.LOG_EVENTS
+        if r["can_generate_reports", SqlDataType.BOOLEAN]:
+            self._capabilities |= Capabilities.GENERATE_REPORTS
+        if r["can_backup_and_restore", SqlDataType.BOOLEAN]:
+            self._capabilities |= Capabilities.BACKUP_AND_RESTORE
+        #   End of capability fields
+        email_addresses = r["email_addresses", SqlDataType.STRING]
+        if email_addresses is None:
+            self._email_addresses = []
+        else:
+            self._email_addresses = email_addresses.split("\n")
+        self._fk_user = r["fk_user", SqlDataType.INTEGER]
@@ -10,12 +10,30 @@
 from .SqlDatabaseObject import SqlDatabaseObject
 from .SqlDataType import SqlDataType
 from .SqlActivityType import SqlActivityType
+from .SqlRecord import SqlRecord
 
 ##########
 #   Public entities
 class SqlActivity(SqlDatabaseObject, Activity):
     """ An activity residing in an SQL database. """
 
+    __slots__ = (   #   Property cache
+            "_name",
+            "_description",
+            "_timeout",
+            "_require_comment_on_start",
+            "_require_comment_on_finish",
+            "_full_screen_reminder",
+            "_fk_activity_type",
+            "_completed",
+            "_fk_owner",
+            "_fk_parent_task",
+        )
+
+    ##########
+    #   Constants
+    _TABLE_NAME = "activities"
+
     ##########
     #   Construction - internal only
     def __init__(self, db: SqlDatabase, oid: OID):
@@ -359,27 +377,14 @@ def activity_type(self, new_activity_type: Optional[ActivityType]) -> None:
 
     ##########
     #   Property cache support
-    def _reload_property_cache(self) -> None:
-        try:
-            stat = self.database.create_statement(
-                """SELECT * FROM [activities] WHERE [pk] = ?""")
-            stat.set_int_parameter(0, self.oid)
-            rs = stat.execute()
-            assert len(rs) <= 1
-            if len(rs) == 0:
-                #   OOPS! The record is not in the database!
-                self._mark_dead()
-                raise DatabaseObjectDeadError(User.TYPE_NAME)
-            r = rs[0]
-            self._name = r["name", SqlDataType.STRING]
-            self._description = r["description", SqlDataType.STRING]
-            self._timeout = r["timeout", SqlDataType.INTEGER]
-            self._require_comment_on_start = r["require_comment_on_start", SqlDataType.BOOLEAN]
-            self._require_comment_on_finish = r["require_comment_on_finish", SqlDataType.BOOLEAN]
-            self._full_screen_reminder = r["full_screen_reminder", SqlDataType.BOOLEAN]
-            self._fk_activity_type = r["fk_activity_type", SqlDataType.INTEGER]
-            self._completed = r["completed", SqlDataType.BOOLEAN]
-            self._fk_owner = r["fk_owner", SqlDataType.INTEGER]
-            self._fk_parent_task = r["fk_parent_task", SqlDataType.INTEGER]
-        except Exception as ex:
-            raise DatabaseError.wrap(ex)
+    def _store_property_cache(self, r: SqlRecord) -> None:
+        self._name = r["name", SqlDataType.STRING]
+        self._description = r["description", SqlDataType.STRING]
+        self._timeout = r["timeout", SqlDataType.INTEGER]
+        self._require_comment_on_start = r["require_comment_on_start", SqlDataType.BOOLEAN]
+        self._require_comment_on_finish = r["require_comment_on_finish", SqlDataType.BOOLEAN]
+        self._full_screen_reminder = r["full_screen_reminder", SqlDataType.BOOLEAN]
+        self._fk_activity_type = r["fk_activity_type", SqlDataType.INTEGER]
+        self._completed = r["completed", SqlDataType.BOOLEAN]
+        self._fk_owner = r["fk_owner", SqlDataType.INTEGER]
+        self._fk_parent_task = r["fk_parent_task", SqlDataType.INTEGER]
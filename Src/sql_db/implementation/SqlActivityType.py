@@ -9,12 +9,22 @@
 from .SqlDatabase import SqlDatabase
 from .SqlDatabaseObject import SqlDatabaseObject
 from .SqlDataType import SqlDataType
+from .SqlRecord import SqlRecord
 
 ##########
 #   Public entities
 class SqlActivityType(SqlDatabaseObject, ActivityType):
     """ An activity type residing in an SQL database. """
 
+    __slots__ = (   #   Property cache
+            "_name",
+            "_description",
+        )
+
+    ##########
+    #   Constants
+    _TABLE_NAME = "activity_types"
+
     ##########
     #   Construction - internal only
     def __init__(self, db: SqlDatabase, oid: OID):
@@ -160,20 +170,6 @@ def activities(self) -> Set[Activity]:
 
     ##########
     #   Property cache support
-    def _reload_property_cache(self) -> None:
-        try:
-            stat = self.database.create_statement(
-                """SELECT * FROM [activity_types] WHERE [pk] = ?""")
-            stat.set_int_parameter(0, self.oid)
-            rs = stat.execute()
-            assert len(rs) <= 1
-            if len(rs) == 0:
-                #   OOPS! The record is not in the database!
-                self._mark_dead()
-                raise DatabaseObjectDeadError(User.TYPE_NAME)
-            r = rs[0]
-            self._name = r["name", SqlDataType.STRING]
-            self._description = r["description", SqlDataType.STRING]
-        except Exception as ex:
-            raise DatabaseError.wrap(ex)
-
+    def _store_property_cache(self, r: SqlRecord) -> None:
+        self._name = r["name", SqlDataType.STRING]
+        self._description = r["description", SqlDataType.STRING]
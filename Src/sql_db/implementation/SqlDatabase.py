@@ -1,14 +1,20 @@
 #   Python standard library
+from typing import Iterable, TextIO, Union
 from abc import abstractmethod
-from weakref import WeakValueDictionary
 import hashlib
+import threading
+import time
 
 #   Dependencies on other PyTT components
 from db.interface.api import *
 
 #   Internal dependencies on modules within the same component
 from .SqlStatement import SqlStatement
+from .SqlStatementCache import SqlStatementCache
+from .SqlRecordStream import SqlRecordStream
+from .SqlScriptSplitter import SqlScriptSplitter
 from .SqlDataType import SqlDataType
+from .SqlObjectIdentityMap import SqlObjectIdentityMap
 
 ##########
 #   Public entities
@@ -20,12 +26,36 @@ class SqlDatabase(Database):
     def __init__(self):
         Database.__init__(self)
 
-        self.__objects = WeakValueDictionary()  #   OID -> SqlDatabaseObject
+        self.__objects = SqlObjectIdentityMap(self)
+        #   Proxy classes, by type name; imported here, as they
+        #   all depend on this module
+        from .SqlUser import SqlUser
+        from .SqlAccount import SqlAccount
+        from .SqlActivityType import SqlActivityType
+        from .SqlPublicActivity import SqlPublicActivity
+        from .SqlPrivateActivity import SqlPrivateActivity
+        from .SqlPublicTask import SqlPublicTask
+        from .SqlPrivateTask import SqlPrivateTask
+        self.__proxy_classes = {
+                User.TYPE_NAME: SqlUser,
+                Account.TYPE_NAME: SqlAccount,
+                ActivityType.TYPE_NAME: SqlActivityType,
+                PublicActivity.TYPE_NAME: SqlPublicActivity,
+                PrivateActivity.TYPE_NAME: SqlPrivateActivity,
+                PublicTask.TYPE_NAME: SqlPublicTask,
+                PrivateTask.TYPE_NAME: SqlPrivateTask,
+            }
+        self.__per_thread = threading.local()   #   .statement_cache -> SqlStatementCache
+
+        #   Property cache coherence support
+        self.__property_cache_generation = 0
+        self.__data_version = None
+        self.__data_version_probed_at = None
 
     ##########
     #   Database - Operations (general)
     def close(self) -> None:
-        for (oid, obj) in self.__objects.items():
+        for obj in self.__objects.objects():
             obj._invalidate_property_cache()
             obj._mark_dead()
         Database.close(self)
@@ -64,12 +94,8 @@ def users(self) -> Set[User]:
         self._ensure_open() # may raise DatabaseError
 
         try:
-            stat = self.create_statement(" SELECT [pk] FROM [users]")
-            rs = stat.execute()
-            result = set()
-            for r in rs:
-                result.add(self._get_user_proxy(r["pk"]))
-            return result
+            stat = self.create_statement(" SELECT * FROM [users]")
+            return self._get_primed_proxies(stat.execute(), User.TYPE_NAME)
         except Exception as ex:
             raise DatabaseError.wrap(ex)
 
@@ -78,12 +104,8 @@ def activity_types(self) -> Set[ActivityType]:
         self._ensure_open() # may raise DatabaseError
 
         try:
-            stat = self.create_statement(" SELECT [pk] FROM [activity_types]")
-            rs = stat.execute()
-            result = set()
-            for r in rs:
-                result.add(self._get_activity_type_proxy(r["pk"]))
-            return result
+            stat = self.create_statement(" SELECT * FROM [activity_types]")
+            return self._get_primed_proxies(stat.execute(), ActivityType.TYPE_NAME)
         except Exception as ex:
             raise DatabaseError.wrap(ex)
 
@@ -93,13 +115,9 @@ def public_activities(self) -> Set[PublicActivity]:
 
         try:
             stat = self.create_statement(
-                """ SELECT [pk] FROM [activities]
+                """ SELECT * FROM [activities]
                     WHERE [completed] IS NULL AND [fk_owner] IS NULL""")
-            rs = stat.execute()
-            result = set()
-            for r in rs:
-                result.add(self._get_public_activity_proxy(r["pk"]))
-            return result
+            return self._get_primed_proxies(stat.execute(), PublicActivity.TYPE_NAME)
         except Exception as ex:
             raise DatabaseError.wrap(ex)
 
@@ -109,13 +127,9 @@ def all_public_tasks(self) -> Set[PublicTask]:
 
         try:
             stat = self.create_statement(
-                """ SELECT [pk] FROM [activities]
+                """ SELECT * FROM [activities]
                     WHERE [completed] IS NOT NULL AND [fk_owner] IS NULL""")
-            rs = stat.execute()
-            result = set()
-            for r in rs:
-                result.add(self._get_public_task_proxy(r["pk"]))
-            return result
+            return self._get_primed_proxies(stat.execute(), PublicTask.TYPE_NAME)
         except Exception as ex:
             raise DatabaseError.wrap(ex)
 
@@ -125,15 +139,90 @@ def root_public_tasks(self) -> Set[PublicTask]:
 
         try:
             stat = self.create_statement(
-                """ SELECT [pk] FROM [activities]
+                """ SELECT * FROM [activities]
                     WHERE [completed] IS NOT NULL
                       AND [fk_owner] IS NULL
                       AND [fk_parent_task] IS NULL""")
-            rs = stat.execute()
-            result = set()
-            for r in rs:
-                result.add(self._get_public_task_proxy(r["pk"]))
-            return result
+            return self._get_primed_proxies(stat.execute(), PublicTask.TYPE_NAME)
+        except Exception as ex:
+            raise DatabaseError.wrap(ex)
+
+    ##########
+    #   Database - Operations (queries)
+    def count_enabled_administrators(self, excluding: Optional[Union[User, Account]] = None) -> int:
+        self._ensure_open() # may raise DatabaseError
+        assert (excluding is None) or isinstance(excluding, (User, Account))
+
+        if (excluding is not None) and (excluding.database is not self):
+            raise IncompatibleDatabaseObjectError(excluding.type_name)
+        try:
+            #   Flags are inlined (rather than bound) so that the engine
+            #   can use a partial index on enabled administrator accounts;
+            #   OIDs are positive, so 0 excludes nothing
+            stat = self.create_statement(
+                """ SELECT COUNT(*) AS [count]
+                      FROM [accounts]
+                      JOIN [users] ON [users].[pk] = [accounts].[fk_user]
+                     WHERE [accounts].[enabled] = 'Y'
+                       AND [accounts].[is_administrator] = 'Y'
+                       AND [users].[enabled] = 'Y'
+                       AND [users].[pk] <> ?
+                       AND [accounts].[pk] <> ?""")
+            stat.set_int_parameter(0, excluding.oid if isinstance(excluding, User) else 0)
+            stat.set_int_parameter(1, excluding.oid if isinstance(excluding, Account) else 0)
+            return stat.execute()[0]["count", SqlDataType.INTEGER]
+        except Exception as ex:
+            raise DatabaseError.wrap(ex)
+
+    ##########
+    #   Database - Operations (notifications)
+    def enqueue_notification(self, n: DatabaseNotification) -> None:
+        #   An object that has been modified or destroyed must not
+        #   serve its properties from a stale cache
+        if isinstance(n, (DatabaseObjectModifiedNotification, DatabaseObjectDestroyedNotification)):
+            if isinstance(n.object, DatabaseObject) and n.object.database is self:
+                n.object._invalidate_property_cache()
+        Database.enqueue_notification(self, n)
+
+    def enqueue_notification_batch(self, notifications: Iterable[DatabaseNotification]) -> None:
+        notifications = list(notifications)
+        for n in notifications:
+            if isinstance(n, (DatabaseObjectModifiedNotification, DatabaseObjectDestroyedNotification)):
+                if isinstance(n.object, DatabaseObject) and n.object.database is self:
+                    n.object._invalidate_property_cache()
+        Database.enqueue_notification_batch(self, notifications)
+
+    ##########
+    #   Database - Operations (caching)
+    __PREFETCH_CHUNK_SIZE = 256
+
+    def prefetch(self, objects: Iterable[DatabaseObject]) -> None:
+        self._ensure_open() # may raise DatabaseError
+
+        #   Group objects by the table keeping their properties...
+        objects_by_table = dict()   #   table name -> dict(OID -> SqlDatabaseObject)
+        for obj in objects:
+            assert isinstance(obj, DatabaseObject)
+            if (obj.database is not self) or (obj._TABLE_NAME is None):
+                continue
+            objects_by_table.setdefault(obj._TABLE_NAME, dict())[obj.oid] = obj
+        #   ...then fetch each table's rows in fixed-size chunks. The
+        #   last chunk is padded by repeating its last OID, so that
+        #   all chunks of a table share a single SQL template
+        chunk_size = SqlDatabase.__PREFETCH_CHUNK_SIZE
+        try:
+            for (table_name, objects_by_oid) in objects_by_table.items():
+                oids = list(objects_by_oid.keys())
+                for chunk_start in range(0, len(oids), chunk_size):
+                    chunk = oids[chunk_start:chunk_start + chunk_size]
+                    chunk += [chunk[-1]] * (chunk_size - len(chunk))
+                    stat = self.create_statement(
+                        "SELECT * FROM [" + table_name + "] WHERE [pk] IN (" +
+                        ",".join(["?"] * chunk_size) + ")")
+                    for i in range(chunk_size):
+                        stat.set_int_parameter(i, chunk[i])
+                    for r in stat.execute():
+                        objects_by_oid[r["pk"]]._prime_property_cache(r)
         except Exception as ex:
             raise DatabaseError.wrap(ex)
 
@@ -188,6 +277,27 @@ def quote_identifier(self, s: str) -> str:
         assert isinstance(s, str)
         return  self.identifier_opening_quote + s + self.identifier_closing_quote
 
+    def _probe_data_version(self) -> Optional[int]:
+        """
+            Probes the underlying database for a "data version" -
+            a number that changes whenever data is changed in the
+            database by someone else (e.g. another process or
+            connection). Changes made via this SqlDatabase itself
+            need not be reflected.
+            The default implementation returns None, which means
+            that the database engine cannot detect such changes.
+
+            @return:
+                The current data version or None if not supported.
+            @raise DatabaseError:
+                If an error occurs.
+        """
+        return None
+
+    @property
+    def parameter_marker(self) -> str:
+        return "?"  #   as per DB-API "qmark" parameter style
+
     @abstractmethod
     def begin_transaction(self) -> None:
         """
@@ -219,93 +329,121 @@ def rollback_transaction(self) -> None:
         raise NotImplementedError()
 
     @abstractmethod
-    def execute_sql(self, sql: str) -> None:
+    def execute_sql(self, sql: str, parameters: tuple = ()) -> Any:
         """
-            Executes a single SQL statement, ignoring its results.
-            This is useful when e.g. called from execute_script().
-            The SQL script shall use the underlying database engine's
+            Executes a single SQL statement.
+            The SQL statement shall use the underlying database engine's
             syntax, so the preferred way of executing SQL queries and
             commands is by using the create_statement() method to
             create a SqlStatement and then call execute() on that.
 
             @param sql:
-                A single SQL statement.
+                A single SQL statement, with a parameter_marker in
+                place of every parameter.
+            @param parameters:
+                The values of parameters, as produced by bind_parameter(),
+                one per parameter_marker in the "sql", in order.
+            @return:
+                For INSERT, the PK of the inserted row (if known);
+                for SELECT, the SqlRecordSet; for UPDATE and DELETE,
+                the number of affected rows; otherwise None.
             @raise DatabaseError:
                 If an error occurs.
         """
         raise NotImplementedError()
 
+    def execute_sql_many(self, sql: str, parameter_sets: list[tuple]) -> int:
+        """
+            Executes a single SQL statement (other than a SELECT)
+            once for each set of parameters.
+            The SQL statement shall use the underlying database engine's
+            syntax, so the preferred way of executing SQL commands is
+            by using the create_statement() method to create a
+            SqlStatement and then call add_batch() and execute_batch()
+            on that.
+            The default implementation simply calls execute_sql() once
+            per parameter set; database engines that can execute a
+            statement for many parameter sets at once should override it.
+
+            @param sql:
+                A single SQL statement, with a parameter_marker in
+                place of every parameter.
+            @param parameter_sets:
+                The parameter sets, each one a tuple of values as
+                produced by bind_parameter(), one per parameter_marker
+                in the "sql", in order.
+            @return:
+                The total number of affected rows, if known.
+            @raise DatabaseError:
+                If an error occurs.
+        """
+        #   execute_sql() returns a PK, not a row count, for an INSERT
+        is_insert = sql.lstrip()[:6].upper() == "INSERT"
+        result = 0
+        for parameters in parameter_sets:
+            rowcount = self.execute_sql(sql, parameters)    #   may raise DatabaseError
+            if is_insert:
+                result += 1
+            elif isinstance(rowcount, int):
+                result += rowcount
+        return result
+
+    def execute_sql_streaming(self, sql: str, parameters: tuple = (),
+                              chunk_size: int = SqlRecordStream.DEFAULT_CHUNK_SIZE) -> SqlRecordStream:
+        """
+            Executes a single SQL SELECT statement, producing its
+            result as a stream of records fetched in chunks.
+            The SQL statement shall use the underlying database engine's
+            syntax, so the preferred way of executing SQL queries is
+            by using the create_statement() method to create a
+            SqlSelectStatement and then call execute_streaming() on that.
+            The default implementation fetches the entire result
+            up front; database engines that support cursors should
+            override it.
+
+            @param sql:
+                A single SQL SELECT statement, with a parameter_marker
+                in place of every parameter.
+            @param parameters:
+                The values of parameters, as produced by bind_parameter(),
+                one per parameter_marker in the "sql", in order.
+            @param chunk_size:
+                The number of rows to fetch at a time.
+            @return:
+                The stream of records, to be iterated over once.
+            @raise DatabaseError:
+                If an error occurs.
+        """
+        rs = self.execute_sql(sql, parameters)  #   may raise DatabaseError
+        rows = iter(rs.rows)
+        return SqlRecordStream(rs.columns,
+                               lambda n: [row for _, row in zip(range(n), rows)],
+                               chunk_size=chunk_size)
+
     ##########
     #   Operations
-    def execute_script(self, script: str) -> None:
+    def execute_script(self, script: Union[str, TextIO]) -> None:
+        """
+            Executes a SQL script (a sequence of SQL statements
+            separated by ';') within a single transaction.
+            The script is split into statements by SqlScriptSplitter
+            and each statement is executed as soon as it is read,
+            so a script read from a file never needs to be in memory
+            as a whole.
+
+            @param script:
+                The SQL script, either as a string or as a text file
+                to read it from.
+            @raise DatabaseError:
+                If an error occurs; the transaction is then rolled back.
+        """
         self._ensure_open() # may raise DatabaseError
-        assert isinstance(script, str)
-
-        #   First, we must break "script" into individual statements:
-        #   *   Anything from -- to \n is a comment.
-        #   *   Anything from /* to */ is a comment.
-        #   *   Single quotes ', double quotes " and backticks ` all
-        #       denote quoted identifiers/strings; comments within
-        #       these are not recognized as well as other quote types.
-        #   *   Statements are separated by ';'; empty statements
-        #       are ignored.
-        statements = []
-        quote = None
-        scan = 0
-        while scan < len(script):
-            c = script[scan]
-            if (c == "\"") and (quote is None):
-                #   Opening a double-quoted string
-                quote = c
-                scan += 1
-            elif (c == "\"") and (quote == "\""):
-                #   Closing a double-quoted string
-                quote = None
-                scan += 1
-            elif (c == "'") and (quote is None):
-                #   Opening a single-quoted string
-                quote = c
-                scan += 1
-            elif (c == "'") and (quote == "'"):
-                #   Closing a single-quoted string
-                quote = None
-                scan += 1
-            elif (c == "`") and (quote is None):
-                #   Opening a backtick-quoted string
-                quote = c
-                scan += 1
-            elif (c == "`") and (quote == "`"):
-                #   Closing a backtick-quoted string
-                quote = None
-                scan += 1
-            elif (c == "-") and (quote is None) and (scan + 1 < len(script)) and (script[scan+1] == "-"):
-                #   A single-line comment - remove everything until eoln
-                prescan = scan + 2
-                while prescan < len(script) and script[prescan] != "\n":
-                    prescan += 1
-                #   The range [scan..prescan] is a comment - replace with a single space
-                script = script[:scan] + " " + script[prescan + 1:]
-            elif (c == "/") and (quote is None) and (scan + 1 < len(script)) and (script[scan+1] == "*"):
-                #   A single-line comment - remove everything until eoln
-                raise NotImplementedError()
-            elif (c == ";") and (quote is None):
-                #   The part [0..scan) is a statement
-                statement = script[:scan]
-                statements.append(statement.strip())
-                script = script[scan + 1:]
-                scan = 0
-            else:
-                #   Just a character
-                scan += 1
-        statement = script
-        statements.append(statement.strip())
+        assert isinstance(script, str) or hasattr(script, "read")
 
-        #   Now execute all non-empty statements within a single transaction
         self.begin_transaction()    #   may throw DatabaseError
         try:
-            for statement in statements:
-                if len(statement) > 0:
-                    self.create_statement(statement).execute()
+            for statement in SqlScriptSplitter(script):
+                self.create_statement(statement).execute()
             self.commit_transaction()
         except Exception as ex:
             try:
@@ -313,7 +451,29 @@ def execute_script(self, script: str) -> None:
             except:
                 pass#   TODO log
             raise ex
-        pass
+
+    def execute_script_file(self, path: str, encoding: str = "utf-8") -> None:
+        """
+            Executes a SQL script read from the specified file within
+            a single transaction, without loading the whole file into
+            memory (e.g. a large migration or restore script).
+
+            @param path:
+                The path to the SQL script file.
+            @param encoding:
+                The text encoding of the file.
+            @raise DatabaseError:
+                If an error occurs; the transaction is then rolled back.
+        """
+        assert isinstance(path, str)
+        assert isinstance(encoding, str)
+
+        try:
+            script_file = open(path, "r", encoding=encoding)
+        except Exception as ex:
+            raise DatabaseIoError(str(ex)) from ex
+        with script_file:
+            self.execute_script(script_file)
 
     def create_statement(self, sql_template: str) -> SqlStatement:
         """
@@ -328,30 +488,45 @@ def create_statement(self, sql_template: str) -> SqlStatement:
         self._ensure_open() # may raise DatabaseError
         assert isinstance(sql_template, str)
 
-        sql_template = sql_template.strip()
-        #   TODO cache SqlStatements on a per-thread basis for
-        #   future reuse, keyed by sql_template
+        #   Parsing a template is costly, so parsed SqlStatements are
+        #   cached per thread & keyed by sql_template; a cache hit
+        #   only has to clone the parameters
+        statement_cache = self.statement_cache
+        sql_statement = statement_cache.get(sql_template)
+        if sql_statement is not None:
+            return sql_statement
 
-        #   TODO select, insert, delete, update require their own
-        #   subclasses of SqlStatement!
         from .SqlInsertStatement import SqlInsertStatement
         from .SqlSelectStatement import SqlSelectStatement
         from .SqlUpdateStatement import SqlUpdateStatement
         from .SqlDeleteStatement import SqlDeleteStatement
-        
-        if sql_template.upper().startswith("INSERT"):
-            sql_statement = SqlInsertStatement(self, sql_template)  #   may raise DatabaseError
-        elif sql_template.upper().startswith("SELECT"):
-            sql_statement = SqlSelectStatement(self, sql_template)  #   may raise DatabaseError
-        elif sql_template.upper().startswith("UPDATE"):
-            sql_statement = SqlUpdateStatement(self, sql_template)  #   may raise DatabaseError
-        elif sql_template.upper().startswith("DELETE"):
-            sql_statement = SqlDeleteStatement(self, sql_template)  #   may raise DatabaseError
+
+        stripped_sql_template = sql_template.strip()
+        verb = stripped_sql_template[:6].upper()
+        if verb == "INSERT":
+            prototype = SqlInsertStatement(self, stripped_sql_template)  #   may raise DatabaseError
+        elif verb == "SELECT":
+            prototype = SqlSelectStatement(self, stripped_sql_template)  #   may raise DatabaseError
+        elif verb == "UPDATE":
+            prototype = SqlUpdateStatement(self, stripped_sql_template)  #   may raise DatabaseError
+        elif verb == "DELETE":
+            prototype = SqlDeleteStatement(self, stripped_sql_template)  #   may raise DatabaseError
         else:
-            sql_statement = SqlStatement(self, sql_template)    #   may raise DatabaseError
+            prototype = SqlStatement(self, stripped_sql_template)    #   may raise DatabaseError
+        statement_cache.put(sql_template, prototype)
 
         #   Done
-        return sql_statement
+        return prototype._clone()
+
+    @property
+    def statement_cache(self) -> SqlStatementCache:
+        """ The cache of parsed SQL statement templates used by
+            create_statement() on the calling thread. """
+        try:
+            return self.__per_thread.statement_cache
+        except AttributeError:
+            self.__per_thread.statement_cache = SqlStatementCache()
+            return self.__per_thread.statement_cache
 
     def format_parameter(self, type: type, value: Any) -> str:
         if value is None:
@@ -385,6 +560,49 @@ def format_parameter(self, type: type, value: Any) -> str:
         except Exception as ex:
             raise DatabaseError.wrap(ex)
 
+    def bind_parameter(self, type: type, value: Any) -> Any:
+        """
+            Converts a parameter value to the form the underlying
+            database engine binds natively in place of a
+            parameter_marker (as opposed to format_parameter(),
+            which produces an SQL literal to inline).
+
+            @param type:
+                The SqlDataType of the parameter, None to auto-select.
+            @param value:
+                The parameter value, None for NULL.
+            @return:
+                The value to bind.
+            @raise DatabaseError:
+                If an error occurs.
+        """
+        if value is None:
+            return None
+        try:
+            if type is None:
+                #   Auto-select binding (bool is an int, so check it 1st)
+                if isinstance(value, bool):
+                    return "Y" if value else "N"
+                elif isinstance(value, (int, float, str)):
+                    return value
+                else:
+                    raise NotImplementedError()
+            else:
+                #   Bind as the required type
+                match type:
+                    case SqlDataType.INTEGER:
+                        return int(value)
+                    case SqlDataType.REAL:
+                        return float(value)
+                    case SqlDataType.STRING:
+                        return str(value)
+                    case SqlDataType.BOOLEAN:
+                        return "Y" if value else "N"
+                    case _:
+                        raise NotImplementedError()
+        except Exception as ex:
+            raise DatabaseError.wrap(ex)
+
     ##########
     #   Database - Operations (life cycle)
     def create_user(self,
@@ -394,24 +612,10 @@ def create_user(self,
                     ui_locale: Optional[Locale] = None,
                     email_addresses: List[str] = []) -> User:
         self._ensure_open() # may raise DatabaseError
-        assert isinstance(enabled, bool)
-        assert isinstance(real_name, str)
-        assert (inactivity_timeout is None) or isinstance(inactivity_timeout, int)
-        assert ui_locale is None or isinstance(ui_locale, Locale)
-        assert isinstance(email_addresses, list)    #   and all elements are strings
 
         #   Validate parameters (real name is valid, etc.)
-        validator = self.validator
-        if not validator.user.is_valid_enabled(enabled):
-            raise InvalidDatabaseObjectPropertyError(User.TYPE_NAME, User.ENABLED_PROPERTY_NAME, enabled)
-        if not validator.user.is_valid_real_name(real_name):
-            raise InvalidDatabaseObjectPropertyError(User.TYPE_NAME, User.REAL_NAME_PROPERTY_NAME, real_name)
-        if not validator.user.is_valid_inactivity_timeout(inactivity_timeout):
-            raise InvalidDatabaseObjectPropertyError(User.TYPE_NAME, User.INACTIVITY_TIMEOUT_PROPERTY_NAME, inactivity_timeout)
-        if not validator.user.is_valid_ui_locale(ui_locale):
-            raise InvalidDatabaseObjectPropertyError(User.TYPE_NAME, User.UI_LOCALE_PROPERTY_NAME, ui_locale)
-        if not validator.user.is_valid_email_addresses(email_addresses):
-            raise InvalidDatabaseObjectPropertyError(User.TYPE_NAME, User.EMAIL_ADDRESSES_PROPERTY_NAME, email_addresses)
+        self.__validate_new_user(enabled, real_name, inactivity_timeout,
+                                 ui_locale, email_addresses)
 
         #   Make database changes
         try:
@@ -455,15 +659,9 @@ def create_activity_type(self,
                     name: str = None,
                     description: str = None) -> ActivityType:
         self._ensure_open() # may raise DatabaseError
-        assert isinstance(name, str)
-        assert isinstance(description, str)
 
         #   Validate parameters
-        validator = self.validator
-        if not validator.activity_type.is_valid_name(name):
-            raise InvalidDatabaseObjectPropertyError(ActivityType.TYPE_NAME, ActivityType.NAME_PROPERTY_NAME, name)
-        if not validator.activity_type.is_valid_description(description):
-            raise InvalidDatabaseObjectPropertyError(ActivityType.TYPE_NAME, ActivityType.DESCRIPTION_PROPERTY_NAME, description)
+        self.__validate_new_activity_type(name, description)
 
         #   Make database changes
         try:
@@ -508,35 +706,12 @@ def create_public_activity(self,
                     require_comment_on_start: bool = False,
                     require_comment_on_finish: bool = False,
                     full_screen_reminder: bool = False) -> PublicActivity:
-        from .SqlActivityType import SqlActivityType
-
         self._ensure_open() # may raise DatabaseError
-        assert isinstance(name, str)
-        assert isinstance(description, str)
-        assert (activity_type is None) or isinstance(activity_type, SqlActivityType)
-        assert (timeout is None) or isinstance(timeout, int)
-        assert isinstance(require_comment_on_start, bool)
-        assert isinstance(require_comment_on_finish, bool)
-        assert isinstance(full_screen_reminder, bool)
 
         #   Validate parameters
-        validator = self.validator
-        if not validator.activity.is_valid_name(name):
-            raise InvalidDatabaseObjectPropertyError(PublicActivity.TYPE_NAME, PublicActivity.NAME_PROPERTY_NAME, name)
-        if not validator.activity.is_valid_description(description):
-            raise InvalidDatabaseObjectPropertyError(PublicActivity.TYPE_NAME, PublicActivity.DESCRIPTION_PROPERTY_NAME, description)
-        if not validator.activity.is_valid_timeout(timeout):
-            raise InvalidDatabaseObjectPropertyError(PublicActivity.TYPE_NAME, PublicActivity.TIMEOUT_PROPERTY_NAME, timeout)
-        if not validator.activity.is_valid_require_comment_on_start(require_comment_on_start):
-            raise InvalidDatabaseObjectPropertyError(PublicActivity.TYPE_NAME, PublicActivity.REQUIRE_COMMENT_ON_START_PROPERTY_NAME, require_comment_on_start)
-        if not validator.activity.is_valid_require_comment_on_finish(require_comment_on_finish):
-            raise InvalidDatabaseObjectPropertyError(PublicActivity.TYPE_NAME, PublicActivity.REQUIRE_COMMENT_ON_FINISH_PROPERTY_NAME, require_comment_on_finish)
-        if not validator.activity.is_valid_full_screen_reminder(full_screen_reminder):
-            raise InvalidDatabaseObjectPropertyError(PublicActivity.TYPE_NAME, PublicActivity.FULL_SCREEN_REMINDER_PROPERTY_NAME, full_screen_reminder)
-        if activity_type is not None:
-            activity_type._ensure_live()
-            if activity_type.database is not self:
-                raise IncompatibleDatabaseObjectError(activity_type.type_name)
+        self.__validate_new_activity(PublicActivity.TYPE_NAME, name, description, activity_type,
+                                     timeout, require_comment_on_start, require_comment_on_finish,
+                                     full_screen_reminder, None)
 
         #   Make database changes
         try:
@@ -555,7 +730,7 @@ def create_public_activity(self,
                            [require_comment_on_start],[require_comment_on_finish],
                            [full_screen_reminder],[fk_activity_type],
                            [completed], [fk_owner], [fk_parent_task])
-                          VALUES (?,?,?,?,?,?,?,?,?,?.?)""")
+                          VALUES (?,?,?,?,?,?,?,?,?,?,?)""")
             stat2.set_int_parameter(0, public_activity_oid)
             stat2.set_string_parameter(1, name)
             stat2.set_string_parameter(2, description)
@@ -599,38 +774,12 @@ def create_public_task(self,
                     require_comment_on_finish: bool = False,
                     full_screen_reminder: bool = False,
                     completed: bool = False) -> PublicTask:
-        from .SqlActivityType import SqlActivityType
-
         self._ensure_open() # may raise DatabaseError
-        assert isinstance(name, str)
-        assert isinstance(description, str)
-        assert (activity_type is None) or isinstance(activity_type, SqlActivityType)
-        assert (timeout is None) or isinstance(timeout, int)
-        assert isinstance(require_comment_on_start, bool)
-        assert isinstance(require_comment_on_finish, bool)
-        assert isinstance(full_screen_reminder, bool)
-        assert isinstance(completed, bool)
-        
+
         #   Validate parameters
-        validator = self.validator
-        if not validator.activity.is_valid_name(name):
-            raise InvalidDatabaseObjectPropertyError(PublicTask.TYPE_NAME, PublicTask.NAME_PROPERTY_NAME, name)
-        if not validator.activity.is_valid_description(description):
-            raise InvalidDatabaseObjectPropertyError(PublicTask.TYPE_NAME, PublicTask.DESCRIPTION_PROPERTY_NAME, description)
-        if not validator.activity.is_valid_timeout(timeout):
-            raise InvalidDatabaseObjectPropertyError(PublicTask.TYPE_NAME, PublicTask.TIMEOUT_PROPERTY_NAME, timeout)
-        if not validator.activity.is_valid_require_comment_on_start(require_comment_on_start):
-            raise InvalidDatabaseObjectPropertyError(PublicTask.TYPE_NAME, PublicTask.REQUIRE_COMMENT_ON_START_PROPERTY_NAME, require_comment_on_start)
-        if not validator.activity.is_valid_require_comment_on_finish(require_comment_on_finish):
-            raise InvalidDatabaseObjectPropertyError(PublicTask.TYPE_NAME, PublicTask.REQUIRE_COMMENT_ON_FINISH_PROPERTY_NAME, require_comment_on_finish)
-        if not validator.activity.is_valid_full_screen_reminder(full_screen_reminder):
-            raise InvalidDatabaseObjectPropertyError(PublicTask.TYPE_NAME, PublicTask.FULL_SCREEN_REMINDER_PROPERTY_NAME, full_screen_reminder)
-        if not validator.activity.is_valid_task_completed(completed):
-            raise InvalidDatabaseObjectPropertyError(PublicTask.TYPE_NAME, PublicTask.COMPLETED_PROPERTY_NAME, completed)
-        if activity_type is not None:
-            activity_type._ensure_live()
-            if activity_type.database is not self:
-                raise IncompatibleDatabaseObjectError(activity_type.type_name)
+        self.__validate_new_activity(PublicTask.TYPE_NAME, name, description, activity_type,
+                                     timeout, require_comment_on_start, require_comment_on_finish,
+                                     full_screen_reminder, completed)
 
         #   Make database changes
         try:
@@ -684,57 +833,317 @@ def create_public_task(self,
             self.rollback_transaction()
             raise DatabaseError.wrap(ex)
 
+    def create_many(self,
+                    type_name: str,
+                    property_sets: Iterable[dict[str, Any]]) -> list[DatabaseObject]:
+        self._ensure_open() # may raise DatabaseError
+
+        #   Validate ALL property sets before making any database changes
+        try:
+            match type_name:
+                case User.TYPE_NAME:
+                    rows = [self.__validate_new_user(**property_set)
+                            for property_set in property_sets]
+                case ActivityType.TYPE_NAME:
+                    rows = [self.__validate_new_activity_type(**property_set)
+                            for property_set in property_sets]
+                case PublicActivity.TYPE_NAME:
+                    rows = [self.__validate_new_public_activity(**property_set)
+                            for property_set in property_sets]
+                case PublicTask.TYPE_NAME:
+                    rows = [self.__validate_new_public_task(**property_set)
+                            for property_set in property_sets]
+                case _:
+                    assert False, "Cannot create many objects of type " + str(type_name)
+        except Exception as ex:
+            raise DatabaseError.wrap(ex)
+        if len(rows) == 0:
+            return []
+
+        #   Make database changes - all within a single transaction,
+        #   one batch of INSERTs per table
+        try:
+            self.begin_transaction()
+
+            #   Each INSERT reports the PK it has generated on the
+            #   connection that has made it, so there is no need to
+            #   read the new PKs back
+            stat1 = self.create_statement(
+                """INSERT INTO [objects]
+                          ([object_type_name])
+                          VALUES (?)""")
+            oids = []
+            for _ in rows:
+                stat1.set_string_parameter(0, type_name)
+                oids.append(stat1.execute())
+
+            if type_name == User.TYPE_NAME:
+                stat3 = self.create_statement(
+                    """INSERT INTO users
+                              (pk,enabled,real_name,inactivity_timeout,ui_locale,email_addresses)
+                              VALUES (?,?,?,?,?,?)""")
+                for (oid, (enabled, real_name, inactivity_timeout, ui_locale, email_addresses)) in zip(oids, rows):
+                    stat3.set_int_parameter(0, oid)
+                    stat3.set_bool_parameter(1, enabled)
+                    stat3.set_string_parameter(2, real_name)
+                    stat3.set_int_parameter(3, inactivity_timeout)
+                    stat3.set_string_parameter(4, None if ui_locale is None else repr(ui_locale))
+                    stat3.set_string_parameter(5, None if len(email_addresses) == 0 else "\n".join(email_addresses))
+                    stat3.add_batch()
+            elif type_name == ActivityType.TYPE_NAME:
+                stat3 = self.create_statement(
+                    """INSERT INTO [activity_types]
+                              ([pk],[name],[description])
+                              VALUES (?,?,?)""")
+                for (oid, (name, description)) in zip(oids, rows):
+                    stat3.set_int_parameter(0, oid)
+                    stat3.set_string_parameter(1, name)
+                    stat3.set_string_parameter(2, description)
+                    stat3.add_batch()
+            else:
+                stat3 = self.create_statement(
+                    """INSERT INTO [activities]
+                              ([pk],[name],[description],[timeout],
+                               [require_comment_on_start],[require_comment_on_finish],
+                               [full_screen_reminder],[fk_activity_type],
+                               [completed], [fk_owner], [fk_parent_task])
+                              VALUES (?,?,?,?,?,?,?,?,?,?,?)""")
+                for (oid, (name, description, activity_type, timeout,
+                           require_comment_on_start, require_comment_on_finish,
+                           full_screen_reminder, completed)) in zip(oids, rows):
+                    stat3.set_int_parameter(0, oid)
+                    stat3.set_string_parameter(1, name)
+                    stat3.set_string_parameter(2, description)
+                    stat3.set_int_parameter(3, timeout)
+                    stat3.set_bool_parameter(4, require_comment_on_start)
+                    stat3.set_bool_parameter(5, require_comment_on_finish)
+                    stat3.set_bool_parameter(6, full_screen_reminder)
+                    stat3.set_int_parameter(7, None if activity_type is None else activity_type.oid)
+                    stat3.set_bool_parameter(8, completed)
+                    stat3.set_int_parameter(9, None)
+                    stat3.set_int_parameter(10, None)
+                    stat3.add_batch()
+            stat3.execute_batch()
+
+            self.commit_transaction()
+        except Exception as ex:
+            self.rollback_transaction()
+            raise DatabaseError.wrap(ex)
+        objects = self._get_proxies(type_name, oids)
+
+        #   Issue notifications - all in one batch
+        notifications = [DatabaseObjectCreatedNotification(self, obj) for obj in objects]
+        if type_name in (PublicActivity.TYPE_NAME, PublicTask.TYPE_NAME):
+            activity_types = dict.fromkeys(row[2] for row in rows if row[2] is not None)
+            for activity_type in activity_types:
+                notifications.append(
+                    DatabaseObjectModifiedNotification(
+                        self,
+                        activity_type,
+                        ActivityType.ACTIVITIES_ASSOCIATION_NAME))
+        self.enqueue_notification_batch(notifications)
+
+        #   Done
+        return objects
+
+    ##########
+    #   Implementation helpers (validation)
+    def __validate_new_user(self,
+                    enabled: bool = True,
+                    real_name: str = None,  #   MUST specify!
+                    inactivity_timeout: Optional[int] = None,
+                    ui_locale: Optional[Locale] = None,
+                    email_addresses: List[str] = []) -> tuple:
+        #   Raises DatabaseError if the properties of a new User are
+        #   invalid, else returns them as a tuple, in the order of
+        #   the parameters
+        assert isinstance(enabled, bool)
+        assert isinstance(real_name, str)
+        assert (inactivity_timeout is None) or isinstance(inactivity_timeout, int)
+        assert ui_locale is None or isinstance(ui_locale, Locale)
+        assert isinstance(email_addresses, list)    #   and all elements are strings
+
+        validator = self.validator
+        if not validator.user.is_valid_enabled(enabled):
+            raise InvalidDatabaseObjectPropertyError(User.TYPE_NAME, User.ENABLED_PROPERTY_NAME, enabled)
+        if not validator.user.is_valid_real_name(real_name):
+            raise InvalidDatabaseObjectPropertyError(User.TYPE_NAME, User.REAL_NAME_PROPERTY_NAME, real_name)
+        if not validator.user.is_valid_inactivity_timeout(inactivity_timeout):
+            raise InvalidDatabaseObjectPropertyError(User.TYPE_NAME, User.INACTIVITY_TIMEOUT_PROPERTY_NAME, inactivity_timeout)
+        if not validator.user.is_valid_ui_locale(ui_locale):
+            raise InvalidDatabaseObjectPropertyError(User.TYPE_NAME, User.UI_LOCALE_PROPERTY_NAME, ui_locale)
+        if not validator.user.is_valid_email_addresses(email_addresses):
+            raise InvalidDatabaseObjectPropertyError(User.TYPE_NAME, User.EMAIL_ADDRESSES_PROPERTY_NAME, email_addresses)
+        return (enabled, real_name, inactivity_timeout, ui_locale, email_addresses)
+
+    def __validate_new_activity_type(self,
+                    name: str = None,       #   MUST specify!
+                    description: str = None) -> tuple:
+        assert isinstance(name, str)
+        assert isinstance(description, str)
+
+        validator = self.validator
+        if not validator.activity_type.is_valid_name(name):
+            raise InvalidDatabaseObjectPropertyError(ActivityType.TYPE_NAME, ActivityType.NAME_PROPERTY_NAME, name)
+        if not validator.activity_type.is_valid_description(description):
+            raise InvalidDatabaseObjectPropertyError(ActivityType.TYPE_NAME, ActivityType.DESCRIPTION_PROPERTY_NAME, description)
+        return (name, description)
+
+    def __validate_new_public_activity(self,
+                    name: str = None,           #   MUST specify!
+                    description: str = None,    #   MUST specify!
+                    activity_type: Optional[ActivityType] = None,
+                    timeout: Optional[int] = None,
+                    require_comment_on_start: bool = False,
+                    require_comment_on_finish: bool = False,
+                    full_screen_reminder: bool = False) -> tuple:
+        return self.__validate_new_activity(PublicActivity.TYPE_NAME, name, description, activity_type,
+                                            timeout, require_comment_on_start, require_comment_on_finish,
+                                            full_screen_reminder, None)
+
+    def __validate_new_public_task(self,
+                    name: str = None,           #   MUST specify!
+                    description: str = None,    #   MUST specify!
+                    activity_type: Optional[ActivityType] = None,
+                    timeout: Optional[int] = None,
+                    require_comment_on_start: bool = False,
+                    require_comment_on_finish: bool = False,
+                    full_screen_reminder: bool = False,
+                    completed: bool = False) -> tuple:
+        return self.__validate_new_activity(PublicTask.TYPE_NAME, name, description, activity_type,
+                                            timeout, require_comment_on_start, require_comment_on_finish,
+                                            full_screen_reminder, completed)
+
+    def __validate_new_activity(self,
+                    type_name: str,
+                    name: str,
+                    description: str,
+                    activity_type: Optional[ActivityType],
+                    timeout: Optional[int],
+                    require_comment_on_start: bool,
+                    require_comment_on_finish: bool,
+                    full_screen_reminder: bool,
+                    completed: Optional[bool]) -> tuple:
+        #   "completed" is None for activities, bool for tasks
+        from .SqlActivityType import SqlActivityType
+
+        assert isinstance(name, str)
+        assert isinstance(description, str)
+        assert (activity_type is None) or isinstance(activity_type, SqlActivityType)
+        assert (timeout is None) or isinstance(timeout, int)
+        assert isinstance(require_comment_on_start, bool)
+        assert isinstance(require_comment_on_finish, bool)
+        assert isinstance(full_screen_reminder, bool)
+        assert (completed is None) or isinstance(completed, bool)
+
+        validator = self.validator
+        if not validator.activity.is_valid_name(name):
+            raise InvalidDatabaseObjectPropertyError(type_name, Activity.NAME_PROPERTY_NAME, name)
+        if not validator.activity.is_valid_description(description):
+            raise InvalidDatabaseObjectPropertyError(type_name, Activity.DESCRIPTION_PROPERTY_NAME, description)
+        if not validator.activity.is_valid_timeout(timeout):
+            raise InvalidDatabaseObjectPropertyError(type_name, Activity.TIMEOUT_PROPERTY_NAME, timeout)
+        if not validator.activity.is_valid_require_comment_on_start(require_comment_on_start):
+            raise InvalidDatabaseObjectPropertyError(type_name, Activity.REQUIRE_COMMENT_ON_START_PROPERTY_NAME, require_comment_on_start)
+        if not validator.activity.is_valid_require_comment_on_finish(require_comment_on_finish):
+            raise InvalidDatabaseObjectPropertyError(type_name, Activity.REQUIRE_COMMENT_ON_FINISH_PROPERTY_NAME, require_comment_on_finish)
+        if not validator.activity.is_valid_full_screen_reminder(full_screen_reminder):
+            raise InvalidDatabaseObjectPropertyError(type_name, Activity.FULL_SCREEN_REMINDER_PROPERTY_NAME, full_screen_reminder)
+        if (completed is not None) and not validator.activity.is_valid_task_completed(completed):
+            raise InvalidDatabaseObjectPropertyError(type_name, Task.COMPLETED_PROPERTY_NAME, completed)
+        if activity_type is not None:
+            activity_type._ensure_live()
+            if activity_type.database is not self:
+                raise IncompatibleDatabaseObjectError(activity_type.type_name)
+        return (name, description, activity_type, timeout,
+                require_comment_on_start, require_comment_on_finish,
+                full_screen_reminder, completed)
+
     ##########
     #   Implementation helpers (internal use only)
     def _ensure_open(self) -> None:
         if not self.is_open:
             raise DatabaseObjectDeadError("Database")
 
+    __DATA_VERSION_PROBE_INTERVAL_SEC = 1
+
+    @property
+    def _property_cache_generation(self) -> Optional[int]:
+        """ The current "generation" of all property caches of this
+            database's objects; a property cache filled in an earlier
+            generation is stale. None if the database cannot detect
+            changes made elsewhere, in which case property caches
+            have to expire by timeout. """
+        now = time.monotonic()
+        if ((self.__data_version_probed_at is None) or
+            now > self.__data_version_probed_at + SqlDatabase.__DATA_VERSION_PROBE_INTERVAL_SEC):
+            self.__data_version_probed_at = now
+            data_version = self._probe_data_version()   #   may raise DatabaseError
+            if data_version is None:
+                self.__property_cache_generation = None
+            elif data_version != self.__data_version:
+                #   Someone else has changed the database - all caches are stale
+                self.__data_version = data_version
+                self.__property_cache_generation = (self.__property_cache_generation or 0) + 1
+        return self.__property_cache_generation
+
+    def _get_primed_proxies(self, rs: "SqlRecordSet", type_name: str) -> Set["SqlDatabaseObject"]:
+        """
+            Obtains proxies for all rows of a "SELECT *" result set,
+            priming the property cache of each from the same row so
+            that no per-object query is needed afterwards.
+
+            @param rs:
+                The result set of a "SELECT *" from the table that
+                keeps properties of the objects.
+            @param type_name:
+                The TYPE_NAME of the objects' type.
+            @return:
+                The set of proxies, one per row.
+        """
+        rows = list(rs)
+        objects = self._get_proxies(type_name, [r["pk"] for r in rows])
+        for (obj, r) in zip(objects, rows):
+            obj._prime_property_cache(r)
+        return set(objects)
+
+    def _get_proxies(self, type_name: str, oids: Iterable[OID]) -> list["SqlDatabaseObject"]:
+        """
+            Obtains proxies for the specified objects, all of the
+            same type, creating the missing ones in bulk.
+
+            @param type_name:
+                The TYPE_NAME of the objects' type.
+            @param oids:
+                The OIDs of the objects.
+            @return:
+                The list of proxies, in the order of "oids".
+        """
+        return self.__objects.get_many(oids, self.__proxy_classes[type_name])
+
+    @property
+    def identity_map(self) -> SqlObjectIdentityMap:
+        """ The OID -> proxy identity map of this database, e.g.
+            for inspecting its statistics. """
+        return self.__objects
+
     def _get_user_proxy(self, oid: OID) -> User:
-        from .SqlUser import SqlUser
-        obj = self.__objects.get(oid, None)
-        if isinstance(obj, SqlUser):
-            return obj
-        return SqlUser(self, oid)
+        return self.__objects.get(oid, self.__proxy_classes[User.TYPE_NAME])
 
     def _get_account_proxy(self, oid: OID) -> Account:
-        from .SqlAccount import SqlAccount
-        obj = self.__objects.get(oid, None)
-        if isinstance(obj, SqlAccount):
-            return obj
-        return SqlAccount(self, oid)
+        return self.__objects.get(oid, self.__proxy_classes[Account.TYPE_NAME])
 
-    def _get_activity_type_proxy(self, oid: OID) -> User:
-        from .SqlActivityType import SqlActivityType
-        obj = self.__objects.get(oid, None)
-        if isinstance(obj, SqlActivityType):
-            return obj
-        return SqlActivityType(self, oid)
+    def _get_activity_type_proxy(self, oid: OID) -> ActivityType:
+        return self.__objects.get(oid, self.__proxy_classes[ActivityType.TYPE_NAME])
 
-    def _get_public_activity_proxy(self, oid: OID) -> User:
-        from .SqlPublicActivity import SqlPublicActivity
-        obj = self.__objects.get(oid, None)
-        if isinstance(obj, SqlPublicActivity):
-            return obj
-        return SqlPublicActivity(self, oid)
+    def _get_public_activity_proxy(self, oid: OID) -> PublicActivity:
+        return self.__objects.get(oid, self.__proxy_classes[PublicActivity.TYPE_NAME])
 
-    def _get_private_activity_proxy(self, oid: OID) -> User:
-        from .SqlPrivateActivity import SqlPrivateActivity
-        obj = self.__objects.get(oid, None)
-        if isinstance(obj, SqlPrivateActivity):
-            return obj
-        return SqlPrivateActivity(self, oid)
+    def _get_private_activity_proxy(self, oid: OID) -> PrivateActivity:
+        return self.__objects.get(oid, self.__proxy_classes[PrivateActivity.TYPE_NAME])
 
-    def _get_public_task_proxy(self, oid: OID) -> User:
-        from .SqlPublicTask import SqlPublicTask
-        obj = self.__objects.get(oid, None)
-        if isinstance(obj, SqlPublicTask):
-            return obj
-        return SqlPublicTask(self, oid)
+    def _get_public_task_proxy(self, oid: OID) -> PublicTask:
+        return self.__objects.get(oid, self.__proxy_classes[PublicTask.TYPE_NAME])
 
-    def _get_private_task_proxy(self, oid: OID) -> User:
-        from .SqlPrivateTask import SqlPrivateTask
-        obj = self.__objects.get(oid, None)
-        if isinstance(obj, SqlPrivateTask):
-            return obj
-        return SqlPrivateTask(self, oid)
+    def _get_private_task_proxy(self, oid: OID) -> PrivateTask:
+        return self.__objects.get(oid, self.__proxy_classes[PrivateTask.TYPE_NAME])
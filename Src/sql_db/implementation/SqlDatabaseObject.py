@@ -14,6 +14,15 @@
 class SqlDatabaseObject(DatabaseObject):
     """ A generic object residing in an SQL database. """
 
+    __slots__ = (
+            "__db",
+            "__oid",
+            "__live",
+            "__property_cache_expires_at",
+            "__property_cache_generation",
+            "__weakref__",  #   SqlObjectIdentityMap keeps proxies weakly
+        )
+
     ##########
     #   Construction - internal only
     def __init__(self, db: SqlDatabase, oid: OID):
@@ -22,15 +31,16 @@ def __init__(self, db: SqlDatabase, oid: OID):
         assert isinstance(db, SqlDatabase)
         assert isinstance(oid, OID)
 
-        assert not (oid in db._SqlDatabase__objects)
+        #   Proxies are created and registered by the database's
+        #   SqlObjectIdentityMap only
         self.__db = db
-        db._SqlDatabase__objects[oid] = self
 
         self.__oid = oid
         self.__live = True
 
         #   Property cache support
         self.__property_cache_expires_at = None #   properties not cached!
+        self.__property_cache_generation = None #   properties not cached!
 
     ##########
     #   DatabaseObject - Properties
@@ -50,17 +60,71 @@ def oid(self) -> OID:
     #   Property cache support
     __PROPERTY_CACHE_TIMEOUT_SEC = 30
 
+    _TABLE_NAME = None
+    """ The name of the table that keeps properties of this kind of
+        SqlDatabaseObject, one row per object, keyed by [pk]; None if
+        there are no cached properties. """
+
     def _load_property_cache(self) -> None:
-        if ((self.__property_cache_expires_at is None) or
-             time.time() > self.__property_cache_expires_at):
+        generation = self.__db._property_cache_generation
+        if generation is None:
+            #   The database cannot tell when its data changes - the
+            #   best we can do is to expire the cache periodically
+            if ((self.__property_cache_expires_at is None) or
+                 time.time() > self.__property_cache_expires_at):
+                self._reload_property_cache()   #   can raise DatabaseError
+                self.__property_cache_expires_at = time.time() + SqlDatabaseObject.__PROPERTY_CACHE_TIMEOUT_SEC
+        elif self.__property_cache_generation != generation:
+            #   The cache is good until invalidated or until the
+            #   database reports a change made elsewhere
             self._reload_property_cache()   #   can raise DatabaseError
-            self.__property_cache_expires_at = time.time() + SqlDatabaseObject.__PROPERTY_CACHE_TIMEOUT_SEC
+            self.__property_cache_generation = generation
 
     def _reload_property_cache(self) -> None:   #   Can throw DatabaseError
+        if self._TABLE_NAME is None:
+            return  #   Nothing is cached as DatabaseObject level
+        try:
+            stat = self.__db.create_statement(
+                "SELECT * FROM [" + self._TABLE_NAME + "] WHERE [pk] = ?")
+            stat.set_int_parameter(0, self.__oid)
+            rs = stat.execute()
+            assert len(rs) <= 1
+            if len(rs) == 0:
+                #   OOPS! The record is not in the database!
+                self._mark_dead()
+                raise DatabaseObjectDeadError(self.type_name)
+            self._store_property_cache(rs[0])
+        except Exception as ex:
+            raise DatabaseError.wrap(ex)
+
+    def _store_property_cache(self, r: "SqlRecord") -> None:
+        """
+            Fills the property cache of this object from a row of
+            its _TABLE_NAME (typically obtained by a "SELECT *").
+
+            @param r:
+                The table row with this object's properties.
+        """
         pass    #   Nothing is cached as DatabaseObject level
 
+    def _prime_property_cache(self, r: "SqlRecord") -> None:
+        """
+            Fills the property cache of this object from a row of
+            its _TABLE_NAME that has been fetched elsewhere (e.g. by
+            a collection query or SqlDatabase.prefetch()), so that
+            no further query is needed until the cache expires.
+
+            @param r:
+                The table row with this object's properties.
+        """
+        generation = self.__db._property_cache_generation
+        self._store_property_cache(r)
+        self.__property_cache_expires_at = time.time() + SqlDatabaseObject.__PROPERTY_CACHE_TIMEOUT_SEC
+        self.__property_cache_generation = generation
+
     def _invalidate_property_cache(self) -> None:
         self.__property_cache_expires_at = None
+        self.__property_cache_generation = None
 
     ##########
     #   Implementation helpers
@@ -46,7 +46,7 @@ def execute(self) -> Any:
                 If an error occurs (e.g. invalid sql_template syntax, etc.)
         """
         try:
-            return self.database.execute_sql(self.prepared_sql)
+            return self.database.execute_sql(self.native_sql, self.native_parameters)
         except Exception as ex:
             #   TODO log ?
             raise DatabaseError.wrap(ex)
@@ -0,0 +1,189 @@
+""" The OID -> proxy identity map of a SqlDatabase. """
+
+#   Python standard library
+from __future__ import annotations  #   MUST be 1st in a module!
+from typing import final, Iterable
+from weakref import KeyedRef
+import threading
+
+#   Dependencies on other PyTT components
+from db.interface.api import *
+
+##########
+#   Public entities
+@final
+class SqlObjectIdentityMap:
+    """
+        The map that ensures a SqlDatabase has at most one live
+        proxy per OID. Proxies are referenced weakly, so a proxy
+        no longer used elsewhere is garbage collected and dropped
+        from the map.
+        Looking up an existing proxy takes no lock; only creating
+        proxies (and dropping collected ones) is serialized.
+        The statistics are exact for a single thread and may be
+        slightly off when several threads look proxies up at once.
+    """
+
+    ##########
+    #   Construction
+    def __init__(self, db: "SqlDatabase"):
+        """
+            Constructs an empty identity map.
+
+            @param db:
+                The database whose proxies the map will keep.
+        """
+        self.__db = db
+        self.__refs = dict()    #   OID -> KeyedRef(proxy, key=OID)
+        #   Reentrant, as a weakref callback (proxy collected) may
+        #   run while the same thread is creating a proxy
+        self.__guard = threading.RLock()
+
+        self.__hits = 0
+        self.__misses = 0
+        self.__proxies_created = 0
+        self.__proxies_collected = 0
+
+    ##########
+    #   object
+    def __len__(self) -> int:
+        return len(self.__refs)
+
+    ##########
+    #   Properties
+    @property
+    def live_proxies(self) -> int:
+        """ The number of proxies currently in this map. """
+        return len(self.__refs)
+
+    @property
+    def hits(self) -> int:
+        """ The number of lookups that found an existing proxy. """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """ The number of lookups that had to create a proxy. """
+        return self.__misses
+
+    @property
+    def proxies_created(self) -> int:
+        """ The number of proxies this map has created. """
+        return self.__proxies_created
+
+    @property
+    def proxies_collected(self) -> int:
+        """ The number of proxies that were garbage collected and
+            dropped from this map; together with "proxies_created"
+            this shows the proxy churn. """
+        return self.__proxies_collected
+
+    ##########
+    #   Operations
+    def get(self, oid: OID, proxy_class: type) -> "SqlDatabaseObject":
+        """
+            Returns the proxy for the specified OID, creating it if
+            there is no live proxy for it.
+
+            @param oid:
+                The OID of the object.
+            @param proxy_class:
+                The SqlDatabaseObject subclass of the proxy.
+            @return:
+                The proxy.
+            @raise DatabaseError:
+                If the live proxy for the OID is not of the
+                specified class.
+        """
+        ref = self.__refs.get(oid, None)
+        if ref is not None:
+            obj = ref()
+            if (obj is not None) and (obj.__class__ is proxy_class):
+                self.__hits += 1
+                return obj
+        with self.__guard:
+            return self.__create(oid, proxy_class)
+
+    def get_many(self, oids: Iterable[OID], proxy_class: type) -> list["SqlDatabaseObject"]:
+        """
+            Returns the proxies for the specified OIDs, creating
+            those for which there is no live proxy. Equivalent to
+            calling get() for each OID, but the creation of all
+            missing proxies is serialized once.
+
+            @param oids:
+                The OIDs of the objects.
+            @param proxy_class:
+                The SqlDatabaseObject subclass of the proxies.
+            @return:
+                The proxies, in the order of "oids".
+            @raise DatabaseError:
+                If the live proxy for any of the OIDs is not of the
+                specified class.
+        """
+        refs = self.__refs
+        result = []
+        missing = []    #   indices in "result"
+        for oid in oids:
+            ref = refs.get(oid, None)
+            obj = None if ref is None else ref()
+            if (obj is not None) and (obj.__class__ is proxy_class):
+                result.append(obj)
+            else:
+                missing.append(len(result))
+                result.append(oid)
+        self.__hits += len(result) - len(missing)
+        if len(missing) > 0:
+            with self.__guard:
+                for i in missing:
+                    result[i] = self.__create(result[i], proxy_class)
+        return result
+
+    def objects(self) -> list["SqlDatabaseObject"]:
+        """
+            Returns all proxies currently in this map.
+
+            @return:
+                The list of proxies, in no particular order.
+        """
+        result = []
+        for ref in list(self.__refs.values()):
+            obj = ref()
+            if obj is not None:
+                result.append(obj)
+        return result
+
+    def reset_statistics(self) -> None:
+        """ Resets the lookup and churn statistics of this map. """
+        self.__hits = 0
+        self.__misses = 0
+        self.__proxies_created = 0
+        self.__proxies_collected = 0
+
+    ##########
+    #   Implementation helpers
+    def __create(self, oid: OID, proxy_class: type) -> "SqlDatabaseObject":
+        #   Must be called with the guard held; another thread may
+        #   have created the proxy since the unguarded lookup
+        ref = self.__refs.get(oid, None)
+        if ref is not None:
+            obj = ref()
+            if obj is not None:
+                if obj.__class__ is not proxy_class:
+                    #   Never let 2 live proxies stand for the same row
+                    raise DatabaseError("OID " + str(oid) + " is a " + obj.__class__.__name__ +
+                                        ", not a " + proxy_class.__name__)
+                self.__hits += 1
+                return obj
+        self.__misses += 1
+        obj = proxy_class(self.__db, oid)
+        self.__refs[oid] = KeyedRef(obj, self.__on_proxy_collected, oid)
+        self.__proxies_created += 1
+        return obj
+
+    def __on_proxy_collected(self, ref: KeyedRef) -> None:
+        with self.__guard:
+            #   The OID may already map to a newer proxy
+            if self.__refs.get(ref.key, None) is ref:
+                del self.__refs[ref.key]
+            self.__proxies_collected += 1
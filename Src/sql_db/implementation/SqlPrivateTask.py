@@ -9,12 +9,15 @@
 
 #   Internal dependencies on modules within the same component
 from .SqlTask import SqlTask
+from .SqlRecord import SqlRecord
 
 ##########
 #   Public entities
 class SqlPrivateTask(SqlTask, PrivateTask):
     """ A private task in a SQL database. """
 
+    __slots__ = ()
+
     ##########
     #   Constants
     TYPE_NAME = PrivateTask.TYPE_NAME
@@ -47,20 +50,21 @@ def children(self) -> Set[PrivateTask]:
 
         try:
             stat = self.database.create_statement(
-                """SELECT [pk] FROM [activities] WHERE [fk_parent_task] = ?""")
+                """SELECT * FROM [activities] WHERE [fk_parent_task] = ?""")
             stat.set_int_parameter(0, self.oid)
-            rs = stat.execute()
-            result = set()
-            for r in rs:
-                result.add(self.database._get_private_task_proxy(r["pk"]))
-            return result
+            return self.database._get_primed_proxies(stat.execute(), PrivateTask.TYPE_NAME)
         except Exception as ex:
             raise DatabaseError.wrap(ex)
 
+    ##########
+    #   Implementation helpers
+    def _get_task_proxy(self, oid: OID) -> Task:
+        return self.database._get_private_task_proxy(oid)
+
     ##########
     #   Property cache support
-    def _reload_property_cache(self) -> None:
-        SqlActivity._reload_property_cache(self)
+    def _store_property_cache(self, r: SqlRecord) -> None:
+        SqlTask._store_property_cache(self, r)
         assert isinstance(self._completed, bool)
         assert isinstance(self._fk_owner, int)
         assert (self._fk_parent_task is None) or isinstance(self._fk_parent_task, int)
@@ -10,12 +10,15 @@
 from .SqlDatabase import SqlDatabase
 from .SqlDatabaseObject import SqlDatabaseObject
 from .SqlDataType import SqlDataType
+from .SqlRecord import SqlRecord
 
 ##########
 #   Public entities
 class SqlPublicActivity(SqlActivity, PublicActivity):
     """ A public activity residing in an SQL database. """
 
+    __slots__ = ()
+
     ##########
     #   Construction - internal only
     def __init__(self, db: SqlDatabase, oid: OID):
@@ -24,8 +27,8 @@ def __init__(self, db: SqlDatabase, oid: OID):
 
     ##########
     #   Property cache support
-    def _reload_property_cache(self) -> None:
-        SqlActivity._reload_property_cache(self)
+    def _store_property_cache(self, r: SqlRecord) -> None:
+        SqlActivity._store_property_cache(self, r)
         assert self._completed is None
         assert self._fk_owner is None
         assert self._fk_parent_task is None
@@ -13,22 +13,38 @@
 ##########
 #   Public entities
 class SqlRecord:
-    """ A single SQL record (rows) retrieved by a SELECT. """
+    """
+        A single SQL record (rows) retrieved by a SELECT.
+        This is a lightweight view of a raw row tuple; all
+        records of the same result share a single column
+        name -> column index map.
+    """
+
+    __slots__ = ("__column_indices", "__row")
 
     ##########
     #   Construction
-    def __init__(self, rs: "SqlRecordSet", row_number: int, row: tuple) -> None:
-        from .SqlRecordSet import SqlRecordSet
-        assert isinstance(rs, SqlRecordSet)
-        assert isinstance(row_number, int)
+    def __init__(self, column_indices: dict[str, int], row: tuple) -> None:
+        """
+            Constructs the SQL record.
+
+            @param column_indices:
+                The column name -> column index map, shared by all
+                records of the same SqlRecordSet or SqlRecordStream.
+            @param row:
+                The raw row tuple.
+        """
+        assert isinstance(column_indices, dict)
         assert isinstance(row, tuple)
-        
-        self.__rs = rs
-        self.__row_number = row_number
+
+        self.__column_indices = column_indices
         self.__row = row
 
     ##########
     #   object
+    def __len__(self) -> int:
+        return len(self.__row)
+
     def __getitem__(self, key_and_type) -> Any:
         """ Raises ValueError if an error occurs """
         if isinstance(key_and_type, tuple):
@@ -47,7 +63,7 @@ def __getitem__(self, key_and_type) -> Any:
             except Exception as ex:
                 raise DatabaseObjectDoesNotExistError("field", "index", key)
         elif isinstance(key, str):
-            index = self.__rs._SqlRecordSet__get_column_index(key)
+            index = self.__column_indices.get(key, None)
             if index is None:
                 raise DatabaseObjectDoesNotExistError("field", "index", key)
             raw_result = self.__row[index]
@@ -72,4 +88,10 @@ def __getitem__(self, key_and_type) -> Any:
                     raise ValueError()
             case _:
                 raise NotImplementedError()
-                
\ No newline at end of file
+
+    ##########
+    #   Properties
+    @property
+    def row(self) -> tuple:
+        """ The raw row tuple of this record. """
+        return self.__row
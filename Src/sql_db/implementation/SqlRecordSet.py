@@ -2,7 +2,7 @@
 
 #   Python standard library
 from __future__ import annotations  #   MUST be 1st in a module!
-from typing import Optional
+from typing import Optional, Iterator
 from enum import Enum
 
 #   Internal dependencies on modules within the same component
@@ -19,7 +19,7 @@ def __init__(self, columns, rows) -> None:
         
         self.__columns = columns
         self.__rows = rows
-        self.__map_column_names_to_indices = None   # lazily prepared dict()
+        self.__column_indices = None    # lazily prepared dict()
         
     ##########
     #   object
@@ -28,29 +28,30 @@ def __len__(self) -> int:
     
     def __getitem__(self, index: int) -> SqlRecord:
         assert isinstance(index, int)
-        return SqlRecord(self, index, self.__rows[index])
-
-    def __iter__(self) -> SqlRecordSet:
-        class Iterator:
-            def __init__(self, rs):
-                self.__rs = rs
-                self.__current_row_index = 0
-            def __next__(self) -> SqlRecord:
-                if self.__current_row_index < len(self.__rs._SqlRecordSet__rows):
-                    row_number = self.__current_row_index
-                    row = self.__rs._SqlRecordSet__rows[row_number]
-                    self.__current_row_index += 1
-                    return SqlRecord(self.__rs, row_number, row)
-                else:
-                    raise StopIteration
-        return Iterator(self)
+        return SqlRecord(self._column_indices, self.__rows[index])
+
+    def __iter__(self) -> Iterator[SqlRecord]:
+        column_indices = self._column_indices
+        for row in self.__rows:
+            yield SqlRecord(column_indices, row)
+
+    ##########
+    #   Properties
+    @property
+    def columns(self) -> list[str]:
+        """ The names of the columns of this record set, in order. """
+        return self.__columns
+
+    @property
+    def rows(self) -> list[tuple]:
+        """ The raw row tuples of this record set; iterating over
+            these is cheaper than creating a SqlRecord per row. """
+        return self.__rows
 
     ##########
     #   Implementation helpers
-    def __get_column_index(self, column: str) -> Optional[int]:
-        if self.__map_column_names_to_indices is None:
-            self.__map_column_names_to_indices = dict()
-            for i in range(len(self.__columns)):
-                self.__map_column_names_to_indices[self.__columns[i]] = i
-        return self.__map_column_names_to_indices.get(column, None)
-                
\ No newline at end of file
+    @property
+    def _column_indices(self) -> dict[str, int]:
+        if self.__column_indices is None:
+            self.__column_indices = { column: index for index, column in enumerate(self.__columns) }
+        return self.__column_indices
@@ -0,0 +1,158 @@
+""" A forward-only stream of SQL records (rows) retrieved by a SELECT. """
+
+#   Python standard library
+from __future__ import annotations  #   MUST be 1st in a module!
+from typing import Callable, Iterator, Optional
+
+#   Dependencies on other PyTT components
+from db.interface.api import *
+from util.interface.api import *
+
+#   Internal dependencies on modules within the same component
+from .SqlRecord import SqlRecord
+
+##########
+#   Public entities
+class SqlRecordStream(ClassWithConstants):
+    """
+        A forward-only stream of SQL records (rows) retrieved
+        by a SELECT.
+        Rows are fetched from the database engine in chunks as
+        the stream is iterated over, so a stream that is only
+        iterated once needs memory for one chunk only. A stream
+        can only be iterated over ONCE; it holds database engine
+        resources (e.g. a cursor) until exhausted or closed, so
+        callers that may stop early should use it in a "with"
+        statement.
+    """
+
+    ##########
+    #   Constants
+    DEFAULT_CHUNK_SIZE = 256
+    """ The default number of rows fetched from the database
+        engine at a time. """
+
+    ##########
+    #   Construction
+    def __init__(self,
+                 columns: list[str],
+                 fetch_chunk: Callable[[int], list],
+                 close: Optional[Callable[[], None]] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+            Constructs the SQL record stream.
+
+            @param columns:
+                The names of the result columns, in order.
+            @param fetch_chunk:
+                The function that, given the maximum number of rows
+                to fetch, returns a list of up to that many raw row
+                tuples; an empty list means the end of the result.
+            @param close:
+                The function that releases the database engine
+                resources held by the stream, or None if there are
+                none; called exactly once.
+            @param chunk_size:
+                The number of rows to fetch at a time.
+        """
+        assert isinstance(columns, list)
+        assert callable(fetch_chunk)
+        assert (close is None) or callable(close)
+        assert isinstance(chunk_size, int) and chunk_size > 0
+
+        self.__columns = columns
+        self.__column_indices = { column: index for index, column in enumerate(columns) }
+        self.__fetch_chunk = fetch_chunk
+        self.__close = close
+        self.__chunk_size = chunk_size
+        self.__iterated = False
+
+    def __del__(self):
+        #   A stream that was never closed must still release its
+        #   resources. An error doing so is not swallowed: it escapes
+        #   __del__ and Python reports it via sys.unraisablehook.
+        #   The getattr() copes with a partially constructed stream.
+        if getattr(self, "_SqlRecordStream__close", None) is not None:
+            self.close()
+
+    ##########
+    #   object
+    def __iter__(self) -> Iterator[SqlRecord]:
+        assert not self.__iterated, "A SqlRecordStream can only be iterated over once"
+        self.__iterated = True
+        return self.__records()
+
+    ##########
+    #   Context manager
+    def __enter__(self) -> SqlRecordStream:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    ##########
+    #   Properties
+    @property
+    def columns(self) -> list[str]:
+        """ The names of the columns of this record stream, in order. """
+        return self.__columns
+
+    @property
+    def is_closed(self) -> bool:
+        """ True if this stream no longer holds any database
+            engine resources, else False. """
+        return self.__fetch_chunk is None
+
+    ##########
+    #   Operations
+    def close(self) -> None:
+        """
+            Releases the database engine resources held by this
+            stream; no more records will be produced. Has no
+            effect if the stream is already closed.
+
+            @raise DatabaseError:
+                If an error occurs.
+        """
+        self.__fetch_chunk = None
+        close, self.__close = self.__close, None
+        if close is not None:
+            try:
+                close()
+            except Exception as ex:
+                raise DatabaseError.wrap(ex)
+
+    def rows(self) -> Iterator[tuple]:
+        """
+            Iterates over the raw row tuples of this stream, which
+            is cheaper than creating a SqlRecord per row; use the
+            "columns" to find the column indices.
+
+            @return:
+                The iterator over the raw row tuples.
+            @raise DatabaseError:
+                If an error occurs.
+        """
+        assert not self.__iterated, "A SqlRecordStream can only be iterated over once"
+        self.__iterated = True
+        return self.__rows()
+
+    ##########
+    #   Implementation helpers
+    def __rows(self) -> Iterator[tuple]:
+        try:
+            while self.__fetch_chunk is not None:
+                try:
+                    chunk = self.__fetch_chunk(self.__chunk_size)
+                except Exception as ex:
+                    raise DatabaseError.wrap(ex)
+                if len(chunk) == 0:
+                    break
+                yield from chunk
+        finally:
+            self.close()
+
+    def __records(self) -> Iterator[SqlRecord]:
+        column_indices = self.__column_indices
+        for row in self.__rows():
+            yield SqlRecord(column_indices, row)
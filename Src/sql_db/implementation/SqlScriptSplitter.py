@@ -0,0 +1,159 @@
+""" Splits SQL scripts into individual statements. """
+
+#   Python standard library
+from __future__ import annotations  #   MUST be 1st in a module!
+from typing import Iterator, TextIO, Union
+import re
+
+#   Dependencies on other PyTT components
+from util.interface.api import *
+
+##########
+#   Public entities
+class SqlScriptSplitter(ClassWithConstants):
+    """
+        Splits a SQL script into individual statements in a single
+        pass, yielding statements one at a time as the script is
+        read, so a script read from a file never needs to be in
+        memory as a whole.
+        *   Anything from -- to the end of line is a comment.
+        *   Anything from /* to */ is a comment.
+        *   Single quotes ', double quotes ", backticks ` and square
+            brackets [] all denote quoted identifiers/strings;
+            comments and semicolons within these are not recognized.
+        *   Statements are separated by ';'; empty statements
+            are skipped.
+        Comments are replaced with a single space.
+    """
+
+    ##########
+    #   Constants
+    DEFAULT_CHUNK_SIZE = 64 * 1024
+    """ The default number of characters read from a script
+        file at a time. """
+
+    ##########
+    #   Construction
+    def __init__(self, script: Union[str, TextIO], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+            Constructs the SQL script splitter.
+
+            @param script:
+                The SQL script, either as a string or as a text
+                file (or any other object with a read(size) method
+                returning str) to read the script from.
+            @param chunk_size:
+                The number of characters to read from a script
+                file at a time.
+        """
+        assert isinstance(script, str) or hasattr(script, "read")
+        assert isinstance(chunk_size, int) and chunk_size > 0
+
+        self.__script = script
+        self.__chunk_size = chunk_size
+
+    ##########
+    #   object
+    def __iter__(self) -> Iterator[str]:
+        return self.__statements()
+
+    ##########
+    #   Implementation helpers
+    __NORMAL = 0
+    __QUOTED = 1
+    __LINE_COMMENT = 2
+    __BLOCK_COMMENT = 3
+
+    __SPECIAL_CHARACTERS = re.compile(r"['\"`\[;/-]")
+    __CLOSING_QUOTES = { "'": "'", "\"": "\"", "`": "`", "[": "]" }
+
+    def __chunks(self) -> Iterator[tuple[str, bool]]:
+        #   Yields (chunk, is last chunk)
+        if isinstance(self.__script, str):
+            yield (self.__script, True)
+            return
+        chunk = self.__script.read(self.__chunk_size)
+        while True:
+            next_chunk = self.__script.read(self.__chunk_size) if chunk else ""
+            yield (chunk, len(next_chunk) == 0)
+            if len(next_chunk) == 0:
+                return
+            chunk = next_chunk
+
+    def __statements(self) -> Iterator[str]:
+        pieces = [] #   of the statement being scanned
+        state = SqlScriptSplitter.__NORMAL
+        closing_quote = None
+        carry = ""  #   the last character of a chunk, if it may start a 2-character token
+        for (chunk, is_last) in self.__chunks():
+            text = carry + chunk
+            #   Every 2-character token (--, /*, */) can be recognized
+            #   by looking at most 1 character ahead
+            limit = len(text) if is_last else len(text) - 1
+            start = 0   #   of the part of "text" that belongs to the statement
+            scan = 0
+            while scan < limit:
+                if state == SqlScriptSplitter.__NORMAL:
+                    match = SqlScriptSplitter.__SPECIAL_CHARACTERS.search(text, scan, limit)
+                    if match is None:
+                        scan = limit
+                        break
+                    scan = match.start()
+                    c = text[scan]
+                    if c in SqlScriptSplitter.__CLOSING_QUOTES:
+                        state = SqlScriptSplitter.__QUOTED
+                        closing_quote = SqlScriptSplitter.__CLOSING_QUOTES[c]
+                        scan += 1
+                    elif c == ";":
+                        pieces.append(text[start:scan])
+                        statement = "".join(pieces).strip()
+                        if len(statement) > 0:
+                            yield statement
+                        pieces = []
+                        scan += 1
+                        start = scan
+                    elif (c == "-") and (text[scan+1:scan+2] == "-"):
+                        pieces.append(text[start:scan])
+                        pieces.append(" ")
+                        state = SqlScriptSplitter.__LINE_COMMENT
+                        scan += 2
+                    elif (c == "/") and (text[scan+1:scan+2] == "*"):
+                        pieces.append(text[start:scan])
+                        pieces.append(" ")
+                        state = SqlScriptSplitter.__BLOCK_COMMENT
+                        scan += 2
+                    else:
+                        scan += 1
+                elif state == SqlScriptSplitter.__QUOTED:
+                    found = text.find(closing_quote, scan, limit)
+                    if found < 0:
+                        scan = limit
+                        break
+                    state = SqlScriptSplitter.__NORMAL
+                    scan = found + 1
+                elif state == SqlScriptSplitter.__LINE_COMMENT:
+                    found = text.find("\n", scan, limit)
+                    if found < 0:
+                        scan = limit
+                        break
+                    state = SqlScriptSplitter.__NORMAL
+                    scan = found + 1
+                    start = scan
+                else:
+                    found = text.find("*", scan, limit)
+                    if found < 0:
+                        scan = limit
+                        break
+                    if text[found+1:found+2] == "/":
+                        state = SqlScriptSplitter.__NORMAL
+                        scan = found + 2
+                        start = scan
+                    else:
+                        scan = found + 1
+            #   A 2-character token may have taken "scan" past "limit"
+            if state in (SqlScriptSplitter.__NORMAL, SqlScriptSplitter.__QUOTED):
+                pieces.append(text[start:min(scan, limit)])
+            carry = text[max(scan, limit):]
+        statement = "".join(pieces).strip()
+        if len(statement) > 0:
+            yield statement
@@ -11,6 +11,7 @@
 from .SqlDatabase import SqlDatabase
 from .SqlStatement import SqlStatement
 from .SqlRecordSet import SqlRecordSet
+from .SqlRecordStream import SqlRecordStream
 
 ##########
 #   Public entities
@@ -47,7 +48,27 @@ def execute(self) -> SqlRecordSet:
                 If an error occurs (e.g. invalid sql_template syntax, etc.)
         """
         try:
-            return self.database.execute_sql(self.prepared_sql)
+            return self.database.execute_sql(self.native_sql, self.native_parameters)
+        except Exception as ex:
+            #   TODO log ?
+            raise DatabaseError.wrap(ex)
+
+    def execute_streaming(self, chunk_size: int = SqlRecordStream.DEFAULT_CHUNK_SIZE) -> SqlRecordStream:
+        """
+            Executes this SQL SELECT statement, producing its result
+            as a stream of records fetched in chunks, which is
+            preferable to execute() for large results that are
+            iterated over only once.
+
+            @param chunk_size:
+                The number of rows to fetch at a time.
+            @return:
+                The record stream that can be iterated over ONCE.
+            @raise DatabaseError:
+                If an error occurs (e.g. invalid sql_template syntax, etc.)
+        """
+        try:
+            return self.database.execute_sql_streaming(self.native_sql, self.native_parameters, chunk_size)
         except Exception as ex:
             #   TODO log ?
             raise DatabaseError.wrap(ex)
@@ -2,6 +2,7 @@
 from __future__ import annotations  #   MUST be 1st in a module!
 from typing import Optional
 from abc import ABC, abstractmethod
+import copy
 
 #   Dependencies on other PyTT components
 from db.interface.api import *
@@ -36,6 +37,8 @@ def __init__(self, db: "SqlDatabase", sql_template: str):
         self.__db = db
         self.__sql_template = sql_template
         self.__prepared_sql = None
+        self.__native_sql = None
+        self.__batch = []       #   native_parameters tuples recorded by add_batch()
 
         #   Now parse the SQL statement, converting its syntax (e.g.
         #   identifier quoting, etc.) to the database engine-specific
@@ -120,6 +123,27 @@ def prepared_sql(self) -> str:
                     self.__prepared_sql += self.__db.format_parameter(parameter[1], parameter[2])
         return self.__prepared_sql
 
+    @property
+    def native_sql(self) -> str:
+        """ The SQL statement prepared for the underlying SQL database
+            engine, with the engine's native parameter marker in place
+            of every parameter; parameter values are NOT inlined, but
+            are supplied separately by native_parameters. """
+        if self.__native_sql is None:
+            parameter_marker = self.__db.parameter_marker
+            self.__native_sql = "".join(
+                fragment if isinstance(fragment, str) else parameter_marker
+                for fragment in self.__fragments)
+        return self.__native_sql
+
+    @property
+    def native_parameters(self) -> tuple:
+        """ The values of all parameters of this SQL statement, in the
+            order their markers appear in native_sql, converted to the
+            form the underlying SQL database engine can bind directly. """
+        return tuple(self.__db.bind_parameter(parameter[1], parameter[2])
+                     for parameter in self.__parameters)
+
     ##########
     #   Operations
     def execute(self) -> None:
@@ -130,7 +154,35 @@ def execute(self) -> None:
                 If an error occurs (e.g. invalid sql_template syntax, etc.)
         """
         try:
-            self.__db.execute_sql(self.prepared_sql)
+            self.__db.execute_sql(self.native_sql, self.native_parameters)
+        except Exception as ex:
+            #   TODO log ?
+            raise DatabaseError.wrap(ex)
+
+    def add_batch(self) -> None:
+        """
+            Records the current values of all parameters of this
+            SQL statement as one more set of parameters for the
+            next execute_batch().
+        """
+        self.__batch.append(self.native_parameters)
+
+    def execute_batch(self) -> int:
+        """
+            Executes this SQL statement once for each parameter set
+            recorded by add_batch() since the last execute_batch(),
+            as a single request to the database engine where possible,
+            then clears the recorded parameter sets. Any results the
+            statement may produce are ignored.
+
+            @return:
+                The total number of affected rows, if known.
+            @raise DatabaseError:
+                If an error occurs (e.g. invalid sql_template syntax, etc.)
+        """
+        batch, self.__batch = self.__batch, []
+        try:
+            return self.__db.execute_sql_many(self.native_sql, batch)
         except Exception as ex:
             #   TODO log ?
             raise DatabaseError.wrap(ex)
@@ -173,6 +225,21 @@ def set_bool_parameter(self, parameter_ref: [int|str], value: Optional[bool]) ->
 
     ##########
     #   Implementation helpers
+    def _clone(self) -> SqlStatement:
+        """
+            Creates a copy of this SqlStatement that shares the
+            parsed template (which is immutable once parsed), but
+            has its own set of parameters, all initially unbound.
+
+            @return:
+                The copy of this SqlStatement.
+        """
+        clone = copy.copy(self)
+        clone.__parameters = [(parameter[0], None, None) for parameter in self.__parameters]
+        clone.__batch = []
+        clone.__prepared_sql = None
+        return clone
+
     def __parse_quoted_string(self, s: str, scan: int, opening_quote: str, closing_quote: str) -> (str, int):    #   (literal,new scan)
         assert scan < len(s) and s[scan] == opening_quote
         assert (opening_quote == "'" or opening_quote == "\"" or
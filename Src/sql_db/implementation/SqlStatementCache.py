@@ -0,0 +1,107 @@
+""" A bounded LRU cache of parsed SQL statement templates. """
+
+#   Python standard library
+from __future__ import annotations  #   MUST be 1st in a module!
+from typing import final, Optional
+from collections import OrderedDict
+
+#   Dependencies on other PyTT components
+from util.interface.api import *
+
+##########
+#   Public entities
+@final
+class SqlStatementCache(ClassWithConstants):
+    """
+        A bounded LRU cache of parsed SqlStatements, keyed by
+        their SQL templates.
+        Cached SqlStatements are prototypes - they are never
+        handed out directly; instead, callers get a clone that
+        shares the parsed template but has its own parameters.
+        IMPORTANT: This class is NOT thread-safe; a SqlDatabase
+        keeps a separate SqlStatementCache for each thread.
+    """
+
+    ##########
+    #   Constants
+    DEFAULT_CAPACITY = 256
+    """ The default maximum number of cached SQL templates. """
+
+    ##########
+    #   Construction
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+            Constructs an empty SqlStatementCache.
+
+            @param capacity:
+                The maximum number of cached SQL templates.
+        """
+        assert isinstance(capacity, int) and capacity > 0
+
+        self.__capacity = capacity
+        self.__prototypes = OrderedDict()   #   sql_template -> SqlStatement
+        self.__hits = 0
+        self.__misses = 0
+
+    ##########
+    #   object
+    def __len__(self) -> int:
+        return len(self.__prototypes)
+
+    ##########
+    #   Properties
+    @property
+    def capacity(self) -> int:
+        """ The maximum number of cached SQL templates. """
+        return self.__capacity
+
+    @property
+    def hits(self) -> int:
+        """ The number of lookups that found a cached SQL template. """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """ The number of lookups that did not find a cached SQL template. """
+        return self.__misses
+
+    ##########
+    #   Operations
+    def get(self, sql_template: str) -> Optional["SqlStatement"]:
+        """
+            Looks up a parsed SqlStatement for the specified template,
+            marking it as most recently used.
+
+            @param sql_template:
+                The SQL statement template.
+            @return:
+                A fresh clone of the cached SqlStatement, or None
+                if the template is not cached.
+        """
+        prototype = self.__prototypes.get(sql_template, None)
+        if prototype is None:
+            self.__misses += 1
+            return None
+        self.__hits += 1
+        self.__prototypes.move_to_end(sql_template)
+        return prototype._clone()
+
+    def put(self, sql_template: str, prototype: "SqlStatement") -> None:
+        """
+            Records a freshly parsed SqlStatement in this cache,
+            evicting the least recently used one if full.
+
+            @param sql_template:
+                The SQL statement template.
+            @param prototype:
+                The SqlStatement parsed from "sql_template"; must
+                not be handed out to callers afterwards.
+        """
+        self.__prototypes[sql_template] = prototype
+        self.__prototypes.move_to_end(sql_template)
+        while len(self.__prototypes) > self.__capacity:
+            self.__prototypes.popitem(last=False)
+
+    def clear(self) -> None:
+        """ Removes all cached SQL templates (but not the counters). """
+        self.__prototypes.clear()
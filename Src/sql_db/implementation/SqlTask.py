@@ -16,6 +16,8 @@
 class SqlTask(SqlActivity, Task):
     """ A task residing in an SQL database. """
 
+    __slots__ = ()
+
     ##########
     #   Construction - internal only
     def __init__(self, db: SqlDatabase, oid: OID):
@@ -29,11 +31,52 @@ def __init__(self, db: SqlDatabase, oid: OID):
     def destroy(self) -> None:
         self._ensure_live() #   may raise DatabaseException
 
-        #   For tasks, destroy child tasks
-        for child in self.children:
-            child.destroy()
-        #   ...and the rest is up to base implementation
-        SqlActivity.destroy(self)
+        #   For tasks, destroy the entire subtree rooted at this task,
+        #   finding all descendants with a single recursive query
+        #   instead of walking the "children" one task at a time
+        #   TODO Dis-associate from Accounts (as quick pick items)
+        #   TODO Dis-associate from Events
+        #   TODO Destroy associated Works
+        #   TODO Dis-associate from Workloads
+        try:
+            self.database.begin_transaction()
+
+            stat1 = self.database.create_statement(
+                """SELECT [pk] FROM (""" + SqlTask.__SUBTREE_QUERY + """)
+                    ORDER BY [depth] DESC""")
+            stat1.set_int_parameter(0, self.oid)
+            subtree_oids = [r["pk"] for r in stat1.execute()]   #   leaves first
+
+            #   Delete by the OIDs found above, leaves first and
+            #   [activities] before [objects], so that no foreign key
+            #   is ever left dangling. Each chunk is padded by repeating
+            #   its last OID, so that all chunks share a single SQL template
+            chunk_size = SqlTask.__DESTROY_CHUNK_SIZE
+            for chunk_start in range(0, len(subtree_oids), chunk_size):
+                chunk = subtree_oids[chunk_start:chunk_start + chunk_size]
+                chunk += [chunk[-1]] * (chunk_size - len(chunk))
+                for table_name in ("activities", "objects"):
+                    stat2 = self.database.create_statement(
+                        "DELETE FROM [" + table_name + "] WHERE [pk] IN (" +
+                        ",".join(["?"] * chunk_size) + ")")
+                    for i in range(chunk_size):
+                        stat2.set_int_parameter(i, chunk[i])
+                    stat2.execute()
+
+            self.database.commit_transaction()
+        except Exception as ex:
+            self.database.rollback_transaction()
+            raise DatabaseError.wrap(ex)
+
+        #   Mark all destroyed tasks as dead & issue notifications
+        for oid in subtree_oids:
+            task = self if oid == self.oid else self._get_task_proxy(oid)
+            task._mark_dead()
+            self.database.enqueue_notification(
+                DatabaseObjectDestroyedNotification(
+                    self.database,
+                    task))
+        #   Done
 
     ##########
     #   Task - Properties
@@ -75,3 +118,28 @@ def completed(self, new_completed: bool) -> None:
                     Task.COMPLETED_PROPERTY_NAME))
         except Exception as ex:
             raise DatabaseError.wrap(ex)
+
+    ##########
+    #   Implementation helpers
+    __DESTROY_CHUNK_SIZE = 256
+
+    __SUBTREE_QUERY = """WITH RECURSIVE [subtree]([pk],[depth]) AS
+                             (SELECT ?, 0
+                              UNION ALL
+                              SELECT [activities].[pk], [subtree].[depth] + 1
+                                FROM [activities], [subtree]
+                               WHERE [activities].[fk_parent_task] = [subtree].[pk])
+                         SELECT [pk], [depth] FROM [subtree]"""
+
+    def _get_task_proxy(self, oid: OID) -> Task:
+        """
+            Returns the proxy for a task of the same kind (public
+            or private) as this one, e.g. for a descendant of this
+            task.
+
+            @param oid:
+                The OID of the task.
+            @return:
+                The proxy for the task.
+        """
+        raise NotImplementedError()
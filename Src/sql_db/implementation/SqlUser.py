@@ -9,12 +9,25 @@
 from .SqlDatabase import SqlDatabase
 from .SqlDatabaseObject import SqlDatabaseObject
 from .SqlDataType import SqlDataType
+from .SqlRecord import SqlRecord
 
 ##########
 #   Public entities
 class SqlUser(SqlDatabaseObject, User):
     """ A user residing in an SQL database. """
 
+    __slots__ = (   #   Property cache
+            "_enabled",
+            "_real_name",
+            "_inactivity_timeout",
+            "_ui_locale",
+            "_email_addresses",
+        )
+
+    ##########
+    #   Constants
+    _TABLE_NAME = "users"
+
     ##########
     #   Construction - internal only
     def __init__(self, db: SqlDatabase, oid: OID):
@@ -273,13 +286,9 @@ def accounts(self) -> Set[Account]:
 
         try:
             stat = self.database.create_statement(
-                """SELECT [pk] FROM [accounts] WHERE [fk_user] = ?""")
+                """SELECT * FROM [accounts] WHERE [fk_user] = ?""")
             stat.set_int_parameter(0, self.oid)
-            rs = stat.execute()
-            result = set()
-            for r in rs:
-                result.add(self.database._get_account_proxy(r["pk"]))
-            return result
+            return self.database._get_primed_proxies(stat.execute(), Account.TYPE_NAME)
         except Exception as ex:
             raise DatabaseError.wrap(ex)
 
@@ -289,14 +298,10 @@ def private_activities(self) -> Set[PrivateActivity]:
 
         try:
             stat = self.database.create_statement(
-                """SELECT [pk] FROM [activities] 
+                """SELECT * FROM [activities] 
                     WHERE [completed] IS NULL AND [fk_owner] = ?""")
             stat.set_int_parameter(0, self.oid)
-            rs = stat.execute()
-            result = set()
-            for r in rs:
-                result.add(self.database._get_private_activity_proxy(r["pk"]))
-            return result
+            return self.database._get_primed_proxies(stat.execute(), PrivateActivity.TYPE_NAME)
         except Exception as ex:
             raise DatabaseError.wrap(ex)
 
@@ -503,28 +508,14 @@ def create_private_activity(self,
         
     ##########
     #   Property cache support
-    def _reload_property_cache(self) -> None:
-        try:
-            stat = self.database.create_statement(
-                """SELECT * FROM users WHERE pk = ?""")
-            stat.set_int_parameter(0, self.oid)
-            rs = stat.execute()
-            assert len(rs) <= 1
-            if len(rs) == 0:
-                #   OOPS! The record is not in the database!
-                self._mark_dead()
-                raise DatabaseObjectDeadError(User.TYPE_NAME)
-            r = rs[0]
-            self._enabled = r["enabled", SqlDataType.BOOLEAN]
-            self._real_name = r["real_name", SqlDataType.STRING]
-            self._inactivity_timeout = r["inactivity_timeout", SqlDataType.INTEGER]
-            ui_locale_name = r["ui_locale", SqlDataType.STRING]
-            self._ui_locale = None if ui_locale_name is None else Locale.parse(ui_locale_name)
-            email_addresses = r["email_addresses", SqlDataType.STRING]
-            if email_addresses is None:
-                self._email_addresses = []
-            else:
-                self._email_addresses = email_addresses.split("\n")
-        except Exception as ex:
-            raise DatabaseError.wrap(ex)
-
+    def _store_property_cache(self, r: SqlRecord) -> None:
+        self._enabled = r["enabled", SqlDataType.BOOLEAN]
+        self._real_name = r["real_name", SqlDataType.STRING]
+        self._inactivity_timeout = r["inactivity_timeout", SqlDataType.INTEGER]
+        ui_locale_name = r["ui_locale", SqlDataType.STRING]
+        self._ui_locale = None if ui_locale_name is None else Locale.parse(ui_locale_name)
+        email_addresses = r["email_addresses", SqlDataType.STRING]
+        if email_addresses is None:
+            self._email_addresses = []
+        else:
+            self._email_addresses = email_addresses.split("\n")
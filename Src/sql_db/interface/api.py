@@ -8,14 +8,18 @@
 from sql_db.implementation.SqlDataType import *
 from sql_db.implementation.SqlDeleteStatement import *
 from sql_db.implementation.SqlInsertStatement import *
+from sql_db.implementation.SqlObjectIdentityMap import *
 from sql_db.implementation.SqlPrivateActivity import *
 from sql_db.implementation.SqlPrivateTask import *
 from sql_db.implementation.SqlPublicActivity import *
 from sql_db.implementation.SqlPublicTask import *
 from sql_db.implementation.SqlRecord import *
 from sql_db.implementation.SqlRecordSet import *
+from sql_db.implementation.SqlRecordStream import *
+from sql_db.implementation.SqlScriptSplitter import *
 from sql_db.implementation.SqlSelectStatement import *
 from sql_db.implementation.SqlStatement import *
+from sql_db.implementation.SqlStatementCache import *
 from sql_db.implementation.SqlTask import *
 from sql_db.implementation.SqlUpdateStatement import *
 from sql_db.implementation.SqlUser import *
@@ -0,0 +1,97 @@
+""" PyTT SQL proxy memory benchmark.
+
+    Loads many public activities from a scratch SQLite database and
+    reports the memory footprint per proxy (including its primed
+    property cache and its identity map entry) and per SqlRecord:
+
+        python ProxyMemoryBenchmark.py [--objects N]
+"""
+
+#   Python standard library
+from typing import Optional
+import sys
+import os.path
+import gc
+import shutil
+import tempfile
+import tracemalloc
+
+#   Dependencies on other PyTT components.
+#   IMPORTANT: We need to adjust the sys.path to find them!
+if __name__ == "__main__":
+    root_directory = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    sys.path.insert(0, root_directory)
+
+##########
+#   Implementation helpers
+_CREATE_CHUNK_SIZE = 10000
+
+def _create_database(path: str, objects: int) -> None:
+    from db.interface.api import PublicActivity
+    from sqlite_db.interface.api import SqliteDatabaseAddress, SqliteDatabaseType
+
+    db = SqliteDatabaseType.instance.create_database(SqliteDatabaseAddress(path))
+    try:
+        for start in range(0, objects, _CREATE_CHUNK_SIZE):
+            db.create_many(PublicActivity.TYPE_NAME,
+                           [dict(name="Activity " + str(i), description="Benchmark activity " + str(i))
+                            for i in range(start, min(start + _CREATE_CHUNK_SIZE, objects))])
+    finally:
+        db.close()
+
+def _traced_size(function) -> tuple:
+    #   Returns (result of function(), bytes it has left allocated)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start_size = tracemalloc.get_traced_memory()[0]
+        result = function()
+        gc.collect()
+        return (result, tracemalloc.get_traced_memory()[0] - start_size)
+    finally:
+        tracemalloc.stop()
+
+def _instance_size(obj) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+def _run_benchmark(path: str) -> None:
+    from sql_db.interface.api import SqlRecord
+    from sqlite_db.interface.api import SqliteDatabaseAddress, SqliteDatabaseType
+
+    db = SqliteDatabaseType.instance.open_database(SqliteDatabaseAddress(path))
+    try:
+        (activities, proxies_size) = _traced_size(lambda: db.public_activities)
+        sample = next(iter(activities))
+        print("Proxies: %d loaded, %.0f bytes per proxy (%d bytes per instance, %s)" %
+              (len(activities), proxies_size / len(activities), _instance_size(sample),
+               "has __dict__" if hasattr(sample, "__dict__") else "slots only"))
+
+        rs = db.create_statement("SELECT * FROM [activities]").execute()
+        (records, records_size) = _traced_size(lambda: list(rs))
+        print("Records: %d created, %.0f bytes per record (%d bytes per instance, %s)" %
+              (len(records), records_size / len(records), _instance_size(records[0]),
+               "has __dict__" if hasattr(records[0], "__dict__") else "slots only"))
+    finally:
+        db.close()
+
+def _option_value(name: str, default: Optional[str]) -> Optional[str]:
+    if name in sys.argv:
+        i = sys.argv.index(name)
+        if i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+    return default
+
+##########
+#   Benchmark entry point
+if __name__ == "__main__":
+    objects = int(_option_value("--objects", "100000"))
+    scratch_directory = tempfile.mkdtemp(prefix="pytt-benchmark-")
+    try:
+        database_path = os.path.join(scratch_directory, "benchmark.pytt")
+        _create_database(database_path, objects)
+        _run_benchmark(database_path)
+    finally:
+        shutil.rmtree(scratch_directory, ignore_errors=True)
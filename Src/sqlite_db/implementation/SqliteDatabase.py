@@ -2,7 +2,11 @@
 from genericpath import isfile
 import os
 import sqlite3
+import threading
+import pathlib
+import queue
 import traceback
+import hashlib
 
 #   Dependencies on other PyTT components
 from db.interface.api import *
@@ -12,6 +16,7 @@
 from .SqliteDatabaseType import SqliteDatabaseType
 from .SqliteDatabaseAddress import SqliteDatabaseAddress
 from .SqliteDatabaseLock import SqliteDatabaseLock
+from .SqlitePerformanceProfile import SqlitePerformanceProfile
 from ..resources.SqliteDbResources import *
 
 ##########
@@ -19,6 +24,12 @@
 @final
 class SqliteDatabase(SqlDatabase):
 
+    ##########
+    #   Constants
+    SCHEMA_VERSION = 3
+    """ The schema version (PRAGMA user_version) this code expects;
+        databases with a lower version are migrated when opened. """
+
     ##########
     #   Construction
     def __init__(self,
@@ -46,6 +57,14 @@ def __init__(self,
         self.__is_open = True
         self.__validator = Validator()
 
+        #   Performance profile and the read-only connection pool
+        self.__performance_profile = (address.performance_profile or
+                                      SqliteDatabaseType.instance.performance_profile)
+        self.__transaction_thread = None    #   that has begun the open transaction, if known
+        self.__idle_read_connections = queue.LifoQueue()
+        self.__read_connection_count = 0
+        self.__read_pool_guard = threading.Lock()
+
         #   Obtain the lock BEFORE opening a connection
         db_path = address._SqliteDatabaseAddress__path
         lock_path = db_path + ".lock"
@@ -60,15 +79,19 @@ def __init__(self,
             if create_new:
                 if os.path.exists(db_path):
                     raise DatabaseObjectAlreadyExistsError("database", "path", db_path)
-                self.__connection = sqlite3.connect(db_path, isolation_level=None)   # may raise any error, really
+                self.__connection = self.__connect(db_path, False)   # may raise any error, really
                 init_script = SqliteDbResources.string("InitDatabaseScript")
                 self.execute_script(init_script)
             else:
                 if not os.path.isfile(db_path):
                     raise DatabaseObjectDoesNotExistError("database", "path", db_path)
-                self.__connection = sqlite3.connect(db_path, isolation_level=None)   # may raise any error, really
-                validate_script = SqliteDbResources.string("ValidateDatabaseScript")
-                self.execute_script(validate_script)
+                self.__connection = self.__connect(db_path, False)   # may raise any error, really
+                #   Full validation is only needed for a schema that
+                #   has not passed it before
+                if self.__compute_schema_fingerprint() != self.__load_schema_fingerprint():
+                    self.__validate_schema()
+            self.__migrate()
+            self.__save_schema_fingerprint()
         except Exception as ex:
             #TODO kill off print(traceback.format_exc())
             if self.__connection:
@@ -97,12 +120,19 @@ def is_open(self) -> bool:
     def validator(self) -> Validator:
         return self.__validator
 
+    @property
+    def supports_background_reads(self) -> bool:
+        #   Without a read connection pool the main connection is
+        #   confined to the thread that has opened it
+        return self.__performance_profile.read_pool_size > 0
+
     ##########
     #   Database - Operations (general)
     def close(self) -> None:
         if self.__is_open:
             try:
                 self.__lock.close()
+                self.__close_read_connections()
                 self.__connection.close()
             except Exception as ex:
                 raise DatabaseIoError(str(ex)) from ex
@@ -110,12 +140,34 @@ def close(self) -> None:
                 self.__is_open = False
                 SqlDatabase.close(self)
 
+    ##########
+    #   Operations
+    def validate_schema(self) -> None:
+        """
+            Fully validates the structure of this database,
+            regardless of whether its schema has passed validation
+            before. Opening a database only does this when the
+            schema fingerprint differs from that of the last schema
+            that passed validation.
+
+            @raise DatabaseError:
+                If the database structure is invalid or an
+                error occurs.
+        """
+        self._ensure_open() # may raise DatabaseError
+        self.__validate_schema()
+        try:
+            self.__save_schema_fingerprint()
+        except Exception as ex:
+            raise DatabaseError.wrap(ex)
+
     ##########
     #   SqlDatabase - Overridables (database engine - specific)
     def begin_transaction(self) -> None:
         self._ensure_open() # may raise DatabaseError
         try:
             self.__connection.execute("begin")
+            self.__transaction_thread = threading.current_thread()
         except Exception as ex:
             #   TODO log ?
             raise DatabaseError.wrap(ex)
@@ -124,6 +176,7 @@ def commit_transaction(self) -> None:
         self._ensure_open() # may raise DatabaseError
         try:
             self.__connection.execute("commit")
+            self.__transaction_thread = None
         except Exception as ex:
             #   TODO log ?
             raise DatabaseError.wrap(ex)
@@ -132,43 +185,249 @@ def rollback_transaction(self) -> None:
         self._ensure_open() # may raise DatabaseError
         try:
             self.__connection.execute("rollback")
+            self.__transaction_thread = None
         except Exception as ex:
             #   TODO log ?
             raise DatabaseError.wrap(ex)
 
-    def execute_sql(self, sql: str) -> None:
+    def _probe_data_version(self) -> Optional[int]:
+        self._ensure_open() # may raise DatabaseError
+
+        try:
+            #   SQLite changes data_version on every commit made by
+            #   other connections (including other processes), but
+            #   not on commits made via this connection
+            return self.__connection.execute("PRAGMA data_version").fetchone()[0]
+        except Exception as ex:
+            #   TODO log ?
+            raise DatabaseError.wrap(ex)
+
+    def execute_sql(self, sql: str, parameters: tuple = ()) -> Any:
         self._ensure_open() # may raise DatabaseError
         assert isinstance(sql, str)
+        assert isinstance(parameters, tuple)
 
         try:
-            if sql.strip().upper().startswith("INSERT"):
+            #   Parameters are bound by sqlite3 itself, so the SQL text
+            #   stays the same across executions and sqlite3's own
+            #   statement cache can reuse the compiled statement
+            verb = sql.lstrip()[:6].upper()
+            if verb == "INSERT":
                 cur = self.__connection.cursor()
-                cur.execute(sql)
+                cur.execute(sql, parameters)
                 rowid = cur.lastrowid
                 cur.close()
                 return rowid
-            elif sql.strip().upper().startswith("SELECT"):
+            elif verb == "SELECT":
+                if self.__can_use_read_connection():
+                    connection = self.__acquire_read_connection()
+                    try:
+                        cur = connection.cursor()
+                        cur.execute(sql, parameters)
+                        columns = list(map(lambda d: d[0], cur.description))
+                        rows = cur.fetchall()
+                        cur.close()
+                    finally:
+                        self.__release_read_connection(connection)
+                    return SqlRecordSet(columns, rows)
                 cur = self.__connection.cursor()
-                cur.execute(sql)
+                cur.execute(sql, parameters)
                 columns = list(map(lambda d: d[0], cur.description))
                 rows = cur.fetchall()
                 cur.close()
                 return SqlRecordSet(columns, rows)
-            elif sql.strip().upper().startswith("UPDATE"):
+            elif verb == "UPDATE":
                 cur = self.__connection.cursor()
-                cur.execute(sql)
+                cur.execute(sql, parameters)
                 rowcount = cur.rowcount
                 cur.close()
                 return rowcount
-            elif sql.strip().upper().startswith("DELETE"):
+            elif verb == "DELETE":
                 cur = self.__connection.cursor()
-                cur.execute(sql)
+                cur.execute(sql, parameters)
                 rowcount = cur.rowcount
                 cur.close()
                 return rowcount
             else:
-                self.__connection.execute(sql)
+                self.__connection.execute(sql, parameters)
+        except Exception as ex:
+            #   TODO log ?
+            raise DatabaseError.wrap(ex)
+
+    def execute_sql_many(self, sql: str, parameter_sets: list[tuple]) -> int:
+        self._ensure_open() # may raise DatabaseError
+        assert isinstance(sql, str)
+        assert isinstance(parameter_sets, list)
+
+        try:
+            cur = self.__connection.cursor()
+            cur.executemany(sql, parameter_sets)
+            rowcount = cur.rowcount
+            cur.close()
+            return rowcount
+        except Exception as ex:
+            #   TODO log ?
+            raise DatabaseError.wrap(ex)
+
+    def execute_sql_streaming(self, sql: str, parameters: tuple = (),
+                              chunk_size: int = SqlRecordStream.DEFAULT_CHUNK_SIZE) -> SqlRecordStream:
+        self._ensure_open() # may raise DatabaseError
+        assert isinstance(sql, str)
+        assert isinstance(parameters, tuple)
+
+        try:
+            #   A pooled connection, if used, stays with the stream
+            #   until the latter is closed
+            if self.__can_use_read_connection():
+                connection = self.__acquire_read_connection()
+                release = lambda: self.__release_read_connection(connection)
+            else:
+                connection = self.__connection
+                release = None
+            try:
+                cur = connection.cursor()
+                cur.arraysize = chunk_size
+                cur.execute(sql, parameters)
+                columns = list(map(lambda d: d[0], cur.description))
+            except Exception:
+                if release is not None:
+                    release()
+                raise
+            def close():
+                try:
+                    cur.close()
+                finally:
+                    if release is not None:
+                        release()
+            return SqlRecordStream(columns, cur.fetchmany, close, chunk_size)
         except Exception as ex:
             #   TODO log ?
             raise DatabaseError.wrap(ex)
 
+    ##########
+    #   Implementation helpers
+    def __migrate(self) -> None:
+        #   Brings the database schema up to SCHEMA_VERSION by running
+        #   "MigrateDatabase<N>Script" for each missing version N;
+        #   each script is run in its own transaction and ends by
+        #   setting PRAGMA user_version = N, so an interrupted
+        #   migration is simply resumed on the next open.
+        version = self.__connection.execute("PRAGMA user_version").fetchone()[0]
+        if version > SqliteDatabase.SCHEMA_VERSION:
+            raise DatabaseIoError("Database schema version " + str(version) +
+                                  " is newer than the supported " +
+                                  str(SqliteDatabase.SCHEMA_VERSION))
+        while version < SqliteDatabase.SCHEMA_VERSION:
+            version += 1
+            migrate_script = SqliteDbResources.string("MigrateDatabase" + str(version) + "Script")
+            self.execute_script(migrate_script)
+
+    def __validate_schema(self) -> None:
+        validate_script = SqliteDbResources.string("ValidateDatabaseScript")
+        self.execute_script(validate_script)
+
+    def __compute_schema_fingerprint(self) -> str:
+        #   The schema is fully described by sqlite_master, whose
+        #   size does not depend on the amount of data in the database
+        rows = self.__connection.execute(
+            "SELECT [type], [name], [tbl_name], [sql] FROM [sqlite_master] ORDER BY [type], [name]").fetchall()
+        return hashlib.sha256(repr(rows).encode("utf-8")).hexdigest()
+
+    def __load_schema_fingerprint(self) -> Optional[str]:
+        try:
+            row = self.__connection.execute("SELECT [fingerprint] FROM [schema_fingerprint]").fetchone()
+        except sqlite3.OperationalError:
+            return None #   schema version < 3
+        return None if row is None else row[0]
+
+    def __save_schema_fingerprint(self) -> None:
+        #   Called once the current schema is known to be valid
+        fingerprint = self.__compute_schema_fingerprint()
+        if fingerprint != self.__load_schema_fingerprint():
+            self.__connection.execute("begin")
+            try:
+                self.__connection.execute("DELETE FROM [schema_fingerprint]")
+                self.__connection.execute("INSERT INTO [schema_fingerprint]([fingerprint]) VALUES (?)", (fingerprint,))
+                self.__connection.execute("commit")
+            except Exception:
+                self.__connection.execute("rollback")
+                raise
+
+    def __connect(self, db_path: str, read_only: bool) -> sqlite3.Connection:
+        #   Opens a connection to the database and applies the
+        #   performance profile to it. With a read connection pool
+        #   the main connection may be used (serially) by any thread,
+        #   e.g. to probe the data version for a background reader.
+        profile = self.__performance_profile
+        if read_only:
+            connection = sqlite3.connect(pathlib.Path(db_path).as_uri() + "?mode=ro",
+                                         uri=True, isolation_level=None,
+                                         check_same_thread=False)
+        else:
+            connection = sqlite3.connect(db_path, isolation_level=None,
+                                         check_same_thread=(profile.read_pool_size == 0))
+        try:
+            if (profile.journal_mode is not None) and not read_only:
+                #   The journal mode is persistent, so readers inherit it
+                connection.execute("PRAGMA journal_mode=" + profile.journal_mode)
+            if profile.synchronous is not None:
+                connection.execute("PRAGMA synchronous=" + profile.synchronous)
+            if profile.cache_size is not None:
+                connection.execute("PRAGMA cache_size=" + str(profile.cache_size))
+            if profile.mmap_size is not None:
+                connection.execute("PRAGMA mmap_size=" + str(profile.mmap_size))
+        except Exception:
+            connection.close()
+            raise
+        return connection
+
+    def __can_use_read_connection(self) -> bool:
+        #   Reads made by the thread that has begun the open
+        #   transaction (whichever thread that is) must see its
+        #   uncommitted changes, so only go through the main
+        #   connection; everyone else reads the last committed
+        #   state through a pooled connection, which in WAL mode
+        #   does not block (and is not blocked by) the writer.
+        #   If it is not known which thread has begun the open
+        #   transaction (e.g. it is still being begun or ended, or
+        #   was begun internally), all reads use the main connection.
+        if self.__performance_profile.read_pool_size == 0:
+            return False
+        if not self.__connection.in_transaction:
+            return True
+        transaction_thread = self.__transaction_thread
+        return (transaction_thread is not None) and (threading.current_thread() is not transaction_thread)
+
+    def __acquire_read_connection(self) -> sqlite3.Connection:
+        try:
+            return self.__idle_read_connections.get_nowait()
+        except queue.Empty:
+            pass
+        with self.__read_pool_guard:
+            can_grow = self.__read_connection_count < self.__performance_profile.read_pool_size
+            if can_grow:
+                self.__read_connection_count += 1
+        if not can_grow:
+            #   The pool is exhausted - wait for a connection to be released
+            return self.__idle_read_connections.get()
+        try:
+            return self.__connect(self.__address._SqliteDatabaseAddress__path, True)
+        except Exception:
+            with self.__read_pool_guard:
+                self.__read_connection_count -= 1
+            raise
+
+    def __release_read_connection(self, connection: sqlite3.Connection) -> None:
+        self.__idle_read_connections.put(connection)
+        if not self.__is_open:
+            #   Lost a race with close()
+            self.__close_read_connections()
+
+    def __close_read_connections(self) -> None:
+        #   Connections currently in use are closed when released
+        while True:
+            try:
+                connection = self.__idle_read_connections.get_nowait()
+            except queue.Empty:
+                break
+            connection.close()
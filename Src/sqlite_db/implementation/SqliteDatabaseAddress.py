@@ -4,15 +4,37 @@
 #   Dependencies on other PyTT components
 from db.interface.api import *
 
+#   Internal dependencies on modules within the same component
+from .SqlitePerformanceProfile import SqlitePerformanceProfile
+
 ##########
 #   Public entities
 class SqliteDatabaseAddress(DatabaseAddress):
-    """ An address of a SQLite database is its full path. """
+    """
+        An address of a SQLite database is its full path.
+        An address may also carry the performance profile to
+        use when the database is opened; this is NOT a part of
+        the address' identity or external form.
+    """
 
     ##########
     #   Construction
-    def __init__(self, path: str):
+    def __init__(self, path: str,
+                 performance_profile: Optional[SqlitePerformanceProfile] = None):
+        """
+            Constructs the SQLite database address.
+
+            @param path:
+                The path to the database file.
+            @param performance_profile:
+                The performance profile to use for the database,
+                or None to use the SqliteDatabaseType's default one.
+        """
+        assert ((performance_profile is None) or
+                isinstance(performance_profile, SqlitePerformanceProfile))
+
         self.__path = os.path.abspath(path)
+        self.__performance_profile = performance_profile
 
     ##########
     #   object
@@ -52,3 +74,11 @@ def display_form(self) -> str:
     def external_form(self) -> str:
         """ The external (re-parsable) form of this database address. """
         return self.__path
+
+    ##########
+    #   Properties
+    @property
+    def performance_profile(self) -> Optional[SqlitePerformanceProfile]:
+        """ The performance profile to use for the database, or None
+            to use the SqliteDatabaseType's default one. """
+        return self.__performance_profile
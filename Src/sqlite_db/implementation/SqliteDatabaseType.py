@@ -12,6 +12,7 @@
 
 #   Internal dependencies on modules within the same component
 from .SqliteDatabaseAddress import SqliteDatabaseAddress
+from .SqlitePerformanceProfile import SqlitePerformanceProfile
 
 ##########
 #   Public entities
@@ -35,6 +36,8 @@ def __init__(self):
         assert SqliteDatabaseType.__instance_acquisition_in_progress, "Use SqliteDatabaseType.instance() instead"
         DatabaseType.__init__(self)
 
+        self.__performance_profile = SqlitePerformanceProfile.standard
+
     @staticproperty
     def instance() -> SqliteDatabaseType:
         """
@@ -60,6 +63,20 @@ def mnemonic(self) -> str:
     def display_name(self) -> str:
         return 'SQLite'
 
+    ##########
+    #   Properties
+    @property
+    def performance_profile(self) -> SqlitePerformanceProfile:
+        """ The performance profile used for SQLite databases
+            whose addresses do not specify one explicitly;
+            applies to databases created or opened afterwards. """
+        return self.__performance_profile
+
+    @performance_profile.setter
+    def performance_profile(self, new_performance_profile: SqlitePerformanceProfile) -> None:
+        assert isinstance(new_performance_profile, SqlitePerformanceProfile)
+        self.__performance_profile = new_performance_profile
+
     ##########
     #   DatabaseType - Database address handling
     def parse_database_address(self, external_form: str) -> DatabaseAddress:
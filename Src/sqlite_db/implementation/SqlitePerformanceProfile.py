@@ -0,0 +1,140 @@
+#   Python standard library
+from __future__ import annotations  #   MUST be 1st in a module!
+from typing import final, Optional
+
+#   Dependencies on other PyTT components
+from util.interface.api import *
+
+##########
+#   Public entities
+@final
+class SqlitePerformanceProfile:
+    """
+        An immutable set of SQLite engine settings that a
+        SqliteDatabase applies to its connections.
+        The "standard" profile leaves all SQLite defaults intact
+        (rollback journal, full fsync on every commit, a single
+        connection); other profiles must be opted into explicitly.
+    """
+
+    ##########
+    #   Construction
+    def __init__(self,
+                 journal_mode: Optional[str] = None,
+                 synchronous: Optional[str] = None,
+                 cache_size: Optional[int] = None,
+                 mmap_size: Optional[int] = None,
+                 read_pool_size: int = 0):
+        """
+            Constructs the performance profile.
+
+            @param journal_mode:
+                The SQLite journal mode (e.g. "WAL") or None to
+                keep the one recorded in the database.
+            @param synchronous:
+                The SQLite "synchronous" setting (one of "OFF",
+                "NORMAL", "FULL" or "EXTRA") or None for the
+                SQLite default.
+            @param cache_size:
+                The SQLite page cache size (positive = pages,
+                negative = KiB) or None for the SQLite default.
+            @param mmap_size:
+                The maximum number of bytes of the database file
+                to memory-map, or None for the SQLite default.
+            @param read_pool_size:
+                The maximum number of additional read-only
+                connections used to run SELECTs in parallel with
+                writes; 0 to run everything via a single connection.
+                Only effective in "WAL" journal mode.
+        """
+        assert (journal_mode is None) or isinstance(journal_mode, str)
+        assert (synchronous is None) or (synchronous.upper() in ["OFF", "NORMAL", "FULL", "EXTRA"])
+        assert (cache_size is None) or isinstance(cache_size, int)
+        assert (mmap_size is None) or (isinstance(mmap_size, int) and mmap_size >= 0)
+        assert isinstance(read_pool_size, int) and read_pool_size >= 0
+
+        self.__journal_mode = None if journal_mode is None else journal_mode.upper()
+        self.__synchronous = None if synchronous is None else synchronous.upper()
+        self.__cache_size = cache_size
+        self.__mmap_size = mmap_size
+        self.__read_pool_size = read_pool_size
+
+    ##########
+    #   object
+    def __hash__(self) -> int:
+        return hash(self.__key)
+
+    def __eq__(self, op2) -> bool:
+        if isinstance(op2, SqlitePerformanceProfile):
+            return self.__key == op2.__key
+        return False
+
+    def __ne__(self, op2) -> bool:
+        return not self.__eq__(op2)
+
+    def __repr__(self) -> str:
+        return ("SqlitePerformanceProfile(journal_mode=" + repr(self.__journal_mode) +
+                ", synchronous=" + repr(self.__synchronous) +
+                ", cache_size=" + repr(self.__cache_size) +
+                ", mmap_size=" + repr(self.__mmap_size) +
+                ", read_pool_size=" + repr(self.__read_pool_size) + ")")
+
+    ##########
+    #   Predefined profiles
+    @staticproperty
+    def standard() -> SqlitePerformanceProfile:
+        """ The profile that keeps all SQLite defaults. """
+        return SqlitePerformanceProfile()
+
+    @staticproperty
+    def fast() -> SqlitePerformanceProfile:
+        """
+            The profile that uses WAL journaling with "NORMAL"
+            synchronization (durable across application crashes,
+            but the last commits may be lost on a power failure),
+            a 16MiB page cache, 64MiB of memory-mapped I/O and up
+            to 4 read-only connections for parallel readers.
+        """
+        return SqlitePerformanceProfile(journal_mode="WAL",
+                                        synchronous="NORMAL",
+                                        cache_size=-16 * 1024,
+                                        mmap_size=64 * 1024 * 1024,
+                                        read_pool_size=4)
+
+    ##########
+    #   Properties
+    @property
+    def journal_mode(self) -> Optional[str]:
+        """ The SQLite journal mode, or None to keep the one recorded
+            in the database. """
+        return self.__journal_mode
+
+    @property
+    def synchronous(self) -> Optional[str]:
+        """ The SQLite "synchronous" setting, or None for the SQLite default. """
+        return self.__synchronous
+
+    @property
+    def cache_size(self) -> Optional[int]:
+        """ The SQLite page cache size (positive = pages, negative = KiB),
+            or None for the SQLite default. """
+        return self.__cache_size
+
+    @property
+    def mmap_size(self) -> Optional[int]:
+        """ The maximum number of bytes of the database file to
+            memory-map, or None for the SQLite default. """
+        return self.__mmap_size
+
+    @property
+    def read_pool_size(self) -> int:
+        """ The maximum number of additional read-only connections,
+            used only when the journal mode is "WAL". """
+        return self.__read_pool_size if self.__journal_mode == "WAL" else 0
+
+    ##########
+    #   Implementation helpers
+    @property
+    def __key(self) -> tuple:
+        return (self.__journal_mode, self.__synchronous,
+                self.__cache_size, self.__mmap_size, self.__read_pool_size)
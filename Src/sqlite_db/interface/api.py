@@ -6,5 +6,6 @@
 from sqlite_db.implementation.SqliteDatabaseAddress import *
 from sqlite_db.implementation.SqliteDatabaseLock import *
 from sqlite_db.implementation.SqliteDatabaseType import *
+from sqlite_db.implementation.SqlitePerformanceProfile import *
 
 from sqlite_db.resources.SqliteDbResources import *
@@ -0,0 +1,35 @@
+--  Schema version 1: secondary indexes.
+--  Partial indexes only cover the rows the corresponding queries
+--  can ever select, so they stay small and cheap to maintain.
+
+CREATE INDEX IF NOT EXISTS [accounts_by_user]
+    ON [accounts]([fk_user]);
+
+CREATE INDEX IF NOT EXISTS [activities_by_owner]
+    ON [activities]([fk_owner])
+    WHERE [fk_owner] IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS [activities_by_parent_task]
+    ON [activities]([fk_parent_task])
+    WHERE [fk_parent_task] IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS [activities_by_activity_type]
+    ON [activities]([fk_activity_type])
+    WHERE [fk_activity_type] IS NOT NULL;
+
+--  Public activities: [completed] IS NULL AND [fk_owner] IS NULL
+CREATE INDEX IF NOT EXISTS [public_activities]
+    ON [activities]([pk])
+    WHERE [completed] IS NULL AND [fk_owner] IS NULL;
+
+--  All public tasks: [completed] IS NOT NULL AND [fk_owner] IS NULL
+CREATE INDEX IF NOT EXISTS [public_tasks]
+    ON [activities]([pk])
+    WHERE [completed] IS NOT NULL AND [fk_owner] IS NULL;
+
+--  Root public tasks: ...and [fk_parent_task] IS NULL
+CREATE INDEX IF NOT EXISTS [root_public_tasks]
+    ON [activities]([pk])
+    WHERE [completed] IS NOT NULL AND [fk_owner] IS NULL AND [fk_parent_task] IS NULL;
+
+PRAGMA user_version = 1;
@@ -0,0 +1,8 @@
+--  Schema version 2: enabled administrator accounts,
+--  as counted by count_enabled_administrators().
+
+CREATE INDEX IF NOT EXISTS [enabled_administrator_accounts]
+    ON [accounts]([fk_user])
+    WHERE [enabled] = 'Y' AND [is_administrator] = 'Y';
+
+PRAGMA user_version = 2;
@@ -0,0 +1,10 @@
+--  Schema version 3: the fingerprint of the last schema that
+--  passed full validation, so that opening the database only
+--  needs to re-validate the schema when it has changed.
+
+CREATE TABLE IF NOT EXISTS [schema_fingerprint]
+(
+    [fingerprint]   CHAR(64) NOT NULL
+);
+
+PRAGMA user_version = 3;
@@ -1,17 +1,21 @@
+--  Each SELECT ... LIMIT 0 fails to compile if a column is missing,
+--  without reading any rows; each INSERT fails the CHECK if a
+--  column count or type is not as expected.
+
 CREATE TEMP TABLE [constraints]
 (
     [condition] INTEGER NOT NULL CHECK([condition] = 0)
 );
 
 
-SELECT [pk], [object_type_name] FROM [objects];
+SELECT [pk], [object_type_name] FROM [objects] LIMIT 0;
 INSERT INTO [constraints] SELECT COUNT(NAME)-2 FROM PRAGMA_TABLE_INFO('objects');
 INSERT INTO [constraints] SELECT COUNT(*)-1 FROM PRAGMA_TABLE_INFO('objects') WHERE NAME='pk' AND type='INTEGER';
 INSERT INTO [constraints] SELECT COUNT(*)-1 FROM PRAGMA_TABLE_INFO('objects') WHERE NAME='object_type_name'AND type='VARCHAR(32)';
 
 
 SELECT [pk], [enabled], [real_name], [inactivity_timeout], 
-       [ui_locale], [email_addresses] FROM [users];
+       [ui_locale], [email_addresses] FROM [users] LIMIT 0;
 INSERT INTO [constraints] SELECT COUNT(NAME)-6 FROM PRAGMA_TABLE_INFO('users');
 INSERT INTO [constraints] SELECT COUNT(*)-1 FROM PRAGMA_TABLE_INFO('users') WHERE NAME='pk' AND type='INTEGER';
 INSERT INTO [constraints] SELECT COUNT(*)-1 FROM PRAGMA_TABLE_INFO('users') WHERE NAME='enabled' AND type='CHAR(1)';
@@ -36,7 +40,7 @@ SELECT [pk], [enabled], [login], [password_hash],
        [can_generate_reports],
        [can_backup_and_restore],
        [email_addresses],
-       [fk_user] FROM [accounts];
+       [fk_user] FROM [accounts] LIMIT 0;
 INSERT INTO [constraints] SELECT COUNT(NAME)-19 FROM PRAGMA_TABLE_INFO('accounts');
 INSERT INTO [constraints] SELECT COUNT(*)-1 FROM PRAGMA_TABLE_INFO('accounts') WHERE NAME='pk' AND type='INTEGER';
 INSERT INTO [constraints] SELECT COUNT(*)-1 FROM PRAGMA_TABLE_INFO('accounts') WHERE NAME='enabled' AND type='CHAR(1)';
@@ -59,7 +63,7 @@ INSERT INTO [constraints] SELECT COUNT(*)-1 FROM PRAGMA_TABLE_INFO('accounts') W
 INSERT INTO [constraints] SELECT COUNT(*)-1 FROM PRAGMA_TABLE_INFO('accounts') WHERE NAME='fk_user' AND type='INTEGER';
 
 
-SELECT [pk], [name], [description] FROM [activity_types];
+SELECT [pk], [name], [description] FROM [activity_types] LIMIT 0;
 INSERT INTO [constraints] SELECT COUNT(NAME)-3 FROM PRAGMA_TABLE_INFO('activity_types');
 INSERT INTO [constraints] SELECT COUNT(*)-1 FROM PRAGMA_TABLE_INFO('activity_types') WHERE NAME='pk' AND type='INTEGER';
 INSERT INTO [constraints] SELECT COUNT(*)-1 FROM PRAGMA_TABLE_INFO('activity_types') WHERE NAME='name' AND type='VARCHAR(128)';
@@ -69,7 +73,7 @@ INSERT INTO [constraints] SELECT COUNT(*)-1 FROM PRAGMA_TABLE_INFO('activity_typ
 SELECT [pk], [name], [description], [timeout],
        [require_comment_on_start], [require_comment_on_finish], 
        [full_screen_reminder], [fk_activity_type],
-       [completed], [fk_owner], [fk_parent_task] FROM [activities];
+       [completed], [fk_owner], [fk_parent_task] FROM [activities] LIMIT 0;
 INSERT INTO [constraints] SELECT COUNT(NAME)-11 FROM PRAGMA_TABLE_INFO('activities');
 INSERT INTO [constraints] SELECT COUNT(*)-1 FROM PRAGMA_TABLE_INFO('activities') WHERE NAME='pk' AND type='INTEGER';
 INSERT INTO [constraints] SELECT COUNT(*)-1 FROM PRAGMA_TABLE_INFO('activities') WHERE NAME='name' AND type='VARCHAR(128)';
@@ -12,10 +12,10 @@ def __setattr__(cls: type, attr: str, value) -> None:
         type.__setattr__(cls, attr, value)
 
 class ClassWithConstants(metaclass=ClassWithConstantsMeta):
-    pass
+    __slots__ = ()
 
 class ABCWithConstantsMeta(ABCMeta, ClassWithConstantsMeta):
     pass
 
 class ABCWithConstants(metaclass=ABCWithConstantsMeta):
-    pass
+    __slots__ = ()
@@ -0,0 +1,304 @@
+""" A reentrant reader/writer lock with wait/hold time statistics. """
+
+#   Python standard library
+from __future__ import annotations  #   MUST be 1st in a module!
+from typing import final
+import threading
+import time
+
+##########
+#   Public entities
+@final
+class ReadWriteLockStatistics:
+    """ A snapshot of the wait/hold time statistics of a
+        ReadWriteLock in one of its modes (shared or exclusive).
+        All times are in seconds. """
+
+    ##########
+    #   Construction
+    def __init__(self,
+                 acquisitions: int = 0,
+                 contended_acquisitions: int = 0,
+                 total_wait_time: float = 0.0,
+                 max_wait_time: float = 0.0,
+                 total_hold_time: float = 0.0,
+                 max_hold_time: float = 0.0):
+        self.__acquisitions = acquisitions
+        self.__contended_acquisitions = contended_acquisitions
+        self.__total_wait_time = total_wait_time
+        self.__max_wait_time = max_wait_time
+        self.__total_hold_time = total_hold_time
+        self.__max_hold_time = max_hold_time
+
+    ##########
+    #   object
+    def __repr__(self) -> str:
+        return ("ReadWriteLockStatistics(acquisitions=" + repr(self.__acquisitions) +
+                ", contended_acquisitions=" + repr(self.__contended_acquisitions) +
+                ", total_wait_time=" + repr(self.__total_wait_time) +
+                ", max_wait_time=" + repr(self.__max_wait_time) +
+                ", total_hold_time=" + repr(self.__total_hold_time) +
+                ", max_hold_time=" + repr(self.__max_hold_time) + ")")
+
+    ##########
+    #   Properties
+    @property
+    def acquisitions(self) -> int:
+        """ The number of times the lock was acquired in this mode;
+            reentrant acquisitions are not counted. """
+        return self.__acquisitions
+
+    @property
+    def contended_acquisitions(self) -> int:
+        """ The number of acquisitions that had to wait. """
+        return self.__contended_acquisitions
+
+    @property
+    def total_wait_time(self) -> float:
+        """ The total time spent waiting to acquire the lock. """
+        return self.__total_wait_time
+
+    @property
+    def max_wait_time(self) -> float:
+        """ The longest time spent waiting to acquire the lock. """
+        return self.__max_wait_time
+
+    @property
+    def average_wait_time(self) -> float:
+        """ The average time spent waiting to acquire the lock. """
+        return self.__total_wait_time / self.__acquisitions if self.__acquisitions > 0 else 0.0
+
+    @property
+    def total_hold_time(self) -> float:
+        """ The total time the lock was held for. """
+        return self.__total_hold_time
+
+    @property
+    def max_hold_time(self) -> float:
+        """ The longest time the lock was held for. """
+        return self.__max_hold_time
+
+    @property
+    def average_hold_time(self) -> float:
+        """ The average time the lock was held for. """
+        return self.__total_hold_time / self.__acquisitions if self.__acquisitions > 0 else 0.0
+
+@final
+class ReadWriteLock:
+    """
+        A lock that can be held either by any number of threads
+        in shared ("read") mode or by a single thread in exclusive
+        ("write") mode.
+        Both modes are reentrant, and a thread that holds the lock
+        in exclusive mode may also acquire it in shared mode. The
+        opposite (upgrading a shared lock to an exclusive one) would
+        deadlock as soon as two readers attempted it, so it is an
+        error. Waiting writers take precedence over new readers, so
+        a steady stream of readers cannot starve a writer.
+        The lock keeps wait/hold time statistics for both modes.
+    """
+
+    ##########
+    #   Construction
+    def __init__(self):
+        """ Constructs the lock, initially not held. """
+        self.__condition = threading.Condition(threading.Lock())
+        self.__active_readers = 0       #   number of threads holding the shared lock
+        self.__writer = None            #   ident of the thread holding the exclusive lock
+        self.__writer_depth = 0
+        self.__waiting_writers = 0
+        self.__thread_state = threading.local()
+
+        self.__reading = _ReadWriteLockMode(self.acquire_shared, self.release_shared)
+        self.__writing = _ReadWriteLockMode(self.acquire_exclusive, self.release_exclusive)
+
+        self.__shared_statistics = _StatisticsAccumulator()
+        self.__exclusive_statistics = _StatisticsAccumulator()
+
+    ##########
+    #   Properties
+    @property
+    def reading(self) -> _ReadWriteLockMode:
+        """ The context manager that holds this lock in shared mode
+            while the "with" statement executes. """
+        return self.__reading
+
+    @property
+    def writing(self) -> _ReadWriteLockMode:
+        """ The context manager that holds this lock in exclusive mode
+            while the "with" statement executes. """
+        return self.__writing
+
+    @property
+    def held_shared(self) -> bool:
+        """ True if the current thread holds this lock in shared
+            mode, else False. """
+        return self.__read_depth > 0
+
+    @property
+    def held_exclusive(self) -> bool:
+        """ True if the current thread holds this lock in exclusive
+            mode, else False. """
+        return self.__writer == threading.get_ident()
+
+    @property
+    def shared_statistics(self) -> ReadWriteLockStatistics:
+        """ The wait/hold time statistics for shared acquisitions. """
+        with self.__condition:
+            return self.__shared_statistics.snapshot()
+
+    @property
+    def exclusive_statistics(self) -> ReadWriteLockStatistics:
+        """ The wait/hold time statistics for exclusive acquisitions. """
+        with self.__condition:
+            return self.__exclusive_statistics.snapshot()
+
+    ##########
+    #   Operations
+    def acquire_shared(self) -> None:
+        """ Acquires this lock in shared mode, waiting while another
+            thread holds it in exclusive mode or waits to. """
+        me = threading.get_ident()
+        depth = self.__read_depth
+        if depth > 0 or self.__writer == me:
+            #   Reentrant acquisition - never waits
+            self.__thread_state.read_depth = depth + 1
+            if depth == 0:
+                self.__thread_state.read_start = None   #   covered by the exclusive hold
+            return
+        with self.__condition:
+            wait_time = 0.0
+            if self.__writer is not None or self.__waiting_writers > 0:
+                wait_start = time.perf_counter()
+                while self.__writer is not None or self.__waiting_writers > 0:
+                    self.__condition.wait()
+                wait_time = time.perf_counter() - wait_start
+            self.__active_readers += 1
+            self.__shared_statistics.record_acquisition(wait_time)
+        self.__thread_state.read_depth = 1
+        self.__thread_state.read_start = time.perf_counter()
+
+    def release_shared(self) -> None:
+        """ Releases this lock held by the current thread in shared mode. """
+        depth = self.__read_depth
+        assert depth > 0, "ReadWriteLock not held in shared mode"
+        self.__thread_state.read_depth = depth - 1
+        if depth > 1:
+            return
+        read_start = self.__thread_state.read_start
+        if read_start is None:
+            return  #   was acquired while holding the exclusive lock
+        hold_time = time.perf_counter() - read_start
+        with self.__condition:
+            self.__active_readers -= 1
+            self.__shared_statistics.record_release(hold_time)
+            if self.__active_readers == 0:
+                self.__condition.notify_all()
+
+    def acquire_exclusive(self) -> None:
+        """ Acquires this lock in exclusive mode, waiting while any
+            other thread holds it in either mode.
+
+            @raise RuntimeError:
+                If the current thread holds this lock in shared
+                mode only (upgrades are not supported).
+        """
+        me = threading.get_ident()
+        if self.__writer == me:
+            self.__writer_depth += 1
+            return
+        if self.__read_depth > 0:
+            raise RuntimeError("Cannot upgrade a shared ReadWriteLock to exclusive")
+        with self.__condition:
+            wait_time = 0.0
+            if self.__writer is not None or self.__active_readers > 0:
+                wait_start = time.perf_counter()
+                self.__waiting_writers += 1
+                try:
+                    while self.__writer is not None or self.__active_readers > 0:
+                        self.__condition.wait()
+                finally:
+                    self.__waiting_writers -= 1
+                wait_time = time.perf_counter() - wait_start
+            self.__writer = me
+            self.__writer_depth = 1
+            self.__exclusive_statistics.record_acquisition(wait_time)
+        self.__thread_state.write_start = time.perf_counter()
+
+    def release_exclusive(self) -> None:
+        """ Releases this lock held by the current thread in exclusive mode. """
+        assert self.__writer == threading.get_ident(), "ReadWriteLock not held in exclusive mode"
+        self.__writer_depth -= 1
+        if self.__writer_depth > 0:
+            return
+        hold_time = time.perf_counter() - self.__thread_state.write_start
+        #   Shared holds acquired while holding the exclusive hold
+        #   and still held now become a counted reader hold, so no
+        #   writer can get in until they are released as well
+        still_reading = self.__read_depth > 0
+        with self.__condition:
+            self.__writer = None
+            self.__exclusive_statistics.record_release(hold_time)
+            if still_reading:
+                self.__active_readers += 1
+                self.__shared_statistics.record_acquisition(0.0)
+            self.__condition.notify_all()
+        if still_reading:
+            self.__thread_state.read_start = time.perf_counter()
+
+    def reset_statistics(self) -> None:
+        """ Resets the wait/hold time statistics for both modes. """
+        with self.__condition:
+            self.__shared_statistics = _StatisticsAccumulator()
+            self.__exclusive_statistics = _StatisticsAccumulator()
+
+    ##########
+    #   Implementation helpers
+    @property
+    def __read_depth(self) -> int:
+        return getattr(self.__thread_state, "read_depth", 0)
+
+##########
+#   Implementation helpers
+class _ReadWriteLockMode:
+    """ A context manager that holds a ReadWriteLock in one mode. """
+
+    def __init__(self, acquire, release):
+        self.__acquire = acquire
+        self.__release = release
+
+    def __enter__(self) -> None:
+        self.__acquire()
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.__release()
+
+class _StatisticsAccumulator:
+    """ Mutable ReadWriteLockStatistics, guarded by the lock's condition. """
+
+    def __init__(self):
+        self.acquisitions = 0
+        self.contended_acquisitions = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.total_hold_time = 0.0
+        self.max_hold_time = 0.0
+
+    def record_acquisition(self, wait_time: float) -> None:
+        self.acquisitions += 1
+        if wait_time > 0.0:
+            self.contended_acquisitions += 1
+            self.total_wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def record_release(self, hold_time: float) -> None:
+        self.total_hold_time += hold_time
+        self.max_hold_time = max(self.max_hold_time, hold_time)
+
+    def snapshot(self) -> ReadWriteLockStatistics:
+        return ReadWriteLockStatistics(self.acquisitions,
+                                       self.contended_acquisitions,
+                                       self.total_wait_time,
+                                       self.max_wait_time,
+                                       self.total_hold_time,
+                                       self.max_hold_time)
@@ -20,6 +20,7 @@
 from util.implementation.PropertyChangeEventHandler import *
 from util.implementation.PropertyChangeEventListener import *
 from util.implementation.PropertyChangeEventProcessorMixin import *
+from util.implementation.ReadWriteLock import *
 from util.implementation.ResourceBundle import *
 from util.implementation.ResourceFactory import *
 from util.implementation.ResourceType import *
@@ -0,0 +1,63 @@
+""" What a service caller may do with a specific BusinessObject. """
+
+#   Python standard library
+from typing import final
+
+#   Dependencies on other PyTT components
+from util.interface.api import *
+
+##########
+#   Public entities
+@final
+class AccessSummary:
+    """ What a service caller may do with a specific BusinessObject,
+        as evaluated at a specific moment. """
+
+    ##########
+    #   Construction
+    def __init__(self, can_modify: bool, can_destroy: bool):
+        """
+            Constructs the access summary.
+
+            @param can_modify:
+                True if the caller may modify the object or some
+                properties thereof, else False.
+            @param can_destroy:
+                True if the caller may destroy the object, else False.
+        """
+        assert isinstance(can_modify, bool)
+        assert isinstance(can_destroy, bool)
+
+        self.__can_modify = can_modify
+        self.__can_destroy = can_destroy
+
+    ##########
+    #   object
+    def __hash__(self) -> int:
+        return hash((self.__can_modify, self.__can_destroy))
+
+    def __eq__(self, op2) -> bool:
+        if isinstance(op2, AccessSummary):
+            return ((self.__can_modify == op2.__can_modify) and
+                    (self.__can_destroy == op2.__can_destroy))
+        return False
+
+    def __ne__(self, op2) -> bool:
+        return not self.__eq__(op2)
+
+    def __repr__(self) -> str:
+        return ("AccessSummary(can_modify=" + repr(self.__can_modify) +
+                ", can_destroy=" + repr(self.__can_destroy) + ")")
+
+    ##########
+    #   Properties
+    @property
+    def can_modify(self) -> bool:
+        """ True if the caller may modify the object or some
+            properties thereof, else False. """
+        return self.__can_modify
+
+    @property
+    def can_destroy(self) -> bool:
+        """ True if the caller may destroy the object, else False. """
+        return self.__can_destroy
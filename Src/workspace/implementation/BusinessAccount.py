@@ -1,5 +1,5 @@
 #   Python standard library
-from typing import List, Set
+from typing import Optional, List, Set
 
 #   Dependencies on other PyTT components
 import db.interface.api as dbapi
@@ -10,6 +10,7 @@
 from .BusinessObject import BusinessObject
 from .BusinessUser import BusinessUser
 from .Workspace import Workspace
+from .AccessSummary import AccessSummary
 from .Exceptions import *
 
 ##########
@@ -38,31 +39,25 @@ def __init__(self, workspace: Workspace, data_object: dbapi.Account):
     def can_modify(self, credentials: Credentials) -> bool:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
-
-            try:
-                #   A user can modify their own details, plus anyone
-                #   who can manage users can modify details of any user
-                if self.workspace.can_manage_users(credentials):
-                    return True
-                data_account = self._data_object.database.login(credentials.login, credentials._Credentials__password)
-                if data_account.user == self._data_object.user:
-                    return True
-                return False
-            except Exception as ex:
-                raise WorkspaceError.wrap(ex)
+            return self._get_access_summary(credentials).can_modify
 
     def can_destroy(self, credentials: Credentials) -> bool:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
+            return self._get_access_summary(credentials).can_destroy
 
-            try:
-                return self.workspace.can_manage_users(credentials)
-            except Exception as ex:
-                raise WorkspaceError.wrap(ex)
+    def _evaluate_access(self, capabilities: Capabilities,
+                         data_user: Optional[dbapi.User]) -> AccessSummary:
+        #   A user can modify their own details, plus anyone
+        #   who can manage users can modify details of any user
+        can_modify = (capabilities.contains_any(Capabilities.ADMINISTRATOR, Capabilities.MANAGE_USERS) or
+                      (data_user == self._data_object.user))
+        can_destroy = capabilities.contains_any(Capabilities.ADMINISTRATOR, Capabilities.MANAGE_USERS)
+        return AccessSummary(can_modify, can_destroy)
 
     ##########
     #   Operations (properties)
@@ -79,7 +74,7 @@ def is_enabled(self, credentials: Credentials) -> bool:
         """
         assert isinstance(credentials, Credentials)
         
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -112,19 +107,8 @@ def set_enabled(self, credentials: Credentials, new_enabled: bool) -> None:
                     #   one other "enabled" user must exist, with at
                     #   least one "enabled" account that has ADMINISTRATOR 
                     #   capabilities
-                    access_would_be_lost = True
                     db = self.workspace._Workspace__db
-                    for data_user in db.users:
-                        if ((not data_user.enabled) or
-                            (not access_would_be_lost)):
-                            continue    #   data_user cannot be a possible "admin user" OR access would not be lost
-                        for data_account in data_user.accounts:
-                            if ((data_account == self._data_object) or
-                                (not data_account.enabled) or
-                                (not data_account.capabilities.contains_all(dbapi.Capabilities.ADMINISTRATOR)) or
-                                (not access_would_be_lost)):
-                                continue    #   data_account cannot be a possible "admin account" OR access would not be lost
-                            access_would_be_lost = False
+                    access_would_be_lost = db.count_enabled_administrators(excluding=self._data_object) == 0
                     if access_would_be_lost:
                         raise WorkspaceAccessWouldBeLostError()
             except Exception as ex:
@@ -153,7 +137,7 @@ def get_login(self, credentials: Credentials) -> str:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -205,7 +189,7 @@ def get_password_hash(self, credentials: Credentials) -> str:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -252,7 +236,7 @@ def get_capabilities(self, credentials: Credentials) -> Capabilities:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -304,7 +288,7 @@ def get_email_addresses(self, credentials: Credentials) -> List[str]:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -355,7 +339,7 @@ def get_user(self, credentials: Credentials) -> Set[BusinessUser]:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -48,7 +48,7 @@ def get_name(self, credentials: Credentials) -> str:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -95,7 +95,7 @@ def get_description(self, credentials: Credentials) -> str:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -147,7 +147,7 @@ def get_timeout(self, credentials: Credentials) -> Optional[int]:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -203,7 +203,7 @@ def get_require_comment_on_start(self, credentials: Credentials) -> bool:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -258,7 +258,7 @@ def get_require_comment_on_finish(self, credentials: Credentials) -> bool:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -314,7 +314,7 @@ def get_full_screen_reminder(self, credentials: Credentials) -> bool:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -370,7 +370,7 @@ def get_activity_type(self, credentials: Credentials) -> Optional[BusinessActivi
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             try:
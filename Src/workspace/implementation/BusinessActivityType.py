@@ -10,6 +10,7 @@
 from .Credentials import Credentials
 from .Capabilities import Capabilities
 from .BusinessObject import BusinessObject
+from .AccessSummary import AccessSummary
 from .Exceptions import *
 
 ##########
@@ -34,24 +35,22 @@ def __init__(self, workspace: "Workspace", data_object: dbapi.ActivityType):
     def can_modify(self, credentials: Credentials) -> bool:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
-
-            try:
-                return self.workspace.can_manage_stock_items(credentials)
-            except Exception as ex:
-                raise WorkspaceError.wrap(ex)
+            return self._get_access_summary(credentials).can_modify
 
     def can_destroy(self, credentials: Credentials) -> bool:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
+            return self._get_access_summary(credentials).can_destroy
 
-            try:
-                return self.workspace.can_manage_stock_items(credentials)
-            except Exception as ex:
-                raise WorkspaceError.wrap(ex)
+    def _evaluate_access(self, capabilities: Capabilities,
+                         data_user: Optional[dbapi.User]) -> AccessSummary:
+        can_modify = capabilities.contains_any(Capabilities.ADMINISTRATOR, Capabilities.MANAGE_STOCK_ITEMS)
+        can_destroy = can_modify
+        return AccessSummary(can_modify, can_destroy)
 
     ##########
     #   Operations (properties)
@@ -68,7 +67,7 @@ def get_name(self, credentials: Credentials) -> str:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -115,7 +114,7 @@ def get_description(self, credentials: Credentials) -> str:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -164,7 +163,7 @@ def get_activities(self, credentials: Credentials) -> Set[BusinessActivity]:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
             try:
                 result = set()
@@ -3,7 +3,7 @@
 #   Python standard library
 from __future__ import annotations  #   MUST be 1st in a module!
 from abc import abstractmethod
-from typing import TypeAlias
+from typing import Optional, TypeAlias
 
 #   Dependencies on other PyTT components
 import db.interface.api as dbapi
@@ -12,6 +12,7 @@
 #   Internal dependencies on modules within the same component
 from .Credentials import Credentials
 from .Capabilities import Capabilities
+from .AccessSummary import AccessSummary
 from .Exceptions import *
 
 ##########
@@ -41,33 +42,33 @@ def __str__(self) -> str:
     @property
     def display_name(self) -> str:
         """ The user-readable display name of this business object. """
-        with self.workspace:
+        with self.workspace.reading:
             return self._data_object.display_name
 
     @property
     def type_name(self) -> str:
         """ The internal name of this business object's type (e.g. "User",
             "PublicTask", etc.) """
-        with self.workspace:
+        with self.workspace.reading:
             return self._data_object.type_name
 
     @property
     def type_display_name(self) -> str:
         """ The user-readable display name of this business object's type
             (e.g. "user", "public task", etc.) """
-        with self.workspace:
+        with self.workspace.reading:
             return self._data_object.type_display_name
 
     @property
     def small_image(self) -> tk.PhotoImage:
         """ The small (16x16) image representing this datbase object. """
-        with self.workspace:
+        with self.workspace.reading:
             return self._data_object.small_image
 
     @property
     def large_image(self) -> tk.PhotoImage:
         """ The large (32x32) image representing this datbase object. """
-        with self.workspace:
+        with self.workspace.reading:
             return self._data_object.large_image
 
     ##########
@@ -81,14 +82,14 @@ def workspace(self) -> Workspace:
     @property
     def live(self) -> bool:
         """ True of this workspace object [proxy] is live, false if dead. """
-        with self.workspace:
+        with self.workspace.reading:
             return self._data_object.live
 
     @property
     def oid(self) -> OID:
         """ The OID of this object (if live) or the OID this object
             used to have (if dead). """
-        with self.workspace:
+        with self.workspace.reading:
             return self._data_object.oid
 
     ##########
@@ -126,6 +127,28 @@ def can_destroy(self, credentials: Credentials) -> bool:
         """
         raise NotImplementedError()
     
+    @abstractmethod
+    def _evaluate_access(self, capabilities: Capabilities,
+                         data_user: Optional[dbapi.User]) -> AccessSummary:
+        """
+            Evaluates what a service caller may do with this
+            (live) business object. Called with the workspace
+            lock held, possibly for many objects in a row, so
+            implementations must NOT re-evaluate the caller's
+            capabilities or identity.
+
+            @param capabilities:
+                The capabilities of the service caller.
+            @param data_user:
+                The (data) User the service caller is logged in
+                as, None if the caller's credentials are invalid.
+            @return:
+                What the service caller may do with this object.
+            @raise DatabaseError:
+                If a data access error occurs.
+        """
+        raise NotImplementedError()
+
     ##########
     #   Operations (life cycle)
     def destroy(self, credentials: Credentials) -> None:
@@ -151,6 +174,15 @@ def destroy(self, credentials: Credentials) -> None:
     
     ##########
     #   Implementation helpers
+    def _get_access_summary(self, credentials: Credentials) -> AccessSummary:
+        #   Must be called with the workspace lock held
+        capabilities = self.__workspace.get_capabilities(credentials)   #   may raise WorkspaceError
+        data_user = self.__workspace._get_login_user(credentials)      #   may raise WorkspaceError
+        try:
+            return self._evaluate_access(capabilities, data_user)
+        except Exception as ex:
+            raise WorkspaceError.wrap(ex)
+
     def _ensure_live(self) -> None:
         self.__workspace._ensure_open() # may raise WorkspaceError
         try:
@@ -12,6 +12,7 @@
 from .Capabilities import Capabilities
 from .BusinessActivity import BusinessActivity
 from .BusinessUser import BusinessUser
+from .AccessSummary import AccessSummary
 from .Exceptions import *
 
 ##########
@@ -40,41 +41,27 @@ def __init__(self, workspace: "Workspace", data_object: dbapi.PrivateActivity):
     #   BusinessObject - Operations (access control)
     def can_modify(self, credentials: Credentials) -> bool:
         assert isinstance(credentials, Credentials)
-        
-        with self.workspace:
-            self._ensure_live() # may raise WorkspaceError
 
-            try:
-                #   A user can modify their own private activities, plus anyone
-                #   who can manage private activities can modify private activities
-                #   of any user
-                if self.workspace.can_manage_private_activities(credentials):
-                    return True
-                data_account = self._data_object.database.login(credentials.login, credentials._Credentials__password)
-                if data_account.user == self._data_object.owner:
-                    return True
-                return False
-            except Exception as ex:
-                raise WorkspaceError.wrap(ex)
+        with self.workspace.reading:
+            self._ensure_live() # may raise WorkspaceError
+            return self._get_access_summary(credentials).can_modify
 
     def can_destroy(self, credentials: Credentials) -> bool:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
-
-            try:
-                #   A user can destroy their own private activities, plus anyone
-                #   who can manage private activities can destroy private activities
-                #   of any user
-                if self.workspace.can_manage_private_activities(credentials):
-                    return True
-                data_account = self._data_object.database.login(credentials.login, credentials._Credentials__password)
-                if data_account.user == self._data_object.owner:
-                    return True
-                return False
-            except Exception as ex:
-                raise WorkspaceError.wrap(ex)
+            return self._get_access_summary(credentials).can_destroy
+
+    def _evaluate_access(self, capabilities: Capabilities,
+                         data_user: Optional[dbapi.User]) -> AccessSummary:
+        #   A user can modify and destroy their own private activities,
+        #   plus anyone who can manage private activities can modify
+        #   and destroy private activities of any user
+        can_modify = (capabilities.contains_any(Capabilities.ADMINISTRATOR, Capabilities.MANAGE_PRIVATE_ACTIVITIES) or
+                      (data_user == self._data_object.owner))
+        can_destroy = can_modify
+        return AccessSummary(can_modify, can_destroy)
 
     ##########
     #   Operations (properties)
@@ -92,7 +79,7 @@ def get_owner(self, credentials: Credentials) -> BusinessUser:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
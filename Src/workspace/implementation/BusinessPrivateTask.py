@@ -10,9 +10,11 @@
 
 #   Internal dependencies on modules within the same component
 from .Credentials import Credentials
+from .Capabilities import Capabilities
 from .BusinessActivityType import BusinessActivityType
 from .BusinessPrivateActivity import BusinessPrivateActivity
 from .BusinessTask import BusinessTask
+from .AccessSummary import AccessSummary
 from .Exceptions import *
 
 ##########
@@ -39,47 +41,33 @@ class BusinessPrivateTask(BusinessPrivateActivity, BusinessTask):
     def can_modify(self, credentials: Credentials) -> bool:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
-
-            try:
-                #   A user can modify their own private tasks, plus anyone
-                #   who can manage private tasks can modify private tasks
-                #   of any user
-                if self.workspace.can_manage_private_tasks(credentials):
-                    return True
-                data_account = self._data_object.database.login(credentials.login, credentials._Credentials__password)
-                if data_account.user == self._data_object.owner:
-                    return True
-                return False
-            except Exception as ex:
-                raise WorkspaceError.wrap(ex)
+            return self._get_access_summary(credentials).can_modify
 
     def can_destroy(self, credentials: Credentials) -> bool:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
-
-            try:
-                #   A user can destroy their own private tasks, plus anyone
-                #   who can manage private tasks can destroy private tasks
-                #   of any user
-                if self.workspace.can_manage_private_tasks(credentials):
-                    return True
-                data_account = self._data_object.database.login(credentials.login, credentials._Credentials__password)
-                if data_account.user == self._data_object.owner:
-                    return True
-                return False
-            except Exception as ex:
-                raise WorkspaceError.wrap(ex)
+            return self._get_access_summary(credentials).can_destroy
+
+    def _evaluate_access(self, capabilities: Capabilities,
+                         data_user: Optional[dbapi.User]) -> AccessSummary:
+        #   A user can modify and destroy their own private tasks,
+        #   plus anyone who can manage private tasks can modify
+        #   and destroy private tasks of any user
+        can_modify = (capabilities.contains_any(Capabilities.ADMINISTRATOR, Capabilities.MANAGE_PRIVATE_TASKS) or
+                      (data_user == self._data_object.owner))
+        can_destroy = can_modify
+        return AccessSummary(can_modify, can_destroy)
 
     ##########
     #   Associations
     def get_parent(self, credentials: Credentials) -> Optional[BusinessPrivateTask]:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             try:
@@ -116,7 +104,7 @@ def set_parent(self, credentials: Credentials, new_parent: Optional[BusinessPubl
     def get_children(self, credentials: Credentials) -> Set[BusinessPublicTask]:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             try:
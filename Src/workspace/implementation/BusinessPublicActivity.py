@@ -9,6 +9,7 @@
 from .Credentials import Credentials
 from .Capabilities import Capabilities
 from .BusinessActivity import BusinessActivity
+from .AccessSummary import AccessSummary
 from .Exceptions import *
 
 ##########
@@ -37,24 +38,22 @@ def __init__(self, workspace: "Workspace", data_object: dbapi.PublicActivity):
     def can_modify(self, credentials: Credentials) -> bool:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
-
-            try:
-                return self.workspace.can_manage_public_activities(credentials)
-            except Exception as ex:
-                raise WorkspaceError.wrap(ex)
+            return self._get_access_summary(credentials).can_modify
 
     def can_destroy(self, credentials: Credentials) -> bool:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
+            return self._get_access_summary(credentials).can_destroy
 
-            try:
-                return self.workspace.can_manage_public_activities(credentials)
-            except Exception as ex:
-                raise WorkspaceError.wrap(ex)
+    def _evaluate_access(self, capabilities: Capabilities,
+                         data_user: Optional[dbapi.User]) -> AccessSummary:
+        can_modify = capabilities.contains_any(Capabilities.ADMINISTRATOR, Capabilities.MANAGE_PUBLIC_ACTIVITIES)
+        can_destroy = can_modify
+        return AccessSummary(can_modify, can_destroy)
 
     ##########
     #   Operations (properties)
@@ -10,9 +10,11 @@
 
 #   Internal dependencies on modules within the same component
 from .Credentials import Credentials
+from .Capabilities import Capabilities
 from .BusinessActivityType import BusinessActivityType
 from .BusinessPublicActivity import BusinessPublicActivity
 from .BusinessTask import BusinessTask
+from .AccessSummary import AccessSummary
 from .Exceptions import *
 
 ##########
@@ -39,31 +41,29 @@ class BusinessPublicTask(BusinessPublicActivity, BusinessTask):
     def can_modify(self, credentials: Credentials) -> bool:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
-
-            try:
-                return self.workspace.can_manage_public_tasks(credentials)
-            except Exception as ex:
-                raise WorkspaceError.wrap(ex)
+            return self._get_access_summary(credentials).can_modify
 
     def can_destroy(self, credentials: Credentials) -> bool:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
+            return self._get_access_summary(credentials).can_destroy
 
-            try:
-                return self.workspace.can_manage_public_tasks(credentials)
-            except Exception as ex:
-                raise WorkspaceError.wrap(ex)
+    def _evaluate_access(self, capabilities: Capabilities,
+                         data_user: Optional[dbapi.User]) -> AccessSummary:
+        can_modify = capabilities.contains_any(Capabilities.ADMINISTRATOR, Capabilities.MANAGE_PUBLIC_TASKS)
+        can_destroy = can_modify
+        return AccessSummary(can_modify, can_destroy)
 
     ##########
     #   Associations
     def get_parent(self, credentials: Credentials) -> Optional[BusinessPublicTask]:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             try:
@@ -101,7 +101,7 @@ def set_parent(self, credentials: Credentials, new_parent: Optional[BusinessPubl
     def get_children(self, credentials: Credentials) -> Set[BusinessPublicTask]:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             try:
@@ -45,7 +45,7 @@ def is_completed(self, credentials: Credentials) -> bool:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
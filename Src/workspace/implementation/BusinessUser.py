@@ -11,6 +11,7 @@
 from .Capabilities import Capabilities
 from .BusinessObject import BusinessObject
 from .BusinessActivityType import BusinessActivityType
+from .AccessSummary import AccessSummary
 from .Exceptions import *
 
 ##########
@@ -40,31 +41,25 @@ def __init__(self, workspace: "Workspace", data_object: dbapi.User):
     def can_modify(self, credentials: Credentials) -> bool:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
-
-            try:
-                #   A user can modify their own details, plus anyone
-                #   who can manage users can modify details of any user
-                if self.workspace.can_manage_users(credentials):
-                    return True
-                data_account = self._data_object.database.login(credentials.login, credentials._Credentials__password)
-                if data_account.user == self._data_object:
-                    return True
-                return False
-            except Exception as ex:
-                raise WorkspaceError.wrap(ex)
+            return self._get_access_summary(credentials).can_modify
 
     def can_destroy(self, credentials: Credentials) -> bool:
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
+            return self._get_access_summary(credentials).can_destroy
 
-            try:
-                return self.workspace.can_manage_users(credentials)
-            except Exception as ex:
-                raise WorkspaceError.wrap(ex)
+    def _evaluate_access(self, capabilities: Capabilities,
+                         data_user: Optional[dbapi.User]) -> AccessSummary:
+        #   A user can modify their own details, plus anyone
+        #   who can manage users can modify details of any user
+        can_modify = (capabilities.contains_any(Capabilities.ADMINISTRATOR, Capabilities.MANAGE_USERS) or
+                      (data_user == self._data_object))
+        can_destroy = capabilities.contains_any(Capabilities.ADMINISTRATOR, Capabilities.MANAGE_USERS)
+        return AccessSummary(can_modify, can_destroy)
 
     ##########
     #   BusinessObjectOperations (life cycle)
@@ -80,19 +75,8 @@ def destroy(self, credentials: Credentials) -> None:
                     #   one other "enabled" user must exist, with at
                     #   least one "enabled" account that has ADMINISTRATOR
                     #   capabilities
-                    access_would_be_lost = True
                     db = self.workspace._Workspace__db
-                    for data_user in db.users:
-                        if ((data_user == self._data_object) or
-                            (not data_user.enabled) or
-                            (not access_would_be_lost)):
-                            continue    #   data_user cannot be a possible "admin user" OR access would not be lost
-                        for data_account in data_user.accounts:
-                            if ((not data_account.enabled) or
-                                (not data_account.capabilities.contains_all(dbapi.Capabilities.ADMINISTRATOR)) or
-                                (not access_would_be_lost)):
-                                continue    #   data_account cannot be a possible "admin account" OR access would not be lost
-                            access_would_be_lost = False
+                    access_would_be_lost = db.count_enabled_administrators(excluding=self._data_object) == 0
                     if access_would_be_lost:
                         raise WorkspaceAccessWouldBeLostError()
                 #   ...and the rest is up to the base implementation
@@ -115,7 +99,7 @@ def is_enabled(self, credentials: Credentials) -> bool:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -148,19 +132,8 @@ def set_enabled(self, credentials: Credentials, new_enabled: bool) -> None:
                     #   one other "enabled" user must exist, with at
                     #   least one "enabled" account that has ADMINISTRATOR
                     #   capabilities
-                    access_would_be_lost = True
                     db = self.workspace._Workspace__db
-                    for data_user in db.users:
-                        if ((data_user == self._data_object) or
-                            (not data_user.enabled) or
-                            (not access_would_be_lost)):
-                            continue    #   data_user cannot be a possible "admin user" OR access would not be lost
-                        for data_account in data_user.accounts:
-                            if ((not data_account.enabled) or
-                                (not data_account.capabilities.contains_all(dbapi.Capabilities.ADMINISTRATOR)) or
-                                (not access_would_be_lost)):
-                                continue    #   data_account cannot be a possible "admin account" OR access would not be lost
-                            access_would_be_lost = False
+                    access_would_be_lost = db.count_enabled_administrators(excluding=self._data_object) == 0
                     if access_would_be_lost:
                         raise WorkspaceAccessWouldBeLostError()
             except Exception as ex:
@@ -186,7 +159,7 @@ def get_real_name(self, credentials: Credentials) -> str:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -239,7 +212,7 @@ def get_inactivity_timeout(self, credentials: Credentials) -> Optional[int]:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -294,7 +267,7 @@ def get_ui_locale(self, credentials: Credentials) -> Optional[Locale]:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -345,7 +318,7 @@ def get_email_addresses(self, credentials: Credentials) -> List[str]:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             if self.workspace.get_capabilities(credentials) == None:
@@ -396,7 +369,7 @@ def get_accounts(self, credentials: Credentials) -> Set[BusinessAccount]:
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             try:
@@ -431,7 +404,7 @@ def get_private_activities(self, credentials: Credentials) -> Set[BusinessPrivat
         """
         assert isinstance(credentials, Credentials)
 
-        with self.workspace:
+        with self.workspace.reading:
             self._ensure_live() # may raise WorkspaceError
 
             try:
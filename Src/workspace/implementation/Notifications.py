@@ -2,7 +2,7 @@
 
 #   Python standard library
 from __future__ import annotations  #   MUST be 1st in a module!
-from typing import Any, TypeAlias, Callable
+from typing import Any, TypeAlias, Callable, Iterator
 from threading import Thread
 
 ##########
@@ -95,12 +95,48 @@ def property_name(self) -> str:
         """ The name of the object's property that has been modified. """
         return self.__property_name
 
+class WorkspaceNotificationBatch(WorkspaceNotification):
+    """ A batch of WorkspaceNotifications that have been processed
+        together, in the order they have occurred. """
+
+    ##########
+    #   Construction
+    def __init__(self, workspace: "Workspace", notifications: list[WorkspaceNotification]):
+        WorkspaceNotification.__init__(self, workspace)
+
+        assert isinstance(notifications, list)
+        assert all(isinstance(n, WorkspaceNotification) and
+                   not isinstance(n, WorkspaceNotificationBatch) for n in notifications)
+
+        self.__notifications = tuple(notifications)
+
+    ##########
+    #   object
+    def __len__(self) -> int:
+        return len(self.__notifications)
+
+    def __iter__(self) -> Iterator[WorkspaceNotification]:
+        return iter(self.__notifications)
+
+    ##########
+    #   Properties
+    @property
+    def notifications(self) -> tuple[WorkspaceNotification]:
+        """ The notifications in this batch, in order. """
+        return self.__notifications
+
 WorkspaceNotificationListener: TypeAlias = Callable[[WorkspaceNotification], None]
 """ A signature of a listener to workspace notifications - a function
     or a bound method.
     IMPORTANT: will normally be called on a hidden "notification"
     thread running behind the Workspace. """
 
+WorkspaceNotificationBatchListener: TypeAlias = Callable[[WorkspaceNotificationBatch], None]
+""" A signature of a listener to batches of workspace notifications -
+    a function or a bound method.
+    IMPORTANT: will normally be called on a hidden "notification"
+    thread running behind the Workspace. """
+
 class WorkspaceNotificationHandler:
 
     ##########
@@ -4,7 +4,7 @@
 
 #   Python standard library
 from __future__ import annotations  #   MUST be 1st in a module!
-from typing import final, Set, List
+from typing import final, Any, Iterable, Optional, Set, List
 from weakref import WeakKeyDictionary, WeakValueDictionary
 import threading
 
@@ -15,9 +15,10 @@
 #   Internal dependencies on modules within the same component
 from .WorkspaceType import WorkspaceType
 from .WorkspaceAddress import WorkspaceAddress
-from .Exceptions import WorkspaceError
+from .Exceptions import *
 from .Credentials import Credentials
 from .Capabilities import Capabilities
+from .AccessSummary import AccessSummary
 from .BusinessObject import BusinessObject
 from .BusinessUser import BusinessUser
 from .BusinessActivityType import BusinessActivityType
@@ -45,25 +46,56 @@ def __init__(self, address: WorkspaceAddress, db: dbapi.Database):
         self.__address = address
         self.__db = db
 
-        self.__lock = threading.RLock() #   for all access synchronization
+        #   Read-only operations hold the lock in shared mode, so
+        #   concurrent readers do not serialize; mutators hold it in
+        #   exclusive mode. The internal caches, which readers also
+        #   update, have their own short-lived guards.
+        self.__lock = ReadWriteLock()
 
         self.__map_data_objects_to_business_objects = WeakValueDictionary()
-        self.__access_rights = WeakKeyDictionary()  #   Credentials -> Capabilities
+        self.__proxies_guard = threading.Lock()
+
+        #   Access rights are cached in two steps, so that a change
+        #   to one account invalidates only what depends on it
+        self.__logins = WeakKeyDictionary()         #   Credentials -> data Account (None == login fails)
+        self.__capabilities_by_account_oid = dict() #   account OID -> (user OID, Capabilities, data User if login allowed)
+        self.__capabilities_cache_hits = 0
+        self.__capabilities_cache_misses = 0
+        self.__capabilities_cache_invalidations = 0
+        self.__access_rights_guard = threading.Lock()
 
         #   Forward database notifications to workspace clients
         self.__notification_listeners = []
+        self.__notification_batch_listeners = []
         self.__notification_listeners_guard = threading.Lock()
 
-        db.add_notification_listener(self.__on_database_notification)
+        db.add_notification_batch_listener(self.__on_database_notification_batch)
 
     ##########
     #   object (entry/exit protocol needed for Dialog.do_modal
     def __enter__(self) -> None:
-        self.__lock.acquire()
+        self.__lock.acquire_exclusive()
         return self
 
     def __exit__(self, exception_type, exception_value, traceback) -> None:
-        self.__lock.release()
+        self.__lock.release_exclusive()
+
+    @property
+    def reading(self) -> Any:
+        """ The context manager that locks this Workspace for reading
+            while the "with" statement executes. Any number of threads
+            can read at the same time, but not while another thread
+            holds the workspace locked for writing; "with workspace:"
+            is the same as "with workspace.writing:". A thread that
+            holds the workspace locked for reading cannot lock it for
+            writing. """
+        return self.__lock.reading
+
+    @property
+    def writing(self) -> Any:
+        """ The context manager that locks this Workspace for exclusive
+            access while the "with" statement executes. """
+        return self.__lock.writing
 
     ##########
     #   Properties
@@ -90,6 +122,43 @@ def validator(self) -> Validator:
         """ The Validator used by this Workspace. """
         return self.__db.validator
 
+    @property
+    def supports_background_reads(self) -> bool:
+        """ True if this Workspace can be read from threads other
+            than the one that has opened it, concurrently with
+            that thread, else False. """
+        return self.__db.supports_background_reads
+
+    @property
+    def capabilities_cache_hits(self) -> int:
+        """ The number of get_capabilities() calls answered from
+            cache, without accessing the database. """
+        return self.__capabilities_cache_hits
+
+    @property
+    def capabilities_cache_misses(self) -> int:
+        """ The number of get_capabilities() calls that had to
+            access the database. """
+        return self.__capabilities_cache_misses
+
+    @property
+    def capabilities_cache_invalidations(self) -> int:
+        """ The number of cached access rights dropped because the
+            Users or Accounts they depend on have changed. """
+        return self.__capabilities_cache_invalidations
+
+    @property
+    def read_lock_statistics(self) -> ReadWriteLockStatistics:
+        """ The wait/hold time statistics of the locks taken for
+            reading this Workspace. """
+        return self.__lock.shared_statistics
+
+    @property
+    def write_lock_statistics(self) -> ReadWriteLockStatistics:
+        """ The wait/hold time statistics of the locks taken for
+            writing to this Workspace. """
+        return self.__lock.exclusive_statistics
+
     ##########
     #   Operations (general)
     def close(self) -> None:
@@ -121,25 +190,14 @@ def get_capabilities(self, credentials: Credentials) -> Capabilities:
             @raise WorkspaceError:
                 If a data access error occurs.
         """
-        with self:
+        with self.reading:
             self._ensure_open() # may raise WorkspaceError
             assert isinstance(credentials, Credentials)
 
-            capabilities = self.__access_rights.get(credentials, None)
-            if capabilities is None:
-                try:
-                    data_account = self.__db.try_login(credentials.login, credentials._Credentials__password)
-                    if (data_account is not None) and data_account.enabled and data_account.user.enabled:
-                        capabilities = data_account.capabilities
-                    else:
-                        capabilities = Capabilities.NONE
-                    self.__access_rights[credentials] = capabilities
-                except Exception as ex:
-                    raise WorkspaceError.wrap(ex)
-            return capabilities
+            return self.__resolve_access(credentials)[0]    #   may raise WorkspaceError
 
     def can_manage_users(self, credentials: Credentials) -> bool:
-        with self:
+        with self.reading:
             self._ensure_open() # may raise WorkspaceError
             assert isinstance(credentials, Credentials)
 
@@ -149,7 +207,7 @@ def can_manage_users(self, credentials: Credentials) -> bool:
             return capabilities.contains_any(Capabilities.ADMINISTRATOR, Capabilities.MANAGE_USERS)
 
     def can_manage_stock_items(self, credentials: Credentials) -> bool:
-        with self:
+        with self.reading:
             self._ensure_open() # may raise WorkspaceError
             assert isinstance(credentials, Credentials)
 
@@ -159,7 +217,7 @@ def can_manage_stock_items(self, credentials: Credentials) -> bool:
             return capabilities.contains_any(Capabilities.ADMINISTRATOR, Capabilities.MANAGE_STOCK_ITEMS)
 
     def can_manage_public_activities(self, credentials: Credentials) -> bool:
-        with self:
+        with self.reading:
             self._ensure_open() # may raise WorkspaceError
             assert isinstance(credentials, Credentials)
 
@@ -169,7 +227,7 @@ def can_manage_public_activities(self, credentials: Credentials) -> bool:
             return capabilities.contains_any(Capabilities.ADMINISTRATOR, Capabilities.MANAGE_PUBLIC_ACTIVITIES)
 
     def can_manage_private_activities(self, credentials: Credentials) -> bool:
-        with self:
+        with self.reading:
             self._ensure_open() # may raise WorkspaceError
             assert isinstance(credentials, Credentials)
 
@@ -179,7 +237,7 @@ def can_manage_private_activities(self, credentials: Credentials) -> bool:
             return capabilities.contains_any(Capabilities.ADMINISTRATOR, Capabilities.MANAGE_PRIVATE_ACTIVITIES)
 
     def can_manage_public_tasks(self, credentials: Credentials) -> bool:
-        with self:
+        with self.reading:
             self._ensure_open() # may raise WorkspaceError
             assert isinstance(credentials, Credentials)
 
@@ -189,7 +247,7 @@ def can_manage_public_tasks(self, credentials: Credentials) -> bool:
             return capabilities.contains_any(Capabilities.ADMINISTRATOR, Capabilities.MANAGE_PUBLIC_TASKS)
 
     def can_manage_private_tasks(self, credentials: Credentials) -> bool:
-        with self:
+        with self.reading:
             self._ensure_open() # may raise WorkspaceError
             assert isinstance(credentials, Credentials)
 
@@ -198,6 +256,113 @@ def can_manage_private_tasks(self, credentials: Credentials) -> bool:
                 return False
             return capabilities.contains_any(Capabilities.ADMINISTRATOR, Capabilities.MANAGE_PRIVATE_TASKS)
 
+    ##########
+    #   Operations (bulk access)
+    def evaluate_access(self,
+                        credentials: Credentials,
+                        objects: Iterable[BusinessObject]) -> dict[BusinessObject, AccessSummary]:
+        """
+            Evaluates what the specified credentials allow doing
+            with each of the specified BusinessObjects. This is
+            equivalent to calling can_modify() and can_destroy()
+            on each object, but the caller's capabilities and
+            identity are only evaluated once and the workspace is
+            only locked once.
+
+            @param credentials:
+                The credentials of the service caller.
+            @param objects:
+                The BusinessObjects to evaluate access to; all
+                must belong to this Workspace.
+            @return:
+                The AccessSummary for each of the "objects" that is
+                live; dead objects are omitted.
+            @raise WorkspaceError:
+                If an error occurs.
+        """
+        assert isinstance(credentials, Credentials)
+
+        with self.reading:
+            self._ensure_open() # may raise WorkspaceError
+            try:
+                (capabilities, data_user) = self.__resolve_access(credentials)
+                result = dict()
+                for obj in self.__live_objects(objects):
+                    result[obj] = obj._evaluate_access(capabilities, data_user)
+                return result
+            except Exception as ex:
+                raise WorkspaceError.wrap(ex)
+
+    def get_properties(self,
+                       credentials: Credentials,
+                       objects: Iterable[BusinessObject],
+                       names: Iterable[str]) -> dict[BusinessObject, dict[str, Any]]:
+        """
+            Reads the specified properties of each of the specified
+            BusinessObjects. This is equivalent to calling the
+            relevant get_XXX() or is_XXX() on each object, but the
+            caller's credentials are only checked once, the workspace
+            is only locked once and the property data is fetched from
+            the database in bulk. Unlike the individual getters, the
+            credentials must identify an enabled account of an enabled
+            user.
+
+            @param credentials:
+                The credentials of the service caller.
+            @param objects:
+                The BusinessObjects to read properties of; all must
+                belong to this Workspace.
+            @param names:
+                The names of the properties to read, as they appear
+                in the names of the getters (e.g. "real_name" for
+                get_real_name(), "enabled" for is_enabled(), or
+                "activity_type" for get_activity_type()). Only
+                properties and to-one associations are supported -
+                to-many associations have per-caller visibility
+                rules, so use their get_XXX() instead.
+            @return:
+                The "property name -> property value" dictionary for
+                each of the "objects" that is live; dead objects are
+                omitted. Values that are data objects are returned
+                as their BusinessObjects.
+            @raise WorkspaceAccessDeniedError:
+                If the credentials do not identify an enabled account
+                of an enabled user.
+            @raise WorkspaceError:
+                If one of the "names" is not a property of one of the
+                "objects", or some other error occurs.
+        """
+        assert isinstance(credentials, Credentials)
+        names = list(names)
+        assert all(isinstance(name, str) for name in names)
+
+        with self.reading:
+            self._ensure_open() # may raise WorkspaceError
+            try:
+                live_objects = self.__live_objects(objects)
+                #   All property getters require the same access rights...
+                if self.__resolve_access(credentials)[1] is None:
+                    raise WorkspaceAccessDeniedError()
+                #   ...and property data is best read in bulk
+                self.__db.prefetch([obj._data_object for obj in live_objects])
+                result = dict()
+                for obj in live_objects:
+                    values = dict()
+                    for name in names:
+                        if not (hasattr(obj, "get_" + name) or hasattr(obj, "is_" + name)):
+                            raise WorkspaceError(obj.type_name + " has no property " + name)
+                        value = getattr(obj._data_object, name)
+                        assert not isinstance(value, (set, list)) or \
+                               not any(isinstance(v, dbapi.DatabaseObject) for v in value), \
+                               "To-many associations are not supported"
+                        if isinstance(value, dbapi.DatabaseObject):
+                            value = self._get_business_proxy(value)
+                        values[name] = value
+                    result[obj] = values
+                return result
+            except Exception as ex:
+                raise WorkspaceError.wrap(ex)
+
     ##########
     #   Operations (associations)
     def try_login(self, login: Optional[str], password: Optional[str],
@@ -215,7 +380,7 @@ def try_login(self, login: Optional[str], password: Optional[str],
             @raise DatabaseError:
                 If an error occurs.
         """
-        with self:
+        with self.reading:
             try:
                 args = locals()
                 if isinstance(login, str) and isinstance(password, str):
@@ -247,7 +412,7 @@ def login(self, login: Optional[str] = None, password: Optional[str] = None,
             @raise DatabaseError:
                 If an error occurs.
         """
-        with self:
+        with self.reading:
             try:
                 args = locals()
                 if isinstance(login, str) and isinstance(password, str):
@@ -263,7 +428,7 @@ def login(self, login: Optional[str] = None, password: Optional[str] = None,
     def get_users(self, credentials: Credentials) -> Set[BusinessUser]:
         assert isinstance(credentials, Credentials)
 
-        with self:
+        with self.reading:
             try:
                 result = set()
                 if self.get_capabilities(credentials) is None:
@@ -290,7 +455,7 @@ def get_users(self, credentials: Credentials) -> Set[BusinessUser]:
     def get_activity_types(self, credentials: Credentials) -> Set[BusinessActivityType]:
         assert isinstance(credentials, Credentials)
 
-        with self:
+        with self.reading:
             try:
                 result = set()
                 if self.get_capabilities(credentials) is not None:
@@ -304,7 +469,7 @@ def get_activity_types(self, credentials: Credentials) -> Set[BusinessActivityTy
     def get_public_activities(self, credentials: Credentials) -> Set[BusinessActivityType]:
         assert isinstance(credentials, Credentials)
 
-        with self:
+        with self.reading:
             try:
                 result = set()
                 if self.get_capabilities(credentials) is not None:
@@ -328,7 +493,7 @@ def get_all_public_tasks(self, credentials: Credentials) -> Set[BusinessPublicTa
         """
         assert isinstance(credentials, Credentials)
 
-        with self:
+        with self.reading:
             try:
                 result = set()
                 if self.get_capabilities(credentials) is not None:
@@ -352,7 +517,7 @@ def get_root_public_tasks(self, credentials: Credentials) -> Set[BusinessPublicT
         """
         assert isinstance(credentials, Credentials)
 
-        with self:
+        with self.reading:
             try:
                 result = set()
                 if self.get_capabilities(credentials) is not None:
@@ -569,6 +734,72 @@ def create_public_task(self,
             except Exception as ex:
                 raise WorkspaceError.wrap(ex)
 
+    def bulk_import(self,
+                    credentials: Credentials,
+                    type_name: str,
+                    property_sets: Iterable[dict[str, Any]]) -> list[BusinessObject]:
+        """
+            Creates many new BusinessObjects of the same type at
+            once, e.g. when importing an org chart or a project
+            plan; either all of them are created or none are.
+            This is much faster than calling the relevant create_XXX()
+            once per object, and results in a single batch of
+            notifications.
+
+            @param credentials:
+                The credentials of the service caller.
+            @param type_name:
+                The TYPE_NAME of the objects to create; one of
+                User, ActivityType, PublicActivity or PublicTask.
+            @param property_sets:
+                One dict per object to create, mapping the keyword
+                arguments of the relevant create_XXX() method (except
+                "credentials") to their values; omitted keywords take
+                their defaults.
+            @return:
+                The newly created BusinessObjects, in the order of
+                the "property_sets".
+            @raise WorkspaceError:
+                If an error occurs.
+        """
+        assert isinstance(credentials, Credentials)
+        assert type_name in [dbapi.User.TYPE_NAME, dbapi.ActivityType.TYPE_NAME,
+                             dbapi.PublicActivity.TYPE_NAME, dbapi.PublicTask.TYPE_NAME]
+
+        with self:
+            self._ensure_open() # may raise WorkspaceError
+            try:
+                #   Validate access rights
+                match type_name:
+                    case dbapi.User.TYPE_NAME:
+                        allowed = self.can_manage_users(credentials)
+                    case dbapi.ActivityType.TYPE_NAME:
+                        allowed = self.can_manage_stock_items(credentials)
+                    case dbapi.PublicActivity.TYPE_NAME:
+                        allowed = self.can_manage_public_activities(credentials)
+                    case dbapi.PublicTask.TYPE_NAME:
+                        allowed = self.can_manage_public_tasks(credentials)
+                if not allowed:
+                    raise WorkspaceAccessDeniedError()
+                #   Validate parameters, replacing business proxies
+                #   with the underlying data objects
+                data_property_sets = []
+                for property_set in property_sets:
+                    data_property_set = dict(property_set)
+                    activity_type = data_property_set.get("activity_type", None)
+                    if activity_type is not None:
+                        assert isinstance(activity_type, BusinessActivityType)
+                        activity_type._ensure_live()
+                        if activity_type.workspace is not self:
+                            raise IncompatibleWorkspaceObjectError(activity_type.type_name)
+                        data_property_set["activity_type"] = activity_type._data_object
+                    data_property_sets.append(data_property_set)
+                #   The rest of the work is up to the DB
+                data_objects = self.__db.create_many(type_name, data_property_sets)
+                return [self._get_business_proxy(data_object) for data_object in data_objects]
+            except Exception as ex:
+                raise WorkspaceError.wrap(ex)
+
     ##########
     #   Operations (notifications)
     def add_notification_listener(self, l: Union[WorkspaceNotificationListener, WorkspaceNotificationHandler]) -> None:
@@ -610,12 +841,47 @@ def notification_listeners(self) -> list[Union[WorkspaceNotificationListener, Wo
         with self.__notification_listeners_guard:
             return self.__notification_listeners.copy()
 
+    def add_notification_batch_listener(self, l: WorkspaceNotificationBatchListener) -> None:
+        """ Registers the specified listener to be notified once
+            per batch of workspace notifications processed together
+            (instead of once per notification).
+            A given listener can be registered at most once;
+            subsequent attempts to register the same listener
+            again will have no effect.
+
+            IMPORTANT: This method is thread-safe."""
+        assert isinstance(l, Callable) and len(signature(l).parameters) == 1
+
+        with self.__notification_listeners_guard:
+            if l not in self.__notification_batch_listeners:
+                self.__notification_batch_listeners.append(l)
+
+    def remove_notification_batch_listener(self, l: WorkspaceNotificationBatchListener) -> None:
+        """ Un-registers the specified listener to no longer be
+            notified when a batch of workspace notifications is
+            processed.
+            A given listener can be un-registered at most once;
+            subsequent attempts to un-register the same listener
+            again will have no effect.
+
+            IMPORTANT: This method is thread-safe."""
+        assert isinstance(l, Callable) and len(signature(l).parameters) == 1
+
+        with self.__notification_listeners_guard:
+            if l in self.__notification_batch_listeners:
+                self.__notification_batch_listeners.remove(l)
+
+    @property
+    def notification_batch_listeners(self) -> list[WorkspaceNotificationBatchListener]:
+        """ The list of all notification batch listeners registered so far.
+
+            IMPORTANT: This property is thread-safe. """
+        with self.__notification_listeners_guard:
+            return self.__notification_batch_listeners.copy()
+
     def process_notification(self, n: WorkspaceNotification) -> bool:
         """
             Called to process a WorkspaceNotification.
-            IMPORTANT: The hidden notification thread running behind
-            a Workspace will call this method when notifications are
-            enqueued and must then be processed.
 
             IMPORTANT: This method is thread-safe.
 
@@ -625,21 +891,48 @@ def process_notification(self, n: WorkspaceNotification) -> bool:
                 The notification to process.
         """
         assert isinstance(n, WorkspaceNotification)
+        self.process_notification_batch(WorkspaceNotificationBatch(self, [n]))
 
-        for l in self.notification_listeners:
-            try:
-                if isinstance(l, WorkspaceNotificationHandler):
-                    if isinstance(n, BusinessObjectCreatedNotification):
-                        l.on_workspace_object_created(n)
-                    elif isinstance(n, BusinessObjectDestroyedNotification):
-                        l.on_workspace_object_destroyed(n)
-                    elif isinstance(n, BusinessObjectModifiedNotification):
-                        l.on_workspace_object_modified(n)
+    def process_notification_batch(self, batch: WorkspaceNotificationBatch) -> None:
+        """
+            Called to process a WorkspaceNotificationBatch - each
+            notification in it is delivered to all notification
+            listeners, then the batch as a whole is delivered to
+            all notification batch listeners.
+            IMPORTANT: The hidden notification thread running behind
+            a Workspace will call this method when notifications are
+            enqueued and must then be processed.
+
+            IMPORTANT: This method is thread-safe.
+
+            @param batch:
+                The batch of notifications to process.
+        """
+        assert isinstance(batch, WorkspaceNotificationBatch)
+
+        with self.__notification_listeners_guard:
+            listeners = self.__notification_listeners.copy()
+            batch_listeners = self.__notification_batch_listeners.copy()
+        for n in batch:
+            for l in listeners:
+                try:
+                    if isinstance(l, WorkspaceNotificationHandler):
+                        if isinstance(n, BusinessObjectCreatedNotification):
+                            l.on_workspace_object_created(n)
+                        elif isinstance(n, BusinessObjectDestroyedNotification):
+                            l.on_workspace_object_destroyed(n)
+                        elif isinstance(n, BusinessObjectModifiedNotification):
+                            l.on_workspace_object_modified(n)
+                        else:
+                            raise NotImplementedError()
+                        l.on_property_change(n)
                     else:
-                        raise NotImplementedError()
-                    l.on_property_change(n)
-                else:
-                    l(n)
+                        l(n)
+                except Exception as ex:
+                    pass    #   TODO log the exception
+        for l in batch_listeners:
+            try:
+                l(batch)
             except Exception as ex:
                 pass    #   TODO log the exception
 
@@ -649,12 +942,76 @@ def _ensure_open(self) -> None:
         if not self.__db.is_open:
             raise WorkspaceObjectDeadError("Workspace")
 
+    def _get_login_user(self, credentials: Credentials) -> Optional[dbapi.User]:
+        """
+            Returns the (data) User that the specified credentials
+            log in as, None if the login would fail (e.g. because
+            of the wrong password or disabled account/user).
+            Must be called with the workspace lock held.
+        """
+        return self.__resolve_access(credentials)[1]    #   may raise WorkspaceError
+
+    def __live_objects(self, objects: Iterable[BusinessObject]) -> list[BusinessObject]:
+        #   Must be called with the workspace lock held
+        result = []
+        for obj in objects:
+            assert isinstance(obj, BusinessObject)
+            if obj.workspace is not self:
+                raise IncompatibleWorkspaceObjectError(obj.type_name)
+            try:
+                obj._data_object._ensure_live()
+            except dbapi.DatabaseObjectDeadError:
+                continue
+            result.append(obj)
+        return result
+
+    def __resolve_access(self, credentials: Credentials) -> tuple[Capabilities, Optional[dbapi.User]]:
+        #   Holding the guard across the database lookup keeps a
+        #   concurrent invalidation from being overwritten by a stale entry
+        with self.__access_rights_guard:
+            try:
+                if credentials in self.__logins:
+                    data_account = self.__logins[credentials]
+                    cache_hit = True
+                else:
+                    data_account = self.__db.try_login(credentials.login, credentials._Credentials__password)
+                    self.__logins[credentials] = data_account
+                    cache_hit = False
+                if data_account is None:
+                    capabilities = Capabilities.NONE
+                    login_user = None
+                else:
+                    cache_entry = self.__capabilities_by_account_oid.get(data_account.oid, None)
+                    if cache_entry is None:
+                        data_user = data_account.user
+                        if data_account.enabled and data_user.enabled:
+                            capabilities = data_account.capabilities
+                            login_user = data_user
+                        else:
+                            capabilities = Capabilities.NONE
+                            login_user = None
+                        self.__capabilities_by_account_oid[data_account.oid] = (data_user.oid, capabilities, login_user)
+                        cache_hit = False
+                    else:
+                        (_, capabilities, login_user) = cache_entry
+            except Exception as ex:
+                raise WorkspaceError.wrap(ex)
+            if cache_hit:
+                self.__capabilities_cache_hits += 1
+            else:
+                self.__capabilities_cache_misses += 1
+            return (capabilities, login_user)
+
     def _get_business_proxy(self, data_object: dbapi.DatabaseObject) -> BusinessObject:
+        assert isinstance(data_object, dbapi.DatabaseObject)
+        with self.__proxies_guard:
+            return self.__get_business_proxy(data_object)
+
+    def __get_business_proxy(self, data_object: dbapi.DatabaseObject) -> BusinessObject:
         from .BusinessUser import BusinessUser
         from .BusinessAccount import BusinessAccount
         from .BusinessActivityType import BusinessActivityType
 
-        assert isinstance(data_object, dbapi.DatabaseObject)
         business_object = self.__map_data_objects_to_business_objects.get(data_object, None)
         if business_object is None:
             #   Need to create a new business proxy for the data_object
@@ -682,28 +1039,66 @@ def _get_business_proxy(self, data_object: dbapi.DatabaseObject) -> BusinessObje
 
     ##########
     #   Event handlers
-    def __on_database_notification(self, dbn: dbapi.DatabaseNotification) -> None:
-        #TODO kill off print(str(threading.current_thread().ident) + ":" + repr(dbn))
+    def __on_database_notification_batch(self, dbnb: dbapi.DatabaseNotificationBatch) -> None:
         #   This listener is called on the notification thread
         #   internal to the underlying Database. Normally we would
         #   just forward notifications to the Workspace clients; however,
         #   some DB notifications must cause e.g. invalidation of the
         #   Workspace caches, etc.
-        if (isinstance(dbn, dbapi.DatabaseObjectCreatedNotification) or
-            isinstance(dbn, dbapi.DatabaseObjectDestroyedNotification) or
-            isinstance(dbn, dbapi.DatabaseObjectModifiedNotification)):
-            #   If User or Account is affected in any way, we may have
-            #   to recalculate all cached access rights
-            if isinstance(dbn.object, dbapi.User) or isinstance(dbn.object, dbapi.Account):
-                with self.__lock:
-                    self.__access_rights.clear()
+        #   Only cached access rights that depend on the affected
+        #   Users and Accounts need to be recalculated
+        if any(isinstance(dbn.object, (dbapi.User, dbapi.Account)) for dbn in dbnb):
+            with self.__access_rights_guard:
+                self.__invalidate_access_rights(dbnb)
         #   ...and now to the forwarding
-        if isinstance(dbn, dbapi.DatabaseObjectCreatedNotification):
-            n = BusinessObjectCreatedNotification(self, self._get_business_proxy(dbn.object))
-        elif isinstance(dbn, dbapi.DatabaseObjectDestroyedNotification):
-            n = BusinessObjectDestroyedNotification(self, self._get_business_proxy(dbn.object))
-        elif isinstance(dbn, dbapi.DatabaseObjectModifiedNotification):
-            n = BusinessObjectModifiedNotification(self, self._get_business_proxy(dbn.object), dbn.property_name)
-        else:
-            raise NotImplementedError()
-        self.process_notification(n)
+        notifications = []
+        for dbn in dbnb:
+            if isinstance(dbn, dbapi.DatabaseObjectCreatedNotification):
+                n = BusinessObjectCreatedNotification(self, self._get_business_proxy(dbn.object))
+            elif isinstance(dbn, dbapi.DatabaseObjectDestroyedNotification):
+                n = BusinessObjectDestroyedNotification(self, self._get_business_proxy(dbn.object))
+            elif isinstance(dbn, dbapi.DatabaseObjectModifiedNotification):
+                n = BusinessObjectModifiedNotification(self, self._get_business_proxy(dbn.object), dbn.property_name)
+            else:
+                raise NotImplementedError()
+            notifications.append(n)
+        self.process_notification_batch(WorkspaceNotificationBatch(self, notifications))
+
+    def __invalidate_access_rights(self, dbnb: dbapi.DatabaseNotificationBatch) -> None:
+        #   Determine what has changed...
+        affected_account_oids = set()   #   capabilities of these accounts are stale
+        affected_user_oids = set()      #   capabilities of accounts of these users are stale
+        relogin_account_oids = set()    #   credentials that led to these accounts are stale
+        relogin_failed = False          #   credentials that led to no account are stale
+        for dbn in dbnb:
+            if isinstance(dbn.object, dbapi.Account):
+                if isinstance(dbn, dbapi.DatabaseObjectCreatedNotification):
+                    relogin_failed = True
+                elif isinstance(dbn, dbapi.DatabaseObjectDestroyedNotification):
+                    affected_account_oids.add(dbn.object.oid)
+                    relogin_account_oids.add(dbn.object.oid)
+                elif isinstance(dbn, dbapi.DatabaseObjectModifiedNotification):
+                    if dbn.property_name in [dbapi.Account.ENABLED_PROPERTY_NAME,
+                                             dbapi.Account.CAPABILITIES_PROPERTY_NAME]:
+                        affected_account_oids.add(dbn.object.oid)
+                    elif dbn.property_name in [dbapi.Account.LOGIN_PROPERTY_NAME,
+                                               dbapi.Account.PASSWORD_PROPERTY_NAME]:
+                        relogin_account_oids.add(dbn.object.oid)
+                        relogin_failed = True
+            elif isinstance(dbn.object, dbapi.User):
+                if (isinstance(dbn, dbapi.DatabaseObjectDestroyedNotification) or
+                    (isinstance(dbn, dbapi.DatabaseObjectModifiedNotification) and
+                     dbn.property_name == dbapi.User.ENABLED_PROPERTY_NAME)):
+                    affected_user_oids.add(dbn.object.oid)
+        #   ...and drop the cache entries that depend on it
+        if relogin_failed or (len(relogin_account_oids) > 0):
+            for (credentials, data_account) in list(self.__logins.items()):
+                if ((relogin_failed and data_account is None) or
+                    (data_account is not None and data_account.oid in relogin_account_oids)):
+                    del self.__logins[credentials]
+                    self.__capabilities_cache_invalidations += 1
+        if (len(affected_account_oids) > 0) or (len(affected_user_oids) > 0):
+            for (account_oid, (user_oid, _, _)) in list(self.__capabilities_by_account_oid.items()):
+                if (account_oid in affected_account_oids) or (user_oid in affected_user_oids):
+                    del self.__capabilities_by_account_oid[account_oid]
+                    self.__capabilities_cache_invalidations += 1
@@ -2,6 +2,7 @@
 
 ##########
 #   Public entities
+from workspace.implementation.AccessSummary import *
 from workspace.implementation.BusinessAccount import *
 from workspace.implementation.BusinessActivity import *
 from workspace.implementation.BusinessActivityType import *